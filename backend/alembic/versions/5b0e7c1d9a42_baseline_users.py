@@ -0,0 +1,103 @@
+"""baseline users
+
+Revision ID: 5b0e7c1d9a42
+Revises:
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import context, op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b0e7c1d9a42"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Таблица users существовала до появления миграций. На развёрнутой базе
+    # ревизия только проставляется в alembic_version, схема не трогается.
+    if not context.is_offline_mode() and sa.inspect(op.get_bind()).has_table("users"):
+        return
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("email", sa.String(), nullable=False),
+        sa.Column("phone", sa.String(), nullable=True),
+        sa.Column(
+            "role",
+            sa.Enum("CLIENT", "PSYCHOLOGIST", "ADMIN", name="userrole"),
+            nullable=False,
+        ),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("age", sa.Integer(), nullable=True),
+        sa.Column(
+            "gender", sa.Enum("MALE", "FEMALE", name="usergender"), nullable=True
+        ),
+        sa.Column("notifications", sa.Boolean(), nullable=False),
+        sa.Column(
+            "timezone",
+            sa.Enum(
+                "UTC_12_M",
+                "UTC_11_M",
+                "UTC_10_M",
+                "UTC_9_M",
+                "UTC_8_M",
+                "UTC_7_M",
+                "UTC_6_M",
+                "UTC_5_M",
+                "UTC_4_M",
+                "UTC_3_M",
+                "UTC_2_M",
+                "UTC_1_M",
+                "UTC",
+                "UTC_1_P",
+                "UTC_2_P",
+                "UTC_3_P",
+                "UTC_4_P",
+                "UTC_5_P",
+                "UTC_6_P",
+                "UTC_7_P",
+                "UTC_8_P",
+                "UTC_9_P",
+                "UTC_10_P",
+                "UTC_11_P",
+                "UTC_12_P",
+                "UTC_13_P",
+                "UTC_14_P",
+                name="usertimezone",
+            ),
+            nullable=True,
+        ),
+        sa.Column("avatar", sa.String(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.create_index(op.f("ix_users_phone"), "users", ["phone"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_users_phone"), table_name="users")
+    op.drop_index(op.f("ix_users_email"), table_name="users")
+    op.drop_table("users")
+    # Типы ENUM в PostgreSQL не удаляются вместе с таблицами.
+    for name in ("usertimezone", "usergender", "userrole"):
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,123 @@
+"""user profile sections
+
+Revision ID: 8c4e51d2a7f3
+Revises: 9d3b6f0e2c57
+Create Date: 2026-10-18 21:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4e51d2a7f3"
+down_revision: Union[str, Sequence[str], None] = "9d3b6f0e2c57"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("users", sa.Column("first_name", sa.String(length=64), nullable=True))
+    op.add_column("users", sa.Column("last_name", sa.String(length=64), nullable=True))
+    op.add_column(
+        "users", sa.Column("middle_name", sa.String(length=64), nullable=True)
+    )
+    op.add_column("users", sa.Column("position", sa.String(length=100), nullable=True))
+    op.add_column("users", sa.Column("about", sa.Text(), nullable=True))
+    op.add_column(
+        "users",
+        sa.Column(
+            "looking_for_projects", sa.Boolean(), server_default="false", nullable=False
+        ),
+    )
+    op.add_column("users", sa.Column("contact_email", sa.String(), nullable=True))
+    op.create_table(
+        "educations",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("university", sa.String(), nullable=False),
+        sa.Column("specialty", sa.String(), nullable=False),
+        sa.Column(
+            "degree",
+            sa.Enum("BACHELOR", "MASTER", "SPECIALIST", "PHD", name="educationdegree"),
+            nullable=False,
+        ),
+        sa.Column("graduation_year", sa.SmallInteger(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_educations_user_id", "educations", ["user_id"], unique=False)
+    op.create_table(
+        "user_skills",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(length=48), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "name"),
+    )
+    op.create_table(
+        "user_socials",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "platform",
+            sa.Enum(
+                "TELEGRAM", "VK", "GITHUB", "WHATSAPP", "OTHER", name="socialplatform"
+            ),
+            nullable=False,
+        ),
+        sa.Column("username", sa.String(length=64), nullable=False),
+        sa.Column("url", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_user_socials_user_id", "user_socials", ["user_id"], unique=False
+    )
+    op.create_table(
+        "user_tags",
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "tag_id"),
+    )
+    op.create_index("ix_user_tags_tag_id", "user_tags", ["tag_id"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_user_tags_tag_id", table_name="user_tags")
+    op.drop_table("user_tags")
+    op.drop_index("ix_user_socials_user_id", table_name="user_socials")
+    op.drop_table("user_socials")
+    op.drop_table("user_skills")
+    op.drop_index("ix_educations_user_id", table_name="educations")
+    op.drop_table("educations")
+    for column in (
+        "contact_email",
+        "looking_for_projects",
+        "about",
+        "position",
+        "middle_name",
+        "last_name",
+        "first_name",
+    ):
+        op.drop_column("users", column)
+    # Типы ENUM в PostgreSQL не удаляются вместе с таблицами.
+    for name in ("socialplatform", "educationdegree"):
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
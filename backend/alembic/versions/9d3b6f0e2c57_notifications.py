@@ -0,0 +1,90 @@
+"""notifications
+
+Revision ID: 9d3b6f0e2c57
+Revises: c7e2f5a1d803
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9d3b6f0e2c57"
+down_revision: Union[str, Sequence[str], None] = "c7e2f5a1d803"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "notifications",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "type",
+            sa.Enum(
+                "APP_APPROVED",
+                "APP_REJECTED",
+                "APP_RECEIVED",
+                "MEMBER_ADDED",
+                "PROJECT_STATUS",
+                "SYSTEM",
+                name="notificationtype",
+            ),
+            nullable=False,
+        ),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("text", sa.Text(), nullable=True),
+        sa.Column("link_text", sa.String(length=100), nullable=True),
+        sa.Column("link_url", sa.String(), nullable=True),
+        sa.Column("project_id", sa.Uuid(), nullable=True),
+        sa.Column("application_id", sa.Uuid(), nullable=True),
+        sa.Column("is_read", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Страница уведомлений: WHERE user_id = ... ORDER BY created_at DESC, id DESC.
+    op.create_index(
+        "ix_notifications_user_created_at_id",
+        "notifications",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+    # Частичный индекс для пересчёта счётчика непрочитанных.
+    op.create_index(
+        "ix_notifications_user_unread",
+        "notifications",
+        ["user_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("NOT is_read"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_notifications_user_unread",
+        table_name="notifications",
+        postgresql_where=sa.text("NOT is_read"),
+    )
+    op.drop_index("ix_notifications_user_created_at_id", table_name="notifications")
+    op.drop_table("notifications")
+    # Типы ENUM в PostgreSQL не удаляются вместе с таблицами.
+    sa.Enum(name="notificationtype").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,112 @@
+"""projects feed
+
+Revision ID: a41d7e2c6b13
+Revises: 5b0e7c1d9a42
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a41d7e2c6b13"
+down_revision: Union[str, Sequence[str], None] = "5b0e7c1d9a42"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "projects",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("owner_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column(
+            "tags", postgresql.ARRAY(sa.String()), server_default="{}", nullable=False
+        ),
+        sa.Column(
+            "status",
+            sa.Enum("OPEN", "CLOSED", "DRAFT", name="projectstatus"),
+            nullable=False,
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["owner_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    # Ключ ленты: WHERE status = ... ORDER BY created_at DESC, id DESC.
+    op.create_index(
+        "ix_projects_status_created_at_id",
+        "projects",
+        ["status", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_owner_created_at_id",
+        "projects",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_table(
+        "positions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("role", sa.String(length=100), nullable=False),
+        sa.Column(
+            "level",
+            sa.Enum("JUNIOR", "MIDDLE", "SENIOR", name="positionlevel"),
+            nullable=False,
+        ),
+        sa.Column(
+            "tags", postgresql.ARRAY(sa.String()), server_default="{}", nullable=False
+        ),
+        sa.Column("is_open", sa.Boolean(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_positions_project_is_open_created_at",
+        "positions",
+        ["project_id", "is_open", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_positions_project_is_open_created_at", table_name="positions")
+    op.drop_table("positions")
+    op.drop_index("ix_projects_owner_created_at_id", table_name="projects")
+    op.drop_index("ix_projects_status_created_at_id", table_name="projects")
+    op.drop_table("projects")
+    # Типы ENUM в PostgreSQL не удаляются вместе с таблицами.
+    for name in ("positionlevel", "projectstatus"):
+        sa.Enum(name=name).drop(op.get_bind(), checkfirst=True)
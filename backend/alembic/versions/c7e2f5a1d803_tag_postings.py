@@ -0,0 +1,62 @@
+"""tag postings
+
+Revision ID: c7e2f5a1d803
+Revises: 3f1c2a9b7d10
+Create Date: 2026-10-18 12:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e2f5a1d803"
+down_revision: Union[str, Sequence[str], None] = "3f1c2a9b7d10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "tags",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("name"),
+    )
+    # Первичный ключ (tag_id, ...) — это и есть posting list тега, обратный
+    # индекс нужен для замены тегов у конкретного проекта или позиции.
+    op.create_table(
+        "project_tags",
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tag_id", "project_id"),
+    )
+    op.create_index(
+        "ix_project_tags_project_id", "project_tags", ["project_id"], unique=False
+    )
+    op.create_table(
+        "position_tags",
+        sa.Column("tag_id", sa.Integer(), nullable=False),
+        sa.Column("position_id", sa.Uuid(), nullable=False),
+        sa.ForeignKeyConstraint(["position_id"], ["positions.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tag_id"], ["tags.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("tag_id", "position_id"),
+    )
+    op.create_index(
+        "ix_position_tags_position_id", "position_tags", ["position_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_position_tags_position_id", table_name="position_tags")
+    op.drop_table("position_tags")
+    op.drop_index("ix_project_tags_project_id", table_name="project_tags")
+    op.drop_table("project_tags")
+    op.drop_table("tags")
@@ -1,11 +1,23 @@
+import asyncio
+import contextlib
+import os
 from contextlib import asynccontextmanager
 
 import redis.asyncio as redis
 import uvicorn
 from fastapi import FastAPI
 from src.api import router
+from src.api.metrics import router as metrics_router
 from src.config import settings
-from src.core.db.redis_cache import RedisCache, redis_cache, set_cache
+from src.core.auth.token_verifier import access_token_verifier
+from src.core.body_limit import BodySizeLimitMiddleware
+from src.core.db.redis_cache import RedisCache, set_cache
+from src.core.db.serializers import get_serializer
+from src.core.pubsub import PubSubHub, set_hub
+from src.core.response_cache import response_cache
+from src.core.storage import ImmutableStaticFiles
+from src.tasks import shutdown_dispatcher
+from src.utils.avatars import avatar_processor
 from starlette.middleware.cors import CORSMiddleware
 
 
@@ -17,12 +29,25 @@ async def lifespan(app: FastAPI):
         password=settings.REDIS_PASSWORD,
         decode_responses=True,
     )
-    cache = RedisCache(client)
+    cache = RedisCache(client, serializer=get_serializer(settings.CACHE_SERIALIZER))
     set_cache(cache)
+    hub = PubSubHub(client, queue_size=settings.REALTIME_QUEUE_SIZE)
+    set_hub(hub)
+    listeners = [
+        asyncio.create_task(response_cache.listen_invalidations(hub)),
+        asyncio.create_task(access_token_verifier.listen_revocations(hub)),
+    ]
     yield
 
-    if redis_cache:
-        await redis_cache.close()
+    for listener in listeners:
+        listener.cancel()
+    for listener in listeners:
+        with contextlib.suppress(asyncio.CancelledError):
+            await listener
+    await hub.close()
+    await cache.close()
+    shutdown_dispatcher()
+    avatar_processor.shutdown()
 
 
 app = FastAPI(
@@ -40,7 +65,20 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Запас на multipart-заголовки и границы поверх лимита самого файла.
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    limits={"/api/v1/user/avatar": settings.AVATAR_MAX_BYTES + 64 * 1024},
+)
+
 app.include_router(router)
+app.include_router(metrics_router, prefix="/metrics")
+
+if settings.STORAGE_BACKEND == "local":
+    os.makedirs(settings.MEDIA_ROOT, exist_ok=True)
+    app.mount(
+        "/media", ImmutableStaticFiles(directory=settings.MEDIA_ROOT), name="media"
+    )
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,15 +1,32 @@
-from fastapi import APIRouter, Depends
-from src.schemas import AuthResponse, EmptyModel, LoginRequest, VerifyCodeRequest
+from fastapi import APIRouter, Depends, status
+from src.core.dependencies import get_access_payload
+from src.core.rate_limit import (
+    login_email_limiter,
+    login_ip_limiter,
+    verify_ip_limiter,
+)
+from src.schemas import (
+    AuthResponse,
+    EmptyModel,
+    LoginRequest,
+    RefreshRequest,
+    VerifyCodeRequest,
+)
 from src.services.auth import AuthService
 
 router = APIRouter(tags=["Auth"])
 
 
+async def limit_login_email(login_data: LoginRequest) -> None:
+    await login_email_limiter.hit(login_data.email)
+
+
 @router.post(
     "/login",
     summary="Login",
     description="Авторизация и регистрация в приложении соединена в один запрос.",
     response_model=EmptyModel,
+    dependencies=[Depends(login_ip_limiter), Depends(limit_login_email)],
     responses={
         400: {
             "description": "Неверное заполнение полей",
@@ -17,6 +34,14 @@ router = APIRouter(tags=["Auth"])
                 "application/json": {"example": {"detail": "Неверное заполнение полей"}}
             },
         },
+        429: {
+            "description": "Слишком много запросов",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Слишком много запросов, попробуйте позже"}
+                }
+            },
+        },
     },
 )
 async def auth_login(
@@ -31,6 +56,7 @@ async def auth_login(
     "/verify",
     summary="Verify",
     description="Отправка кода и получение токена",
+    dependencies=[Depends(verify_ip_limiter)],
     responses={
         401: {
             "description": "Неверный код",
@@ -46,3 +72,38 @@ async def auth_verify(
         email=login_data.email, code=login_data.code
     )
     return response
+
+
+@router.post(
+    "/refresh",
+    summary="Refresh",
+    description="Обмен refresh-токена на новую пару токенов. "
+    "Использованный refresh-токен больше не действует.",
+    dependencies=[Depends(verify_ip_limiter)],
+    responses={
+        401: {
+            "description": "Невалидный токен",
+            "content": {
+                "application/json": {"example": {"detail": "Невалидный токен"}}
+            },
+        },
+    },
+)
+async def auth_refresh(
+    data: RefreshRequest,
+    auth_service: AuthService = Depends(),
+) -> AuthResponse:
+    return await auth_service.refresh(data.refresh_token)
+
+
+@router.post(
+    "/logout",
+    summary="Logout",
+    description="Отзыв текущего access-токена и его сессии",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def auth_logout(
+    payload: dict = Depends(get_access_payload),
+    auth_service: AuthService = Depends(),
+):
+    await auth_service.logout(payload)
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from src.core.db.pool import render_prometheus
+from src.core.dependencies import require_metrics_token
+
+router = APIRouter(tags=["Metrics"])
+
+
+@router.get(
+    "",
+    summary="Metrics",
+    description="Метрики пулов соединений в формате Prometheus.",
+    response_class=PlainTextResponse,
+    include_in_schema=False,
+    dependencies=[Depends(require_metrics_token)],
+)
+async def metrics() -> str:
+    return render_prometheus()
@@ -1,8 +1,17 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
-from src.core.dependencies import get_current_user
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from src.config import settings
+from src.core.dependencies import get_current_user_id, get_stream_user_id
+from src.core.pubsub import PubSubHub, get_hub
 from src.schemas.notifications import NotificationsPage
+from src.services.notification import (
+    NotificationService,
+    get_notification_count_service,
+    get_notification_read_service,
+)
+from src.services.notification.stream import notification_events
 
 router = APIRouter(tags=["Notifications"])
 
@@ -10,23 +19,61 @@ router = APIRouter(tags=["Notifications"])
 @router.get("", response_model=NotificationsPage)
 async def list_notifications(
     only_unread: bool = False,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=100),
     cursor: str | None = None,
-    user=Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_read_service),
 ):
-    pass
+    return await notification_service.list(
+        user_id, only_unread=only_unread, limit=limit, cursor=cursor
+    )
 
 
 @router.post("/{notification_id}/read", status_code=status.HTTP_204_NO_CONTENT)
-async def mark_read(notification_id: UUID, user=Depends(get_current_user)):
-    pass
+async def mark_read(
+    notification_id: UUID,
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(),
+):
+    await notification_service.mark_read(user_id, notification_id)
 
 
 @router.post("/read-all", status_code=status.HTTP_204_NO_CONTENT)
-async def mark_all_read(user=Depends(get_current_user)):
-    pass
+async def mark_all_read(
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(),
+):
+    await notification_service.mark_all_read(user_id)
 
 
 @router.get("/unread-count", response_model=int)
-async def unread_count(user_id=Depends(get_current_user)):
-    pass
+async def unread_count(
+    user_id: int = Depends(get_current_user_id),
+    notification_service: NotificationService = Depends(get_notification_count_service),
+):
+    return await notification_service.unread_count(user_id)
+
+
+@router.get(
+    "/stream",
+    summary="Notifications stream",
+    description="Server-Sent Events с новыми уведомлениями. "
+    "Токен передаётся в заголовке Authorization или в параметре token.",
+    response_class=StreamingResponse,
+)
+async def stream_notifications(
+    request: Request,
+    user_id: int = Depends(get_stream_user_id),
+    hub: PubSubHub = Depends(get_hub),
+):
+    if hub.connections >= settings.REALTIME_MAX_CONNECTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Слишком много потоковых соединений",
+            headers={"Retry-After": "5"},
+        )
+    return StreamingResponse(
+        notification_events(hub, request, user_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,7 +1,15 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from src.config import settings
 from src.core.dependencies import get_current_user
+from src.core.rate_limit import write_ip_limiter
+from src.core.response_cache import (
+    PROJECT_FEED_TAG,
+    ResponseCache,
+    get_response_cache,
+    project_tag,
+)
 from src.schemas.project import (
     Application,
     ApplicationCreate,
@@ -14,6 +22,11 @@ from src.schemas.project import (
     ProjectStatus,
     ProjectUpdate,
 )
+from src.services.project import (
+    ProjectService,
+    get_project_cache_service,
+    get_project_read_service,
+)
 from starlette import status
 
 router = APIRouter(tags=["Projects"])
@@ -21,57 +34,114 @@ router = APIRouter(tags=["Projects"])
 
 @router.get("", response_model=ProjectsPage)
 async def list_open_projects(
+    request: Request,
     q: str | None = None,
     role_tags: str | None = None,
-    limit: int = 20,
-    offset: str | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    project_service: ProjectService = Depends(get_project_read_service),
+    primary_service: ProjectService = Depends(get_project_cache_service),
+    cache: ResponseCache = Depends(get_response_cache),
 ) -> ProjectsPage:
-    pass
-
-
-@router.get("/{project_id}", response_model=Project)
-async def get_project(project_id: UUID):
-    pass
+    return await cache.serve(
+        request,
+        tags=[PROJECT_FEED_TAG],
+        ttl=settings.PROJECT_FEED_CACHE_TTL,
+        loader=lambda fresh: (primary_service if fresh else project_service).list_open(
+            q=q, role_tags=role_tags, limit=limit, cursor=cursor
+        ),
+    )
 
 
 @router.get("/me/list", response_model=ProjectsPage)
 async def my_projects(
     status: ProjectStatus | None = None,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=100),
     cursor: str | None = None,
     user=Depends(get_current_user),
+    project_service: ProjectService = Depends(get_project_read_service),
 ):
-    pass
+    return await project_service.list_owned(
+        owner_id=user.id, status=status, limit=limit, cursor=cursor
+    )
 
 
-@router.post("", response_model=Project, status_code=status.HTTP_201_CREATED)
-async def create_project(payload: ProjectCreate, user=Depends(get_current_user)):
-    pass
+@router.get("/{project_id}", response_model=Project)
+async def get_project(
+    project_id: UUID,
+    request: Request,
+    project_service: ProjectService = Depends(get_project_read_service),
+    primary_service: ProjectService = Depends(get_project_cache_service),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    return await cache.serve(
+        request,
+        tags=[project_tag(project_id)],
+        ttl=settings.PROJECT_CACHE_TTL,
+        loader=lambda fresh: (primary_service if fresh else project_service).get(
+            project_id
+        ),
+    )
 
 
-@router.patch("/{project_id}", response_model=Project)
+@router.post(
+    "",
+    response_model=Project,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def create_project(
+    payload: ProjectCreate,
+    user=Depends(get_current_user),
+    project_service: ProjectService = Depends(),
+):
+    return await project_service.create(owner=user, payload=payload)
+
+
+@router.patch(
+    "/{project_id}", response_model=Project, dependencies=[Depends(write_ip_limiter)]
+)
 async def update_project(
-    project_id: UUID, payload: ProjectUpdate, user=Depends(get_current_user)
+    project_id: UUID,
+    payload: ProjectUpdate,
+    user=Depends(get_current_user),
+    project_service: ProjectService = Depends(),
 ):
-    pass
+    return await project_service.update(project_id, owner=user, payload=payload)
 
 
-@router.put("/{project_id}/status/{status}", response_model=Project)
+@router.put(
+    "/{project_id}/status/{status}",
+    response_model=Project,
+    dependencies=[Depends(write_ip_limiter)],
+)
 async def set_status(
-    project_id: UUID, status: ProjectStatus, user=Depends(get_current_user)
+    project_id: UUID,
+    status: ProjectStatus,
+    user=Depends(get_current_user),
+    project_service: ProjectService = Depends(),
 ):
-    pass
+    return await project_service.set_status(project_id, owner=user, status=status)
 
 
-@router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_project(project_id: UUID, user=Depends(get_current_user)):
-    pass
+@router.delete(
+    "/{project_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def delete_project(
+    project_id: UUID,
+    user=Depends(get_current_user),
+    project_service: ProjectService = Depends(),
+):
+    await project_service.delete(project_id, owner=user)
 
 
 @router.post(
     "/{project_id}/applications",
     response_model=Application,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(write_ip_limiter)],
 )
 async def submit_application(
     project_id: UUID,
@@ -82,7 +152,9 @@ async def submit_application(
 
 
 @router.post(
-    "/{project_id}/applications/{application_id}/withdraw", response_model=Application
+    "/{project_id}/applications/{application_id}/withdraw",
+    response_model=Application,
+    dependencies=[Depends(write_ip_limiter)],
 )
 async def withdraw_application(
     project_id: UUID, application_id: UUID, user=Depends(get_current_user)
@@ -102,7 +174,9 @@ async def list_applications(
 
 
 @router.post(
-    "/{project_id}/applications/{application_id}/decision", response_model=Application
+    "/{project_id}/applications/{application_id}/decision",
+    response_model=Application,
+    dependencies=[Depends(write_ip_limiter)],
 )
 async def decide_application(
     project_id: UUID,
@@ -1,8 +1,8 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, UploadFile
-from src.core.dependencies import get_current_user
-from src.models import User
+from fastapi import APIRouter, Depends, File, Response, UploadFile
+from src.core.dependencies import get_current_user_id
+from src.core.rate_limit import write_ip_limiter
 from src.schemas.user import (
     ContactsUpdate,
     EducationCreate,
@@ -12,6 +12,7 @@ from src.schemas.user import (
     TagsReplace,
     UserProfileResponse,
 )
+from src.services.user import UserService, get_user_read_service
 from starlette import status
 
 router = APIRouter(tags=["User"])
@@ -32,56 +33,150 @@ router = APIRouter(tags=["User"])
     },
 )
 async def get_profile(
-    current_user: User = Depends(get_current_user),
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(get_user_read_service),
 ):
-    return None
+    return Response(
+        content=await user_service.get_profile_json(user_id),
+        media_type="application/json",
+    )
 
 
-@router.patch("", response_model=UserProfileResponse)
-async def update_core(payload: ProfileCoreUpdate, user=Depends(get_current_user)):
-    pass
+@router.get(
+    "/{user_id}",
+    summary="Get user profile",
+    description=(
+        "Профиль другого пользователя (например, участника команды) "
+        "без контактных данных."
+    ),
+    response_model=UserProfileResponse,
+    dependencies=[Depends(get_current_user_id)],
+    responses={
+        401: {
+            "description": "Токен не валиден",
+            "content": {
+                "application/json": {"example": {"detail": "Токен не валиден"}}
+            },
+        },
+        404: {
+            "description": "Пользователь не найден",
+            "content": {
+                "application/json": {"example": {"detail": "Ресурс не найден"}}
+            },
+        },
+    },
+)
+async def get_user_profile(
+    user_id: int,
+    user_service: UserService = Depends(get_user_read_service),
+):
+    return Response(
+        content=await user_service.get_profile_json(user_id, public=True),
+        media_type="application/json",
+    )
+
+
+@router.patch(
+    "", response_model=UserProfileResponse, dependencies=[Depends(write_ip_limiter)]
+)
+async def update_core(
+    payload: ProfileCoreUpdate,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.update_core(user_id, payload)
 
 
-@router.put("/avatar", response_model=UserProfileResponse, status_code=200)
-async def put_avatar(file: UploadFile = File(...), user=Depends(get_current_user)):
-    pass
+@router.put(
+    "/avatar",
+    response_model=UserProfileResponse,
+    status_code=200,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def put_avatar(
+    file: UploadFile = File(...),
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.put_avatar(user_id, file)
 
 
-@router.put("/contacts", response_model=UserProfileResponse)
-async def put_contacts(payload: ContactsUpdate, user=Depends(get_current_user)):
-    pass
+@router.put(
+    "/contacts",
+    response_model=UserProfileResponse,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def put_contacts(
+    payload: ContactsUpdate,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.put_contacts(user_id, payload)
 
 
-@router.put("/skills", response_model=UserProfileResponse)
-async def put_skills(payload: SkillsReplace, user=Depends(get_current_user)):
-    pass
+@router.put(
+    "/skills",
+    response_model=UserProfileResponse,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def put_skills(
+    payload: SkillsReplace,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.put_skills(user_id, payload)
 
 
-@router.put("/tags", response_model=UserProfileResponse)
-async def put_tags(payload: TagsReplace, user=Depends(get_current_user)):
-    pass
+@router.put(
+    "/tags",
+    response_model=UserProfileResponse,
+    dependencies=[Depends(write_ip_limiter)],
+)
+async def put_tags(
+    payload: TagsReplace,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.put_tags(user_id, payload)
 
 
 @router.post(
     "/education",
     response_model=UserProfileResponse,
     status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(write_ip_limiter)],
 )
-async def add_education(payload: EducationCreate, user=Depends(get_current_user)):
-    pass
+async def add_education(
+    payload: EducationCreate,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.add_education(user_id, payload)
 
 
-@router.patch("/education/{edu_id}", response_model=UserProfileResponse)
+@router.patch(
+    "/education/{edu_id}",
+    response_model=UserProfileResponse,
+    dependencies=[Depends(write_ip_limiter)],
+)
 async def patch_education(
-    edu_id: UUID, payload: EducationUpdate, user=Depends(get_current_user)
+    edu_id: UUID,
+    payload: EducationUpdate,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
 ):
-    pass
+    return await user_service.update_education(user_id, edu_id, payload)
 
 
 @router.delete(
     "/education/{edu_id}",
     response_model=UserProfileResponse,
     status_code=status.HTTP_200_OK,
+    dependencies=[Depends(write_ip_limiter)],
 )
-async def delete_education(edu_id: UUID, user_id=Depends(get_current_user)):
-    pass
+async def delete_education(
+    edu_id: UUID,
+    user_id: int = Depends(get_current_user_id),
+    user_service: UserService = Depends(),
+):
+    return await user_service.delete_education(user_id, edu_id)
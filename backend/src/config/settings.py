@@ -8,13 +8,85 @@ class Settings(BaseSettings):
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
 
+    # Полные URL реплик (postgresql+asyncpg://...), JSON-список в env.
+    DATABASE_REPLICA_URLS: list[str] = []
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 15_000
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+
     REDIS_HOST: str
     REDIS_PORT: int
     REDIS_PASSWORD: str
 
     ACCESS_SECRET_KEY: str
     ALGORITHM: str
-    ACCESS_TOKEN_EXPIRE_DAYS: int
+    REFRESH_SECRET_KEY: str
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
+    REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+
+    REALTIME_MAX_CONNECTIONS: int = 5_000
+    REALTIME_QUEUE_SIZE: int = 100
+    REALTIME_HEARTBEAT_SECONDS: int = 15
+
+    RESPONSE_CACHE_LOCAL_SIZE: int = 5_000
+    RESPONSE_CACHE_LOCAL_TTL: int = 10
+    PROJECT_CACHE_TTL: int = 300
+    PROJECT_FEED_CACHE_TTL: int = 30
+
+    PRINCIPAL_CACHE_LOCAL_SIZE: int = 10_000
+    PRINCIPAL_CACHE_LOCAL_TTL: int = 30
+    PRINCIPAL_CACHE_TTL: int = 300
+
+    CACHE_SERIALIZER: str = "orjson"
+    CACHE_STALE_TTL: int = 60
+    CACHE_LOCK_TTL: int = 10
+
+    CONFIRM_CODE_MAX_ATTEMPTS: int = 5
+    CONFIRM_CODE_LOCKOUT_SECONDS: int = 900
+
+    RATE_LIMIT_LOCAL_SIZE: int = 10_000
+    LOGIN_RATE_LIMIT_PER_IP: int = 10
+    LOGIN_RATE_LIMIT_PER_EMAIL: int = 5
+    VERIFY_RATE_LIMIT_PER_IP: int = 20
+    WRITE_RATE_LIMIT_PER_IP: int = 120
+
+    EMAIL_BACKEND: str = "file"
+    EMAIL_FROM: str = "TeamUp <no-reply@teamup.local>"
+    EMAIL_FILE_DIR: str = "/tmp/teamup-mail"
+    SMTP_HOST: str = ""
+    SMTP_PORT: int = 587
+    SMTP_USERNAME: str = ""
+    SMTP_PASSWORD: str = ""
+    SMTP_USE_TLS: bool = True
+    SMTP_TIMEOUT: float = 10
+
+    CELERY_DISPATCH_THREADS: int = 8
+    CELERY_DISPATCH_MAX_PENDING: int = 1_000
+
+    # Bearer-токен для /metrics; пустое значение отключает эндпоинт.
+    METRICS_TOKEN: str = ""
+
+    TOKEN_CACHE_SIZE: int = 10_000
+    TOKEN_CACHE_TTL: int = 300
+
+    PROFILE_SNAPSHOT_TTL: int = 86_400
+    PROFILE_VERSION_TTL: int = 30 * 86_400
+
+    STORAGE_BACKEND: str = "local"
+    MEDIA_ROOT: str = "/tmp/teamup-media"
+    MEDIA_URL: str = "http://localhost:8000/media"
+    # Не раздаётся наружу: исходники загрузок с EXIF и геотегами.
+    PRIVATE_MEDIA_ROOT: str = "/tmp/teamup-private"
+    AVATAR_MAX_BYTES: int = 5 * 1024 * 1024
+    AVATAR_MAX_PIXELS: int = 40_000_000
+    AVATAR_SIZES: list[int] = [512, 256, 64]
+    AVATAR_PROCESS_WORKERS: int = 2
 
     class Config:
         env_file = ".env"
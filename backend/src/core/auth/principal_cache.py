@@ -0,0 +1,95 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import DateTime, Enum
+from src.config import settings
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.local_cache import LocalTTLCache
+from src.models import User
+
+
+class PrincipalCache:
+    """Двухуровневый кэш аутентифицированных пользователей.
+
+    Первый уровень — LRU в памяти процесса с коротким TTL, второй —
+    Redis, общий для всех воркеров. В кэше лежит снимок колонок User,
+    по которому для каждого запроса собирается новый (не привязанный
+    к сессии) объект User, поэтому зависимость get_current_user не
+    открывает соединение с Postgres при попадании в кэш.
+
+    Инвалидация выполняется UserService после фиксации транзакции,
+    изменившей пользователя. Локальный уровень других воркеров доживает до
+    истечения своего TTL, поэтому он намеренно короткий.
+    """
+
+    PREFIX = "principal"
+
+    def __init__(self, local_maxsize: int, local_ttl: float, redis_ttl: int):
+        self._local = LocalTTLCache(maxsize=local_maxsize, ttl=local_ttl)
+        self._redis_ttl = redis_ttl
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.PREFIX}:{user_id}"
+
+    @staticmethod
+    def _dump(user: User) -> dict[str, Any]:
+        data = {}
+        for column in User.__table__.columns:
+            value = getattr(user, column.key)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            elif isinstance(column.type, Enum) and value is not None:
+                value = value.name
+            data[column.key] = value
+        return data
+
+    @staticmethod
+    def _load(data: dict[str, Any]) -> User:
+        values = {}
+        for column in User.__table__.columns:
+            value = data.get(column.key)
+            if value is not None:
+                if isinstance(column.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif isinstance(column.type, Enum):
+                    value = column.type.enum_class[value]
+            values[column.key] = value
+        return User(**values)
+
+    async def get(self, user_id: int) -> User | None:
+        """Возвращает пользователя из кэша или None при промахе."""
+        key = self._key(user_id)
+        data = self._local.get(key)
+        if data is None:
+            cache = redis_cache_module.redis_cache
+            if cache is None:
+                return None
+            data = await cache.get_value(key)
+            if data is None:
+                return None
+            self._local.set(key, data)
+        return self._load(data)
+
+    async def set(self, user: User) -> None:
+        """Кладёт пользователя в оба уровня кэша."""
+        key = self._key(user.id)
+        data = self._dump(user)
+        self._local.set(key, data)
+        cache = redis_cache_module.redis_cache
+        if cache is not None:
+            await cache.set_value(key, data, ex=self._redis_ttl)
+
+    async def invalidate(self, user_id: int) -> None:
+        """Удаляет пользователя из обоих уровней кэша."""
+        key = self._key(user_id)
+        self._local.delete(key)
+        cache = redis_cache_module.redis_cache
+        if cache is not None:
+            await cache.delete(key)
+
+
+principal_cache = PrincipalCache(
+    local_maxsize=settings.PRINCIPAL_CACHE_LOCAL_SIZE,
+    local_ttl=settings.PRINCIPAL_CACHE_LOCAL_TTL,
+    redis_ttl=settings.PRINCIPAL_CACHE_TTL,
+)
@@ -0,0 +1,86 @@
+from uuid import uuid4
+
+from fastapi import Depends
+from src.config import settings
+from src.core.db.redis_cache import RedisCache, get_cache
+
+# Ротация refresh-токена за один атомарный вызов.
+# Результат: 1 — токен актуален и заменён новым, 0 — сессии нет
+# (отозвана или истекла), -1 — предъявлен уже использованный токен:
+# его могли украсть, поэтому вся сессия удаляется.
+_ROTATE = """
+local current = redis.call('HGET', KEYS[1], 'jti')
+if not current then
+    return 0
+end
+if current ~= ARGV[1] then
+    redis.call('DEL', KEYS[1])
+    return -1
+end
+redis.call('HSET', KEYS[1], 'jti', ARGV[2])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+return 1
+"""
+
+
+class RefreshSessionStore:
+    """Сессии refresh-токенов в Redis.
+
+    Сессия (семейство токенов) создаётся при входе и хранит jti
+    последнего выданного refresh-токена. Каждый refresh выдаёт новый
+    токен той же сессии, а старый перестаёт действовать. Повторное
+    предъявление старого токена считается кражей и отзывает сессию
+    целиком. Отзыв сессии — удаление одного ключа.
+    """
+
+    PREFIX = "refresh_session"
+
+    ROTATED = 1
+    MISSING = 0
+    REUSED = -1
+
+    def __init__(self, cache: RedisCache, ttl: int):
+        self.cache = cache
+        self.ttl = ttl
+        self._rotate = cache.register_script(_ROTATE)
+
+    def _key(self, sid: str) -> str:
+        return f"{self.PREFIX}:{sid}"
+
+    async def create(self, user_id: int) -> tuple[str, str]:
+        """Создать сессию пользователя.
+
+        Returns:
+            tuple[str, str]: ID сессии и jti первого refresh-токена.
+        """
+        sid, jti = uuid4().hex, uuid4().hex
+        async with self.cache.pipeline() as pipe:
+            pipe.hset(self._key(sid), mapping={"user_id": user_id, "jti": jti})
+            pipe.expire(self._key(sid), self.ttl)
+            await pipe.execute()
+        return sid, jti
+
+    async def rotate(self, sid: str, jti: str) -> tuple[int, str]:
+        """Заменить refresh-токен сессии новым.
+
+        Returns:
+            tuple[int, str]: Результат (ROTATED, MISSING или REUSED) и
+                jti нового токена.
+        """
+        new_jti = uuid4().hex
+        result = await self._rotate(
+            keys=[self._key(sid)], args=[jti, new_jti, self.ttl]
+        )
+        return result, new_jti
+
+    async def revoke(self, sid: str) -> None:
+        """Отозвать сессию"""
+        await self.cache.delete(self._key(sid))
+
+
+async def get_refresh_sessions(
+    cache: RedisCache = Depends(get_cache),
+) -> RefreshSessionStore:
+    return RefreshSessionStore(
+        cache, ttl=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
+    )
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import time
+
+from fastapi import HTTPException, status
+from src.config import settings
+from src.core.auth.token import TokenService
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.local_cache import LocalTTLCache
+from src.core.logger import get_logger
+from src.core.pubsub import PubSubHub
+
+logger = get_logger()
+
+
+class AccessTokenVerifier:
+    """Проверка access-токенов с кэшем уже проверенных подписей.
+
+    Токен, прошедший проверку подписи, кладётся в LRU процесса вместе
+    с payload на min(ttl, exp - now) секунд, поэтому повторные запросы
+    с тем же токеном не пересчитывают HMAC и не разбирают JSON.
+
+    Отзыв выполняется по claim jti: идентификатор попадает в denylist
+    в Redis до истечения токена и рассылается через pub/sub, чтобы
+    воркеры сразу перестали принимать токен из своего кэша. Denylist в
+    Redis проверяется один раз при первой проверке токена воркером —
+    так учитываются отзывы, сделанные до его запуска.
+    """
+
+    DENYLIST_PREFIX = "token_denylist"
+    CHANNEL = "token_denylist:revoked"
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._verified = LocalTTLCache(maxsize=maxsize, ttl=ttl)
+        # Отозванный jti достаточно помнить, пока токен может лежать в
+        # _verified; дальше его отсечёт проверка denylist в Redis.
+        self._revoked = LocalTTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def _denylist_key(self, jti: str) -> str:
+        return f"{self.DENYLIST_PREFIX}:{jti}"
+
+    async def verify(self, token: str) -> dict:
+        """Возвращает payload валидного и не отозванного токена.
+
+        Raises:
+            HTTPException: 401, если токен невалиден, истёк или отозван.
+        """
+        key = self._key(token)
+        payload = self._verified.get(key)
+        if payload is None:
+            payload = TokenService.get_token_payload(token)
+            if await self._is_revoked_remote(payload.get("jti")):
+                raise _revoked_exception()
+            ttl = min(self._verified.ttl, payload["exp"] - time.time())
+            if ttl > 0:
+                self._verified.set(key, payload, ttl=ttl)
+        elif self._revoked.get(payload.get("jti")) is not None:
+            self._verified.delete(key)
+            raise _revoked_exception()
+        return payload
+
+    async def _is_revoked_remote(self, jti: str | None) -> bool:
+        if jti is None:
+            return False
+        if self._revoked.get(jti) is not None:
+            return True
+        cache = redis_cache_module.redis_cache
+        return cache is not None and await cache.exists(self._denylist_key(jti))
+
+    async def revoke(self, payload: dict) -> None:
+        """Отзывает токен до истечения его срока действия."""
+        jti = payload.get("jti")
+        ttl = int(payload["exp"] - time.time()) + 1
+        if jti is None or ttl <= 0:
+            return
+        self._revoked.set(jti, True)
+        cache = redis_cache_module.redis_cache
+        if cache is not None:
+            async with cache.pipeline() as pipe:
+                pipe.set(self._denylist_key(jti), "1", ex=ttl)
+                pipe.publish(self.CHANNEL, json.dumps([jti]))
+                await pipe.execute()
+
+    async def listen_revocations(self, hub: PubSubHub) -> None:
+        """Помечает отозванными jti, полученные от других воркеров."""
+        async with hub.subscribe(self.CHANNEL) as subscription:
+            while True:
+                message = await subscription.queue.get()
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    self._verified.clear()
+                try:
+                    jtis = json.loads(message)
+                except ValueError:
+                    logger.warning("bad token revocation", message=message)
+                    continue
+                for jti in jtis:
+                    self._revoked.set(jti, True)
+
+
+def _revoked_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={
+            "detail": "Authentication failed.",
+            "message": "Token has been revoked",
+        },
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+access_token_verifier = AccessTokenVerifier(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.TOKEN_CACHE_TTL,
+)
@@ -0,0 +1,55 @@
+from src.core.exceptions import PayloadTooLargeException
+from starlette import status
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    """Ограничение размера тела запроса для указанных путей.
+
+    Запрос с заведомо большим Content-Length отклоняется сразу, а при
+    chunked-загрузке счётчик байт проверяется на каждом куске, поэтому
+    лимит срабатывает во время загрузки, а не после того, как
+    multipart-парсер сохранит весь файл.
+    """
+
+    def __init__(self, app: ASGIApp, limits: dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and not content_length.isdigit():
+            response = JSONResponse(
+                {"detail": "Invalid Content-Length header"},
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+            await response(scope, receive, send)
+            return
+        if content_length is not None and int(content_length) > limit:
+            response = JSONResponse(
+                {"detail": PayloadTooLargeException.detail},
+                status_code=PayloadTooLargeException.status_code,
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # FastAPI пробрасывает HTTPException из разбора тела
+                    # как есть, поэтому клиент получит 413, а не 400.
+                    raise PayloadTooLargeException
+            return message
+
+        await self.app(scope, limited_receive, send)
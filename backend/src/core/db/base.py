@@ -1,10 +1,13 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Mapping, Optional
+
+from src.core.db.serializers import JsonSerializer, Serializer
 
 
 class CacheWorker(ABC):
-    def __init__(self, client: Any, **kwargs):
+    def __init__(self, client: Any, serializer: Optional[Serializer] = None, **kwargs):
         self.client = client
+        self.serializer = serializer or JsonSerializer()
         self.extra_args = kwargs
 
     @abstractmethod
@@ -15,5 +18,55 @@ class CacheWorker(ABC):
     async def set(self, key: str, value, *args, **kwargs):
         pass
 
+    @abstractmethod
+    async def delete(self, *keys: str) -> int:
+        pass
+
+    @abstractmethod
+    async def mget(self, keys: list[str]) -> list:
+        pass
+
+    @abstractmethod
+    async def mset(self, mapping: Mapping[str, Any], ex: int = None) -> None:
+        pass
+
+    @abstractmethod
+    async def getdel(self, key: str):
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str, amount: int = 1, ex: int = None) -> int:
+        pass
+
+    @abstractmethod
+    async def decr(self, key: str, amount: int = 1, ex: int = None) -> int:
+        pass
+
+    @abstractmethod
+    def pipeline(self, transaction: bool = False):
+        pass
+
+    async def get_value(self, key: str) -> Any:
+        """Прочитать значение, сохранённое через set_value"""
+        raw = await self.get(key)
+        return None if raw is None else self.serializer.loads(raw)
+
+    async def set_value(self, key: str, value: Any, ex: int = None) -> None:
+        """Сохранить произвольное значение через сериализатор"""
+        await self.set(key, self.serializer.dumps(value), ex=ex)
+
+    async def mget_values(self, keys: list[str]) -> list[Any]:
+        """Прочитать несколько значений за один запрос"""
+        return [
+            None if raw is None else self.serializer.loads(raw)
+            for raw in await self.mget(keys)
+        ]
+
+    async def mset_values(self, mapping: Mapping[str, Any], ex: int = None) -> None:
+        """Сохранить несколько значений за один запрос"""
+        await self.mset(
+            {k: self.serializer.dumps(v) for k, v in mapping.items()}, ex=ex
+        )
+
     async def close(self):
         self.client.close()
@@ -1,25 +1,64 @@
+import itertools
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from src.config import settings
+from src.core.db.pool import InstrumentedAsyncQueuePool
+from src.core.db.routing import read_your_writes
 
 DATABASE_URL = settings.DATABASE_URL
 
-engine = create_async_engine(
-    DATABASE_URL,
-)
 
-async_session_maker = sessionmaker(
-    bind=engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
+def create_engine(url: str, name: str) -> AsyncEngine:
+    """Создаёт движок с настройками пула из Settings.
+
+    Args:
+        url (str): URL базы данных.
+        name (str): Имя пула в метриках.
+    """
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args={
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "server_settings": {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+            },
+        },
+    )
+
+
+def create_session_maker(bind: AsyncEngine) -> sessionmaker:
+    return sessionmaker(
+        bind=bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+engine = create_engine(DATABASE_URL, "primary")
+async_session_maker = create_session_maker(engine)
+
+replica_engines = [
+    create_engine(url, f"replica_{i}")
+    for i, url in enumerate(settings.DATABASE_REPLICA_URLS)
+]
+_replica_session_makers = itertools.cycle(
+    [create_session_maker(e) for e in replica_engines] or [async_session_maker]
 )
 
 
-async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_async_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
             yield session
@@ -27,3 +66,37 @@ async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+    await read_your_writes.mark_write(request)
+
+
+async def get_async_primary_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """Сессия только для чтения на primary.
+
+    Для загрузки значений, которые кэшируются сразу после записи:
+    отстающая реплика вернула бы строку до изменения, и она попала бы
+    в кэш на весь его TTL. Сессия не отмечает клиента как писавшего.
+    """
+    async with async_session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Сессия только для чтения: реплика по round-robin или primary.
+
+    Запрос уходит на primary, если реплики не настроены или клиент
+    недавно писал (окно read-your-writes). Транзакция всегда
+    откатывается, так как изменений в ней быть не должно.
+    """
+    if replica_engines and not await read_your_writes.is_sticky(request):
+        session_maker = next(_replica_session_makers)
+    else:
+        session_maker = async_session_maker
+
+    async with session_maker() as session:
+        try:
+            yield session
+        finally:
+            await session.rollback()
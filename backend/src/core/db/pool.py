@@ -0,0 +1,110 @@
+import bisect
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# Границы корзин гистограммы ожидания соединения, в секундах.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+
+class PoolMetrics:
+    """Метрики одного пула соединений.
+
+    Счётчики и гистограмма накапливаются в InstrumentedAsyncQueuePool,
+    а мгновенные значения (занятые соединения, overflow) читаются из
+    самого пула в момент выгрузки метрик.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool: AsyncAdaptedQueuePool | None = None
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_sum = 0.0
+        self.wait_buckets = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def observe_wait(self, seconds: float) -> None:
+        self.checkouts += 1
+        self.wait_sum += seconds
+        self.wait_buckets[bisect.bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        return {
+            "size": pool.size() if pool else 0,
+            "checked_out": pool.checkedout() if pool else 0,
+            "overflow": max(pool.overflow(), 0) if pool else 0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_sum": self.wait_sum,
+            "wait_buckets": list(self.wait_buckets),
+        }
+
+
+_registry: dict[str, PoolMetrics] = {}
+
+
+def get_pool_metrics(name: str) -> PoolMetrics:
+    """Возвращает (создаёт при необходимости) метрики пула по имени."""
+    if name not in _registry:
+        _registry[name] = PoolMetrics(name)
+    return _registry[name]
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool, измеряющий время ожидания соединения.
+
+    Имя метрик берётся из pool_logging_name движка, поэтому оно
+    переживает пересоздание пула при engine.dispose().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics = get_pool_metrics(self.logging_name or "default")
+        self._metrics.pool = self
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except PoolTimeoutError:
+            self._metrics.timeouts += 1
+            raise
+        self._metrics.observe_wait(time.perf_counter() - start)
+        return conn
+
+
+def render_prometheus() -> str:
+    """Выгружает метрики всех пулов в текстовом формате Prometheus."""
+    lines = [
+        "# HELP db_pool_size Configured pool size.",
+        "# TYPE db_pool_size gauge",
+        "# HELP db_pool_checked_out Connections currently checked out.",
+        "# TYPE db_pool_checked_out gauge",
+        "# HELP db_pool_overflow Connections open above pool_size.",
+        "# TYPE db_pool_overflow gauge",
+        "# HELP db_pool_timeouts_total Checkouts that hit pool_timeout.",
+        "# TYPE db_pool_timeouts_total counter",
+        "# HELP db_pool_wait_seconds Time spent waiting for a connection.",
+        "# TYPE db_pool_wait_seconds histogram",
+    ]
+    for name, metrics in sorted(_registry.items()):
+        snap = metrics.snapshot()
+        label = f'pool="{name}"'
+        lines.append(f"db_pool_size{{{label}}} {snap['size']}")
+        lines.append(f"db_pool_checked_out{{{label}}} {snap['checked_out']}")
+        lines.append(f"db_pool_overflow{{{label}}} {snap['overflow']}")
+        lines.append(f"db_pool_timeouts_total{{{label}}} {snap['timeouts']}")
+        cumulative = 0
+        for bound, count in zip(WAIT_BUCKETS, snap["wait_buckets"]):
+            cumulative += count
+            lines.append(
+                f'db_pool_wait_seconds_bucket{{{label},le="{bound}"}} {cumulative}'
+            )
+        lines.append(
+            f'db_pool_wait_seconds_bucket{{{label},le="+Inf"}} {snap["checkouts"]}'
+        )
+        lines.append(f"db_pool_wait_seconds_sum{{{label}}} {snap['wait_sum']}")
+        lines.append(f"db_pool_wait_seconds_count{{{label}}} {snap['checkouts']}")
+    return "\n".join(lines) + "\n"
@@ -1,19 +1,85 @@
-from typing import Optional
+from typing import Any, Mapping, Optional
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from src.core.db.base import CacheWorker
+from src.core.db.serializers import Serializer
 
 
 class RedisCache(CacheWorker):
-    def __init__(self, client: redis.Redis):
-        super().__init__(client)
+    def __init__(self, client: redis.Redis, serializer: Optional[Serializer] = None):
+        super().__init__(client, serializer=serializer)
         self.redis = client
 
     async def get(self, key: str, *args, **kwargs) -> Optional[str]:
         return await self.redis.get(key)
 
-    async def set(self, key: str, value: str, ex: int = None, *args, **kwargs):
-        await self.redis.set(key, value, ex=ex)
+    async def set(
+        self, key: str, value: str, ex: int = None, nx: bool = False, *args, **kwargs
+    ) -> bool:
+        return bool(await self.redis.set(key, value, ex=ex, nx=nx))
+
+    async def delete(self, *keys: str) -> int:
+        if not keys:
+            return 0
+        return await self.redis.delete(*keys)
+
+    async def exists(self, key: str) -> bool:
+        return bool(await self.redis.exists(key))
+
+    async def mget(self, keys: list[str]) -> list[Optional[str]]:
+        if not keys:
+            return []
+        return await self.redis.mget(keys)
+
+    async def mset(self, mapping: Mapping[str, Any], ex: int = None) -> None:
+        """Записать несколько ключей за один запрос.
+
+        MSET не умеет TTL, поэтому с ex команды SET отправляются
+        одним pipeline.
+        """
+        if not mapping:
+            return
+        if ex is None:
+            await self.redis.mset(mapping)
+            return
+        async with self.pipeline() as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ex)
+            await pipe.execute()
+
+    async def getdel(self, key: str) -> Optional[str]:
+        """Атомарно прочитать и удалить ключ (GETDEL)"""
+        return await self.redis.getdel(key)
+
+    async def incr(self, key: str, amount: int = 1, ex: int = None) -> int:
+        """Увеличить счётчик; TTL ставится только при создании ключа"""
+        if ex is None:
+            return await self.redis.incrby(key, amount)
+        async with self.pipeline() as pipe:
+            pipe.incrby(key, amount)
+            pipe.expire(key, ex, nx=True)
+            value, _ = await pipe.execute()
+        return value
+
+    async def decr(self, key: str, amount: int = 1, ex: int = None) -> int:
+        """Уменьшить счётчик; TTL ставится только при создании ключа"""
+        return await self.incr(key, -amount, ex=ex)
+
+    def pipeline(self, transaction: bool = False) -> redis.client.Pipeline:
+        """Pipeline для нескольких команд за один сетевой запрос.
+
+        Используется как async context manager:
+        async with cache.pipeline() as pipe: ...; await pipe.execute()
+        """
+        return self.redis.pipeline(transaction=transaction)
+
+    def register_script(self, script: str) -> AsyncScript:
+        """Lua-скрипт, вызываемый через EVALSHA (текст не пересылается)"""
+        return self.redis.register_script(script)
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self.redis.publish(channel, message)
 
     async def close(self):
         await self.redis.aclose()
@@ -0,0 +1,56 @@
+import hashlib
+
+from fastapi import Request
+from src.config import settings
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.local_cache import LocalTTLCache
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesTracker:
+    """Окно "read-your-writes" для маршрутизации чтений на реплики.
+
+    После успешного пишущего запроса клиент на READ_YOUR_WRITES_SECONDS
+    закрепляется за primary, чтобы не увидеть устаревшие данные из-за
+    лага репликации. Клиент определяется по хэшу заголовка
+    Authorization, поэтому токен не декодируется; анонимные запросы
+    не закрепляются. Отметка хранится локально и в Redis, чтобы
+    следующий запрос, попавший на другой воркер, тоже её увидел.
+    """
+
+    PREFIX = "rw_sticky"
+
+    def __init__(self, window: int):
+        self.window = window
+        self._local = LocalTTLCache(maxsize=10_000, ttl=window)
+
+    def _key(self, request: Request) -> str | None:
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        digest = hashlib.blake2b(authorization.encode(), digest_size=16).hexdigest()
+        return f"{self.PREFIX}:{digest}"
+
+    async def mark_write(self, request: Request) -> None:
+        """Открывает окно после пишущего запроса."""
+        key = self._key(request)
+        if key is None or request.method in SAFE_METHODS:
+            return
+        self._local.set(key, True)
+        cache = redis_cache_module.redis_cache
+        if cache is not None:
+            await cache.set(key, "1", ex=self.window)
+
+    async def is_sticky(self, request: Request) -> bool:
+        """Проверяет, должен ли клиент сейчас читать с primary."""
+        key = self._key(request)
+        if key is None:
+            return False
+        if self._local.get(key):
+            return True
+        cache = redis_cache_module.redis_cache
+        return cache is not None and await cache.get(key) is not None
+
+
+read_your_writes = ReadYourWritesTracker(window=settings.READ_YOUR_WRITES_SECONDS)
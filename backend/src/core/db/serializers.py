@@ -0,0 +1,55 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class Serializer(ABC):
+    """Сериализация нестроковых значений кэша."""
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str | bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, raw: str | bytes) -> Any:
+        pass
+
+
+class JsonSerializer(Serializer):
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, separators=(",", ":"), default=str)
+
+    def loads(self, raw: str | bytes) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonSerializer(Serializer):
+    """JSON через orjson: в разы быстрее stdlib json на dict/list.
+
+    Нативно сериализует datetime, UUID, enum и dataclass.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, value: Any) -> str:
+        return self._orjson.dumps(value, default=str).decode()
+
+    def loads(self, raw: str | bytes) -> Any:
+        return self._orjson.loads(raw)
+
+
+SERIALIZERS: dict[str, type[Serializer]] = {
+    "json": JsonSerializer,
+    "orjson": OrjsonSerializer,
+}
+
+
+def get_serializer(name: str) -> Serializer:
+    """Возвращает сериализатор по имени из настроек (json, orjson)."""
+    try:
+        return SERIALIZERS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer: {name}")
@@ -0,0 +1,161 @@
+import asyncio
+import secrets
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.config import settings
+from src.core.db.redis_cache import RedisCache
+
+# Снимает блокировку, только если она всё ещё принадлежит вызывающему:
+# истёкшую и перехваченную другим воркером блокировку трогать нельзя.
+_RELEASE_LOCK = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+_LOCKED = object()
+
+
+class SingleFlight:
+    """Защита от cache stampede для значений в Redis.
+
+    Значение хранится в конверте с мягким сроком свежести fresh_until;
+    сам ключ живёт дольше на stale_ttl секунд. Пока запись свежая, она
+    просто возвращается. Устаревшую запись обновляет только тот
+    вызывающий, кто захватил блокировку в Redis, а остальные в это
+    время получают устаревшее значение. При полном промахе загрузку
+    тоже выполняет только владелец блокировки, остальные воркеры ждут,
+    пока значение появится в кэше.
+
+    Обновление выполняется в самом запросе, а не в фоновой задаче:
+    loader обычно использует сессию БД запроса, которая закрывается
+    вместе с ним.
+
+    Внутри процесса одновременные загрузки одного ключа схлопываются в
+    одну корутину, поэтому за блокировку в Redis конкурирует не более
+    одного запроса на воркер. Полный промах и обновление устаревшей
+    записи схлопываются раздельно: обновление может вернуть «занято»,
+    а полному промаху нужно значение.
+    """
+
+    LOCK_PREFIX = "lock"
+
+    def __init__(self, lock_ttl: int, poll_interval: float = 0.05):
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self._inflight: dict[tuple[str, bool], asyncio.Future] = {}
+        # Скрипт снятия блокировки регистрируется один раз на клиент,
+        # а не при каждом освобождении.
+        self._release_scripts = {}
+
+    async def get_or_load(
+        self,
+        cache: RedisCache,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        ttl: int,
+        stale_ttl: int = 0,
+    ) -> Any:
+        """Возвращает значение из кэша или загружает его через loader.
+
+        Args:
+            cache (RedisCache): Кэш, в котором хранится значение.
+            key (str): Ключ значения.
+            loader: Корутина, вычисляющая значение; результат должен
+                сериализоваться сериализатором кэша.
+            ttl (int): Сколько секунд значение считается свежим.
+            stale_ttl (int): Сколько секунд после этого устаревшее
+                значение ещё можно отдавать, пока идёт обновление.
+
+        Returns:
+            Any: Значение из кэша или результат loader.
+        """
+        envelope = await cache.get_value(key)
+        if envelope is not None:
+            if envelope["fresh_until"] > time.time() or (key, False) in self._inflight:
+                return envelope["value"]
+            value = await self._coalesce(
+                key,
+                False,
+                lambda: self._load(cache, key, loader, ttl, stale_ttl, wait=False),
+            )
+            return envelope["value"] if value is _LOCKED else value
+        return await self._coalesce(
+            key,
+            True,
+            lambda: self._load(cache, key, loader, ttl, stale_ttl, wait=True),
+        )
+
+    async def _coalesce(
+        self, key: str, wait: bool, factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        flight = (key, wait)
+        future = self._inflight.get(flight)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[flight] = future
+            future.add_done_callback(lambda f: self._forget(flight, f))
+        # shield: отмена одного ожидающего не должна отменять загрузку
+        # для остальных.
+        return await asyncio.shield(future)
+
+    def _release_script(self, cache: RedisCache):
+        script = self._release_scripts.get(id(cache))
+        if script is None:
+            script = self._release_scripts[id(cache)] = cache.register_script(
+                _RELEASE_LOCK
+            )
+        return script
+
+    def _forget(self, flight: tuple[str, bool], future: asyncio.Future) -> None:
+        if self._inflight.get(flight) is future:
+            del self._inflight[flight]
+
+    async def _load(
+        self,
+        cache: RedisCache,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int,
+        stale_ttl: int,
+        wait: bool,
+    ) -> Any:
+        lock_key = f"{self.LOCK_PREFIX}:{key}"
+        token = secrets.token_hex(8)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.lock_ttl
+        while True:
+            if await cache.set(lock_key, token, ex=self.lock_ttl, nx=True):
+                try:
+                    value = await loader()
+                    envelope = {"value": value, "fresh_until": time.time() + ttl}
+                    await cache.set_value(key, envelope, ex=ttl + stale_ttl)
+                    return value
+                finally:
+                    await self._release_script(cache)(keys=[lock_key], args=[token])
+
+            if not wait:
+                # Устаревшее значение уже обновляет другой воркер.
+                return _LOCKED
+
+            while loop.time() < deadline:
+                await asyncio.sleep(self.poll_interval)
+                envelope = await cache.get_value(key)
+                if envelope is not None:
+                    return envelope["value"]
+                if not await cache.exists(lock_key):
+                    # Владелец снял блокировку, не записав значение
+                    # (ошибка loader): пробуем загрузить сами.
+                    break
+            else:
+                # Владелец блокировки не уложился в её TTL: считаем сами,
+                # не записывая результат, чтобы не затереть его более
+                # свежее значение.
+                return await loader()
+
+
+single_flight = SingleFlight(lock_ttl=settings.CACHE_LOCK_TTL)
@@ -1,10 +1,18 @@
+import secrets
 from typing import Literal
 
 from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.core.auth import TokenService
-from src.core.db.database import get_async_db
+from src.config import settings
+from src.core.auth.principal_cache import principal_cache
+from src.core.auth.token_verifier import access_token_verifier
+from src.core.db.database import (
+    get_async_db,
+    get_async_primary_read_db,
+    get_async_read_db,
+)
+from src.core.exceptions import NotFoundException
 from src.crud import Store
 from src.models import User
 
@@ -15,6 +23,18 @@ def get_store(session: AsyncSession = Depends(get_async_db)) -> Store:
     return Store(session=session)
 
 
+def get_read_store(session: AsyncSession = Depends(get_async_read_db)) -> Store:
+    """Store поверх сессии только для чтения (реплика, если доступна)."""
+    return Store(session=session)
+
+
+def get_primary_read_store(
+    session: AsyncSession = Depends(get_async_primary_read_db),
+) -> Store:
+    """Store только для чтения поверх primary (загрузка кэшируемых данных)."""
+    return Store(session=session)
+
+
 async def check_token_dependency(
     token_type: Literal["CLIENT"] = Query(...),
     credentials=Depends(bearer_scheme),
@@ -34,6 +54,78 @@ async def get_current_user(
     )
 
 
+def _unauthorized(message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail={"detail": "Authentication failed.", "message": message},
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def _verify_client_token(token: str) -> dict:
+    payload = await access_token_verifier.verify(token)
+    if payload.get("type") != "CLIENT" or not payload.get("sub"):
+        raise _unauthorized("Could not validate credentials")
+    return payload
+
+
+async def get_access_payload(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> dict:
+    """Проверенные claims access-токена без загрузки пользователя."""
+    if credentials is None or credentials.scheme.lower() != "bearer":
+        raise _unauthorized("Not authenticated.")
+    return await _verify_client_token(credentials.credentials)
+
+
+async def require_metrics_token(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> None:
+    """Доступ к служебным метрикам только по METRICS_TOKEN.
+
+    Без настроенного токена эндпоинт не существует (404), чтобы метрики
+    пулов не раздавались наружу по умолчанию.
+    """
+    if not settings.METRICS_TOKEN:
+        raise NotFoundException()
+    if credentials is None or credentials.scheme.lower() != "bearer":
+        raise _unauthorized("Not authenticated.")
+    if not secrets.compare_digest(
+        credentials.credentials.encode(), settings.METRICS_TOKEN.encode()
+    ):
+        raise _unauthorized("Could not validate credentials")
+
+
+async def get_current_user_id(payload: dict = Depends(get_access_payload)) -> int:
+    """ID пользователя из подписанных claims токена.
+
+    Для эндпоинтов, которым нужен только идентификатор: не обращается
+    ни к кэшу пользователей, ни к Postgres. Удалённый или изменённый
+    пользователь продолжает проходить эту проверку до отзыва или
+    истечения токена.
+    """
+    return int(payload["sub"])
+
+
+async def get_stream_user_id(
+    token: str | None = Query(None),
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> int:
+    """ID пользователя для потоковых эндпоинтов.
+
+    EventSource и WebSocket в браузере не умеют передавать заголовки,
+    поэтому токен принимается и из query-параметра token. Пользователь
+    не загружается из БД: достаточно проверенных подписью claims,
+    а соединение живёт дольше одного запроса.
+    """
+    if credentials is not None and credentials.scheme.lower() == "bearer":
+        token = credentials.credentials
+    if not token:
+        raise _unauthorized("Not authenticated.")
+    payload = await _verify_client_token(token)
+    return int(payload["sub"])
+
+
 async def check_token(
     token_type: Literal["CLIENT"],
     credentials: HTTPAuthorizationCredentials,
@@ -77,7 +169,7 @@ async def _get_current_entity(
     )
 
     try:
-        payload = TokenService.get_token_payload(token)
+        payload = await access_token_verifier.verify(token)
 
         if payload.get("type") != expected_type:
             raise credentials_exception
@@ -86,11 +178,14 @@ async def _get_current_entity(
         if not identity_value:
             raise credentials_exception
 
-        user = await store.user.find_one_or_none(
-            id=int(identity_value), role=payload.get("type")
-        )
+        user_id = int(identity_value)
+        user = await principal_cache.get(user_id)
+        if user is None:
+            user = await store.user.find_one_or_none(id=user_id)
+            if user:
+                await principal_cache.set(user)
 
-        if not user:
+        if not user or user.role.value != payload.get("type"):
             raise credentials_exception
 
         return user
@@ -140,3 +140,61 @@ class InvalidTokenException(BaseError):
 
     status_code = status.HTTP_401_UNAUTHORIZED
     detail = "Невалидный токен"
+
+
+class InvalidCursorException(BaseError):
+    """Исключение при некорректном курсоре пагинации.
+
+    Возникает, когда клиент передаёт повреждённый или чужой курсор.
+    """
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Некорректный курсор пагинации"
+
+
+class ForbiddenException(BaseError):
+    """Исключение при отсутствии прав на ресурс.
+
+    Возникает, когда пользователь пытается изменить чужой ресурс.
+    """
+
+    status_code = status.HTTP_403_FORBIDDEN
+    detail = "Недостаточно прав"
+
+
+class RateLimitException(BaseError):
+    """Исключение при превышении лимита запросов.
+
+    Возникает, когда клиент отправляет запросы чаще, чем разрешено
+    ограничителем. Заголовок Retry-After сообщает, через сколько секунд
+    можно повторить запрос.
+    """
+
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    detail = "Слишком много запросов, попробуйте позже"
+
+    def __init__(self, retry_after: int, detail: str | None = None):
+        super().__init__(detail)
+        self.headers = {"Retry-After": str(retry_after)}
+
+
+class PayloadTooLargeException(BaseError):
+    """Исключение при превышении размера тела запроса.
+
+    Возникает, как только загружаемые данные превышают лимит, не
+    дожидаясь окончания загрузки.
+    """
+
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    detail = "Файл слишком большой"
+
+
+class InvalidImageException(BaseError):
+    """Исключение при загрузке некорректного изображения.
+
+    Возникает, если файл не удаётся распознать как поддерживаемое
+    изображение или его разрешение превышает допустимое.
+    """
+
+    status_code = status.HTTP_400_BAD_REQUEST
+    detail = "Некорректное изображение"
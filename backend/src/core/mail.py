@@ -0,0 +1,161 @@
+import smtplib
+import ssl
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from pathlib import Path
+from uuid import uuid4
+
+from src.config import settings
+
+
+class MailRejectedError(Exception):
+    """Сервер окончательно отклонил письмо (5xx): повтор не поможет."""
+
+
+class MailDeferredError(Exception):
+    """Сервер временно не принял письмо (4xx): его стоит отправить позже."""
+
+
+class MailSender(ABC):
+    """Отправитель писем.
+
+    Используется как контекстный менеджер: соединение открывается один
+    раз на пачку писем и закрывается при выходе.
+    """
+
+    def __enter__(self) -> "MailSender":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        pass
+
+    @abstractmethod
+    def send(self, message: EmailMessage) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class SmtpSender(MailSender):
+    """Отправка через SMTP с одним соединением на пачку писем.
+
+    Если сервер закрыл соединение между письмами (тайм-аут простоя),
+    оно переоткрывается и письмо отправляется повторно один раз.
+    Отказы по конкретному письму переводятся в MailRejectedError или
+    MailDeferredError, остальные ошибки означают проблему с сервером
+    и касаются всей пачки.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        use_tls: bool,
+        timeout: float,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.timeout = timeout
+        self._smtp: smtplib.SMTP | None = None
+
+    def open(self) -> None:
+        self._smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        if self.use_tls:
+            self._smtp.starttls(context=ssl.create_default_context())
+        if self.username:
+            self._smtp.login(self.username, self.password)
+
+    def send(self, message: EmailMessage) -> None:
+        try:
+            self._send(message)
+        except smtplib.SMTPRecipientsRefused as exc:
+            if all(code >= 500 for code, _ in exc.recipients.values()):
+                raise MailRejectedError(str(exc.recipients)) from exc
+            raise MailDeferredError(str(exc.recipients)) from exc
+        except smtplib.SMTPDataError as exc:
+            if exc.smtp_code >= 500:
+                raise MailRejectedError(exc.smtp_error) from exc
+            raise MailDeferredError(exc.smtp_error) from exc
+
+    def _send(self, message: EmailMessage) -> None:
+        if self._smtp is None:
+            self.open()
+        try:
+            self._smtp.send_message(message)
+        except smtplib.SMTPServerDisconnected:
+            self.open()
+            self._smtp.send_message(message)
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            self._smtp.close()
+        self._smtp = None
+
+
+class FileSender(MailSender):
+    """Сохраняет письма в .eml файлы каталога (локальная разработка)."""
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+
+    def open(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def send(self, message: EmailMessage) -> None:
+        (self.directory / f"{uuid4().hex}.eml").write_bytes(message.as_bytes())
+
+
+class MemorySender(MailSender):
+    """Складывает письма в список outbox (для отладки и проверок)."""
+
+    def __init__(self):
+        self.outbox: list[EmailMessage] = []
+
+    def send(self, message: EmailMessage) -> None:
+        self.outbox.append(message)
+
+
+def get_mail_sender() -> MailSender:
+    """Возвращает отправителя по настройке EMAIL_BACKEND (smtp, file, memory)."""
+    if settings.EMAIL_BACKEND == "smtp":
+        return SmtpSender(
+            host=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            username=settings.SMTP_USERNAME,
+            password=settings.SMTP_PASSWORD,
+            use_tls=settings.SMTP_USE_TLS,
+            timeout=settings.SMTP_TIMEOUT,
+        )
+    if settings.EMAIL_BACKEND == "file":
+        return FileSender(settings.EMAIL_FILE_DIR)
+    if settings.EMAIL_BACKEND == "memory":
+        return MemorySender()
+    raise ValueError(f"Unknown email backend: {settings.EMAIL_BACKEND}")
+
+
+def build_code_message(email: str, code: str) -> EmailMessage:
+    """Письмо с кодом подтверждения входа."""
+    message = EmailMessage()
+    message["From"] = settings.EMAIL_FROM
+    message["To"] = email
+    message["Subject"] = "Код для входа в TeamUp"
+    message.set_content(
+        f"Ваш код для входа: {code}\n\n"
+        "Код действует 10 минут. Если вы не запрашивали вход, "
+        "просто проигнорируйте это письмо."
+    )
+    return message
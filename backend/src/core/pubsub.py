@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+from collections import defaultdict
+from typing import AsyncIterator, Optional
+
+import redis.asyncio as redis
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+
+class Subscription:
+    """Локальный подписчик канала с ограниченной очередью.
+
+    Если клиент не успевает забирать сообщения и очередь заполнена,
+    новые сообщения отбрасываются, а флаг overflowed сообщает
+    потребителю, что ему нужно перечитать состояние (backpressure
+    без неограниченного роста памяти воркера).
+    """
+
+    def __init__(self, maxsize: int):
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def put(self, message: str) -> None:
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class PubSubHub:
+    """Раздача сообщений Redis pub/sub локальным подписчикам воркера.
+
+    На воркер открывается одно pub/sub-соединение с Redis, на которое
+    подписываются каналы активных локальных подписчиков; одна фоновая
+    задача читает сообщения и раскладывает их по их очередям.
+    Публиковать может любой процесс с доступом к Redis, а доставку
+    выполнит тот воркер, который держит соединение клиента.
+    """
+
+    def __init__(self, client: redis.Redis, queue_size: int = 100):
+        self._client = client
+        self._queue_size = queue_size
+        self._pubsub = client.pubsub(ignore_subscribe_messages=True)
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+        self._reader: asyncio.Task | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def connections(self) -> int:
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    async def publish(self, channel: str, message: str) -> None:
+        await self._client.publish(channel, message)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        """Подписывает локального потребителя на канал на время контекста."""
+        subscription = Subscription(self._queue_size)
+        async with self._lock:
+            if not self._subscribers[channel]:
+                await self._pubsub.subscribe(channel)
+            self._subscribers[channel].add(subscription)
+            if self._reader is None or self._reader.done():
+                self._reader = asyncio.create_task(self._read_loop())
+        try:
+            yield subscription
+        finally:
+            async with self._lock:
+                self._subscribers[channel].discard(subscription)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+                    await self._pubsub.unsubscribe(channel)
+
+    async def _read_loop(self) -> None:
+        # Задача завершается, когда не осталось подписчиков, и снова
+        # запускается при следующей подписке.
+        while self._subscribers:
+            try:
+                message = await self._pubsub.get_message(timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("pubsub read failed", error=str(e))
+                await asyncio.sleep(1.0)
+                continue
+            if message is None or message.get("type") != "message":
+                continue
+            for subscription in tuple(self._subscribers.get(message["channel"], ())):
+                subscription.put(message["data"])
+
+    async def close(self) -> None:
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+        await self._pubsub.aclose()
+
+
+pubsub_hub: Optional[PubSubHub] = None
+
+
+def set_hub(hub: PubSubHub):
+    global pubsub_hub
+    pubsub_hub = hub
+
+
+async def get_hub() -> PubSubHub:
+    return pubsub_hub
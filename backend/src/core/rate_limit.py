@@ -0,0 +1,127 @@
+import math
+import time
+
+from fastapi import Request
+from redis.exceptions import RedisError
+from src.config import settings
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.local_cache import LocalTTLCache
+from src.core.exceptions import RateLimitException
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+# Token bucket за один вызов: пополнение по времени Redis (одни часы
+# для всех воркеров), списание токена и продление TTL.
+# Результат: {1, 0} — запрос разрешён, {0, ms} — ждать ms миллисекунд.
+_TOKEN_BUCKET = """
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now_ms
+tokens = math.min(capacity, tokens + math.max(0, now_ms - ts) * rate)
+local allowed = 0
+local retry_ms = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    retry_ms = math.ceil((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now_ms)
+redis.call('PEXPIRE', KEYS[1], ARGV[3])
+return {allowed, retry_ms}
+"""
+
+
+class RateLimiter:
+    """Ограничитель частоты запросов по алгоритму token bucket.
+
+    Корзина вмещает limit токенов и полностью пополняется за period
+    секунд; каждый запрос забирает один токен. Состояние хранится в
+    Redis, проверка — один EVALSHA. Если Redis недоступен, используется
+    такая же корзина в памяти процесса: лимит тогда действует на
+    воркер, а не на кластер, но защита не отключается.
+
+    Экземпляр с ключом по IP можно подключать как зависимость:
+    dependencies=[Depends(limiter)].
+    """
+
+    PREFIX = "rate"
+
+    def __init__(self, scope: str, limit: int, period: int):
+        self.scope = scope
+        self.limit = limit
+        self.period = period
+        self._rate_per_ms = limit / (period * 1000)
+        self._local = LocalTTLCache(maxsize=settings.RATE_LIMIT_LOCAL_SIZE, ttl=period)
+        self._scripts = {}
+
+    def _key(self, identity: str) -> str:
+        return f"{self.PREFIX}:{self.scope}:{identity}"
+
+    async def __call__(self, request: Request) -> None:
+        await self.hit(client_ip(request))
+
+    async def hit(self, identity: str) -> None:
+        """Списывает токен для identity.
+
+        Raises:
+            RateLimitException: Токенов не осталось.
+        """
+        key = self._key(identity)
+        cache = redis_cache_module.redis_cache
+        if cache is None:
+            retry_ms = self._hit_local(key)
+        else:
+            try:
+                retry_ms = await self._hit_redis(cache, key)
+            except RedisError as exc:
+                logger.warning(
+                    "rate limiter fallback", scope=self.scope, error=str(exc)
+                )
+                retry_ms = self._hit_local(key)
+        if retry_ms:
+            raise RateLimitException(retry_after=math.ceil(retry_ms / 1000))
+
+    async def _hit_redis(self, cache, key: str) -> int:
+        script = self._scripts.get(id(cache))
+        if script is None:
+            script = self._scripts[id(cache)] = cache.register_script(_TOKEN_BUCKET)
+        allowed, retry_ms = await script(
+            keys=[key],
+            args=[self.limit, self._rate_per_ms, self.period * 1000],
+        )
+        return 0 if allowed else int(retry_ms)
+
+    def _hit_local(self, key: str) -> int:
+        now_ms = time.monotonic() * 1000
+        tokens, ts = self._local.get(key, (self.limit, now_ms))
+        tokens = min(self.limit, tokens + (now_ms - ts) * self._rate_per_ms)
+        if tokens >= 1:
+            self._local.set(key, (tokens - 1, now_ms))
+            return 0
+        self._local.set(key, (tokens, now_ms))
+        return math.ceil((1 - tokens) / self._rate_per_ms)
+
+
+def client_ip(request: Request) -> str:
+    """IP клиента; за прокси uvicorn подставляет его из X-Forwarded-For."""
+    return request.client.host if request.client else "unknown"
+
+
+login_ip_limiter = RateLimiter(
+    "login_ip", limit=settings.LOGIN_RATE_LIMIT_PER_IP, period=60
+)
+login_email_limiter = RateLimiter(
+    "login_email", limit=settings.LOGIN_RATE_LIMIT_PER_EMAIL, period=600
+)
+verify_ip_limiter = RateLimiter(
+    "verify_ip", limit=settings.VERIFY_RATE_LIMIT_PER_IP, period=60
+)
+write_ip_limiter = RateLimiter(
+    "write_ip", limit=settings.WRITE_RATE_LIMIT_PER_IP, period=60
+)
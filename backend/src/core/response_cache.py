@@ -0,0 +1,212 @@
+import functools
+import hashlib
+import json
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from src.config import settings
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.local_cache import LocalTTLCache
+from src.core.db.single_flight import single_flight
+from src.core.logger import get_logger
+from src.core.pubsub import PubSubHub
+
+logger = get_logger()
+
+
+class ResponseCache:
+    """Кэш сериализованных ответов публичных GET-эндпоинтов.
+
+    Ответ хранится в двух уровнях: в LRU процесса и в Redis. Каждая
+    запись привязывается к тегам (например, project:{id}); запись в
+    сервисе сбрасывает теги после коммита, а ключи удаляются из Redis
+    и, через pub/sub, из локальных кэшей всех воркеров. ETag ответа —
+    хэш тела, поэтому повторный запрос с If-None-Match получает 304
+    без тела.
+
+    Промахи в Redis загружаются через SingleFlight: истёкшую запись
+    пересчитывает один запрос на весь кластер, остальные в течение
+    stale_ttl получают предыдущую версию.
+
+    У каждого тега есть счётчик поколения, который инвалидация
+    увеличивает, а ключ записи в Redis включает поколения её тегов.
+    Загрузка, начатая до инвалидации, сохранит результат под старым
+    ключом, который уже никто не читает, поэтому устаревшие данные
+    не переживают запись. Старые ключи истекают по TTL.
+
+    Промах загружается с реплики. Только в течение fresh_ttl секунд
+    после инвалидации тега загрузчик получает fresh=True и читает
+    с primary: отстающая реплика ещё могла бы вернуть данные до записи,
+    и они остались бы в кэше на весь TTL.
+
+    Подходит только для ответов, не зависящих от пользователя.
+    """
+
+    KEY_PREFIX = "resp"
+    TAG_PREFIX = "resp_tag"
+    GEN_PREFIX = "resp_gen"
+    FRESH_PREFIX = "resp_fresh"
+    GEN_TTL = 86_400
+    CHANNEL = "resp_cache:invalidate"
+
+    def __init__(
+        self, local_maxsize: int, local_ttl: float, stale_ttl: int, fresh_ttl: int
+    ):
+        self._local = LocalTTLCache(maxsize=local_maxsize, ttl=local_ttl)
+        self.stale_ttl = stale_ttl
+        self.fresh_ttl = fresh_ttl
+        # Растёт при каждой инвалидации локального уровня: ответ,
+        # загруженный во время неё, в локальный кэш не кладётся.
+        self._local_epoch = 0
+
+    def _key(self, request: Request) -> str:
+        query = "&".join(sorted(request.url.query.split("&")))
+        return f"{self.KEY_PREFIX}:{request.url.path}?{query}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.TAG_PREFIX}:{tag}"
+
+    def _gen_key(self, tag: str) -> str:
+        return f"{self.GEN_PREFIX}:{tag}"
+
+    def _fresh_key(self, tag: str) -> str:
+        return f"{self.FRESH_PREFIX}:{tag}"
+
+    def _drop_local(self, keys: list[str] | None = None) -> None:
+        self._local_epoch += 1
+        if keys is None:
+            self._local.clear()
+            return
+        for key in keys:
+            self._local.delete(key)
+
+    @staticmethod
+    def _etag(body: str) -> str:
+        return '"' + hashlib.blake2b(body.encode(), digest_size=16).hexdigest() + '"'
+
+    async def serve(
+        self,
+        request: Request,
+        *,
+        tags: list[str],
+        ttl: int,
+        loader: Callable[[bool], Awaitable[BaseModel]],
+    ) -> Response:
+        """Отдаёт ответ из кэша или вычисляет и кэширует его.
+
+        Args:
+            request (Request): Текущий запрос (путь и query образуют ключ).
+            tags (list[str]): Теги для инвалидации записи.
+            ttl (int): Время жизни записи в Redis, в секундах.
+            loader: Корутина, вычисляющая ответ при промахе; аргумент
+                fresh требует читать с primary.
+
+        Returns:
+            Response: JSON-ответ с ETag или 304 Not Modified.
+        """
+        key = self._key(request)
+        entry = self._local.get(key)
+        cache = redis_cache_module.redis_cache
+
+        async def render(fresh: bool) -> dict:
+            body = (await loader(fresh)).model_dump_json()
+            return {"body": body, "etag": self._etag(body)}
+
+        async def render_tagged(fresh: bool) -> dict:
+            entry = await render(fresh)
+            async with cache.pipeline() as pipe:
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), key)
+                    pipe.expire(self._tag_key(tag), ttl + self.stale_ttl)
+                await pipe.execute()
+            return entry
+
+        if entry is None:
+            epoch = self._local_epoch
+            if cache is None:
+                entry = await render(fresh=True)
+            else:
+                values = await cache.mget(
+                    [self._gen_key(tag) for tag in tags]
+                    + [self._fresh_key(tag) for tag in tags]
+                )
+                gens, fresh = values[: len(tags)], any(values[len(tags) :])
+                versioned_key = f"{key}@{'.'.join(g or '0' for g in gens)}"
+                entry = await single_flight.get_or_load(
+                    cache,
+                    versioned_key,
+                    functools.partial(render_tagged, fresh),
+                    ttl=ttl,
+                    stale_ttl=self.stale_ttl,
+                )
+            if epoch == self._local_epoch:
+                self._local.set(key, entry)
+
+        headers = {"ETag": entry["etag"], "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match", "")
+        if entry["etag"] in (t.strip() for t in if_none_match.split(",")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(
+            content=entry["body"], media_type="application/json", headers=headers
+        )
+
+    async def invalidate(self, *tags: str) -> None:
+        """Сбрасывает все записи с указанными тегами во всех воркерах."""
+        cache = redis_cache_module.redis_cache
+        if cache is None:
+            self._drop_local()
+            return
+
+        tag_keys = [self._tag_key(tag) for tag in tags]
+        async with cache.pipeline(transaction=True) as pipe:
+            for tag in tags:
+                pipe.incr(self._gen_key(tag))
+                pipe.expire(self._gen_key(tag), self.GEN_TTL)
+                pipe.set(self._fresh_key(tag), "1", ex=self.fresh_ttl)
+            for tag_key in tag_keys:
+                pipe.smembers(tag_key)
+            pipe.delete(*tag_keys)
+            results = await pipe.execute()
+        members = results[3 * len(tags) : 4 * len(tags)]
+        # Под этими путями лежат локальные копии в воркерах; записи в
+        # Redis после смены поколения уже недостижимы.
+        keys = sorted(set().union(*members))
+
+        self._drop_local(keys)
+        if keys:
+            await cache.publish(self.CHANNEL, json.dumps(keys))
+
+    async def listen_invalidations(self, hub: PubSubHub) -> None:
+        """Удаляет из локального уровня ключи, сброшенные другими воркерами."""
+        async with hub.subscribe(self.CHANNEL) as subscription:
+            while True:
+                message = await subscription.queue.get()
+                if subscription.overflowed:
+                    subscription.overflowed = False
+                    self._drop_local()
+                try:
+                    keys = json.loads(message)
+                except ValueError:
+                    logger.warning("bad response cache invalidation", message=message)
+                    continue
+                self._drop_local(keys)
+
+
+response_cache = ResponseCache(
+    local_maxsize=settings.RESPONSE_CACHE_LOCAL_SIZE,
+    local_ttl=settings.RESPONSE_CACHE_LOCAL_TTL,
+    stale_ttl=settings.CACHE_STALE_TTL,
+    fresh_ttl=settings.READ_YOUR_WRITES_SECONDS,
+)
+
+
+async def get_response_cache() -> ResponseCache:
+    return response_cache
+
+
+def project_tag(project_id) -> str:
+    return f"project:{project_id}"
+
+
+PROJECT_FEED_TAG = "projects:feed"
@@ -0,0 +1,150 @@
+import asyncio
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from src.config import settings
+from src.core.exceptions import PayloadTooLargeException
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+
+class ObjectStorage(ABC):
+    """Хранилище файлов (объектов) по строковым ключам вида "a/b/c"."""
+
+    @abstractmethod
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        pass
+
+    @abstractmethod
+    async def put_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        max_bytes: int,
+    ) -> int:
+        """Записывает объект по частям, не собирая его в памяти.
+
+        Raises:
+            PayloadTooLargeException: Данные превысили max_bytes;
+                частично записанный объект не сохраняется.
+        """
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        pass
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """Публичный URL объекта."""
+
+
+class LocalObjectStorage(ObjectStorage):
+    """Хранилище в локальном каталоге (разработка и одиночный сервер).
+
+    Запись идёт во временный файл рядом с целевым и завершается
+    атомарным os.replace, поэтому читатели никогда не видят файл
+    частично. Файловые операции выполняются в потоках, чтобы не
+    блокировать event loop.
+    """
+
+    def __init__(self, root: str, base_url: str):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, key: str) -> Path:
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root.resolve()):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def _open_temp(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=path.parent, delete=False)
+
+    def _write(self, path: Path, data: bytes) -> None:
+        with self._open_temp(path) as tmp:
+            tmp.write(data)
+        os.replace(tmp.name, path)
+
+    async def put(self, key: str, data: bytes, content_type: str) -> None:
+        await asyncio.to_thread(self._write, self._path(key), data)
+
+    async def put_stream(
+        self,
+        key: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        max_bytes: int,
+    ) -> int:
+        path = self._path(key)
+        tmp = await asyncio.to_thread(self._open_temp, path)
+        size = 0
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise PayloadTooLargeException
+                await asyncio.to_thread(tmp.write, chunk)
+            await asyncio.to_thread(tmp.close)
+            await asyncio.to_thread(os.replace, tmp.name, path)
+        except BaseException:
+            tmp.close()
+            await asyncio.to_thread(Path(tmp.name).unlink, True)
+            raise
+        return size
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(self._path(key).exists)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self._path(key).unlink, True)
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+
+class ImmutableStaticFiles(StaticFiles):
+    """Раздача файлов хранилища с бессрочным кэшированием.
+
+    Ключи объектов содержат хэш содержимого и никогда не перезаписываются
+    другими данными, поэтому браузеры и CDN могут не перепроверять их.
+    """
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.CACHE_CONTROL
+        return response
+
+
+def get_storage_backend(private: bool = False) -> ObjectStorage:
+    """Возвращает хранилище по настройке STORAGE_BACKEND.
+
+    Args:
+        private (bool): Хранилище, которое не раздаётся по /media;
+            публичных URL у его объектов нет.
+    """
+    if settings.STORAGE_BACKEND == "local":
+        if private:
+            return LocalObjectStorage(settings.PRIVATE_MEDIA_ROOT, base_url="")
+        return LocalObjectStorage(settings.MEDIA_ROOT, settings.MEDIA_URL)
+    raise ValueError(f"Unknown storage backend: {settings.STORAGE_BACKEND}")
+
+
+object_storage = get_storage_backend()
+private_object_storage = get_storage_backend(private=True)
+
+
+async def get_storage() -> ObjectStorage:
+    return object_storage
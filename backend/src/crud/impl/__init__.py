@@ -1,5 +1,17 @@
+from src.crud.impl.notification import NotificationDAO
+from src.crud.impl.position import PositionDAO
+from src.crud.impl.profile import ProfileDAO
+from src.crud.impl.project import ProjectDAO
+from src.crud.impl.project_search import ProjectSearchDAO
+from src.crud.impl.tag import TagDAO
 from src.crud.impl.user import UserDAO
 
 __all__ = [
+    "NotificationDAO",
+    "PositionDAO",
+    "ProfileDAO",
+    "ProjectDAO",
+    "ProjectSearchDAO",
+    "TagDAO",
     "UserDAO",
 ]
@@ -1,6 +1,7 @@
 from uuid import UUID
 
 from sqlalchemy import delete, insert, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from src.core.exceptions import NotFoundException  # TODO
@@ -125,12 +126,87 @@ class BaseDAO:
         result = await self.session.execute(query)
         return result.scalar_one_or_none() if return_model else None
 
+    @handle_db_errors
+    async def add_many(self, rows: list[dict], return_models: bool = True):
+        """Добавляет несколько записей одним многострочным INSERT.
+
+        Используется для пакетного создания записей вместо вызова add
+        в цикле (одна круглая поездка к БД вместо N).
+
+        Args:
+            rows (list[dict]): Данные создаваемых записей.
+            return_models (bool, optional): Возвращать ли созданные модели.
+                По умолчанию True.
+
+        Returns:
+            List[Модель] | None: Созданные записи в порядке rows или None,
+                если return_models=False.
+        """
+        if not rows:
+            return [] if return_models else None
+        if not return_models:
+            await self.session.execute(insert(self.model), rows)
+            return None
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.execute(query, rows)
+        return result.scalars().all()
+
+    @handle_db_errors
+    async def upsert_many(
+        self,
+        rows: list[dict],
+        index_elements: list[str],
+        update_fields: list[str] | None = None,
+        return_models: bool = True,
+    ):
+        """Вставляет или обновляет записи через INSERT ... ON CONFLICT.
+
+        Используется для идемпотентной пакетной записи по уникальному
+        ключу за один запрос.
+
+        Args:
+            rows (list[dict]): Данные записей.
+            index_elements (list[str]): Колонки уникального ключа конфликта.
+            update_fields (list[str] | None, optional): Колонки, обновляемые
+                при конфликте. По умолчанию все переданные колонки, кроме
+                ключа. Пустой список означает ON CONFLICT DO NOTHING.
+            return_models (bool, optional): Возвращать ли записи.
+                По умолчанию True.
+
+        Returns:
+            List[Модель] | None: Вставленные и обновлённые записи в порядке
+                rows или None, если return_models=False. При ON CONFLICT DO
+                NOTHING — только вставленные записи, порядок не гарантирован.
+        """
+        if not rows:
+            return [] if return_models else None
+        if update_fields is None:
+            update_fields = [k for k in rows[0] if k not in index_elements]
+
+        query = pg_insert(self.model)
+        if update_fields:
+            query = query.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={f: query.excluded[f] for f in update_fields},
+            )
+        else:
+            query = query.on_conflict_do_nothing(index_elements=index_elements)
+
+        if not return_models:
+            await self.session.execute(query, rows)
+            return None
+        # При DO NOTHING конфликтующие строки не попадают в RETURNING,
+        # поэтому сопоставить результат с порядком rows невозможно.
+        query = query.returning(self.model, sort_by_parameter_order=bool(update_fields))
+        result = await self.session.execute(query, rows)
+        return result.scalars().all()
+
     @handle_db_errors
     async def delete(self, model_id: int | UUID):
         """Удаляет запись по её идентификатору.
 
         Используется для удаления записей из базы данных.
-        Сначала проверяет существование записи.
+        Отсутствие записи определяется по RETURNING, без отдельного SELECT.
 
         Args:
             model_id (int | UUID): Идентификатор записи для удаления.
@@ -138,9 +214,33 @@ class BaseDAO:
         Raises:
             NotFoundException: Если запись с указанным ID не найдена.
         """
-        await self.check_exist_or_404(model_id=model_id)
-        stmt = delete(self.model).where(self.model.id == model_id)
-        await self.session.execute(stmt)
+        stmt = (
+            delete(self.model).where(self.model.id == model_id).returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            raise NotFoundException
+
+    @handle_db_errors
+    async def delete_many(self, model_ids: list[int | UUID]) -> None:
+        """Удаляет несколько записей одним DELETE.
+
+        Args:
+            model_ids (list[int | UUID]): Идентификаторы записей.
+
+        Raises:
+            NotFoundException: Если хотя бы одна запись не найдена.
+        """
+        if not model_ids:
+            return
+        stmt = (
+            delete(self.model)
+            .where(self.model.id.in_(model_ids))
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if len(result.scalars().all()) != len(set(model_ids)):
+            raise NotFoundException
 
     @handle_db_errors
     async def update(
@@ -149,7 +249,7 @@ class BaseDAO:
         """Обновляет запись по её идентификатору.
 
         Используется для изменения существующих записей.
-        Сначала проверяет существование записи.
+        Отсутствие записи определяется по RETURNING, без отдельного SELECT.
 
         Args:
             model_id (int | UUID): Идентификатор записи для обновления.
@@ -163,12 +263,47 @@ class BaseDAO:
         Raises:
             NotFoundException: Если запись с указанным ID не найдена.
         """
-        await self.check_exist_or_404(model_id=model_id)
         stmt = (
             update(self.model)
             .where(self.model.id == model_id)
             .values(**update_data)
-            .returning(self.model)
+            .returning(self.model if return_model else self.model.id)
         )
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() if return_model else None
+        instance = result.scalar_one_or_none()
+        if instance is None:
+            raise NotFoundException
+        return instance if return_model else None
+
+    @handle_db_errors
+    async def update_many(
+        self, model_ids: list[int | UUID], return_models: bool = True, **update_data
+    ):
+        """Применяет одинаковые изменения к нескольким записям одним UPDATE.
+
+        Args:
+            model_ids (list[int | UUID]): Идентификаторы записей.
+            return_models (bool, optional): Возвращать ли обновлённые модели.
+                По умолчанию True.
+            **update_data: Данные для обновления.
+
+        Returns:
+            List[Модель] | None: Обновлённые записи или None,
+                если return_models=False.
+
+        Raises:
+            NotFoundException: Если хотя бы одна запись не найдена.
+        """
+        if not model_ids:
+            return [] if return_models else None
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(model_ids))
+            .values(**update_data)
+            .returning(self.model if return_models else self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        instances = result.scalars().all()
+        if len(instances) != len(set(model_ids)):
+            raise NotFoundException
+        return instances if return_models else None
@@ -0,0 +1,106 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select, tuple_, update
+from src.core.exceptions import NotFoundException
+from src.core.wrapper import handle_db_errors
+from src.crud.impl.base import BaseDAO
+from src.models import Notification
+
+
+class NotificationDAO(BaseDAO):
+    """DAO для работы с уведомлениями.
+
+    Лента уведомлений листается keyset-курсором по (created_at, id)
+    внутри пользователя и читается из индекса (user_id, created_at, id),
+    непрочитанные — из частичного индекса WHERE NOT is_read.
+
+    Используется в:
+    - NotificationService для ленты и отметок о прочтении
+    """
+
+    model = Notification
+
+    @handle_db_errors
+    async def get_page(
+        self,
+        user_id: int,
+        *,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        only_unread: bool = False,
+    ):
+        """Возвращает страницу уведомлений пользователя от новых к старым.
+
+        Args:
+            user_id (int): ID получателя.
+            limit (int): Размер страницы.
+            after (tuple[datetime, UUID] | None): Ключ (created_at, id)
+                последней записи предыдущей страницы.
+            only_unread (bool): Только непрочитанные.
+
+        Returns:
+            List[Notification]: До limit + 1 уведомлений.
+        """
+        query = select(self.model).where(self.model.user_id == user_id)
+        if only_unread:
+            query = query.where(self.model.is_read.is_(False))
+        if after is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.id) < after)
+        query = query.order_by(
+            self.model.created_at.desc(), self.model.id.desc()
+        ).limit(limit + 1)
+        result = await self.session.execute(query)
+        return result.scalars().all()
+
+    @handle_db_errors
+    async def mark_read(self, user_id: int, notification_id: UUID) -> bool:
+        """Отмечает уведомление прочитанным.
+
+        Returns:
+            bool: True, если уведомление было непрочитанным.
+
+        Raises:
+            NotFoundException: Если у пользователя нет такого уведомления.
+        """
+        stmt = (
+            update(self.model)
+            .where(
+                self.model.id == notification_id,
+                self.model.user_id == user_id,
+                self.model.is_read.is_(False),
+            )
+            .values(is_read=True)
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is not None:
+            return True
+
+        # Медленный путь только для уже прочитанных или чужих уведомлений.
+        if await self.find_one_or_none(id=notification_id, user_id=user_id) is None:
+            raise NotFoundException
+        return False
+
+    @handle_db_errors
+    async def mark_all_read(self, user_id: int) -> None:
+        """Отмечает все уведомления пользователя прочитанными."""
+        stmt = (
+            update(self.model)
+            .where(self.model.user_id == user_id, self.model.is_read.is_(False))
+            .values(is_read=True)
+        )
+        await self.session.execute(stmt)
+
+    @handle_db_errors
+    async def count_unread(self, user_id: int) -> int:
+        """Считает непрочитанные уведомления по частичному индексу.
+
+        Используется только для восстановления счётчика в Redis при
+        его отсутствии, а не на каждом запросе.
+        """
+        query = select(func.count()).where(
+            self.model.user_id == user_id, self.model.is_read.is_(False)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one()
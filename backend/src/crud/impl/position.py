@@ -0,0 +1,12 @@
+from src.crud.impl.base import BaseDAO
+from src.models import Position
+
+
+class PositionDAO(BaseDAO):
+    """DAO для работы с позициями проектов.
+
+    Используется в:
+    - ProjectService при создании и изменении проектов
+    """
+
+    model = Position
@@ -0,0 +1,131 @@
+from uuid import UUID
+
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.core.exceptions import NotFoundException
+from src.core.wrapper import handle_db_errors
+from src.crud.impl.base import BaseDAO
+from src.models import Education, Tag, UserSkill, UserSocial, UserTag
+
+
+class ProfileDAO(BaseDAO):
+    """DAO для разделов профиля пользователя.
+
+    Навыки и теги заменяются по разнице с текущим набором, соцсети —
+    целиком; записи об образовании изменяются по одной, и только
+    владельцем.
+
+    Используется в:
+    - UserService при изменении профиля
+    """
+
+    model = Education
+
+    async def _replace_set(self, column, user_id: int, values: list) -> bool:
+        """Приводит множество значений column пользователя к values.
+
+        Читает текущее множество и пишет только разницу: одним DELETE
+        для удалённых значений и одним INSERT для добавленных. Строки,
+        которые не изменились, и их индексные записи не трогаются.
+
+        Returns:
+            bool: False, если множество уже совпадало и запросов на
+                запись не было.
+        """
+        model = column.class_
+        result = await self.session.execute(
+            select(column).where(model.user_id == user_id)
+        )
+        current = set(result.scalars().all())
+        target = set(values)
+        removed = current - target
+        added = target - current
+        if not removed and not added:
+            return False
+        if removed:
+            await self.session.execute(
+                delete(model).where(model.user_id == user_id, column.in_(removed))
+            )
+        if added:
+            await self.session.execute(
+                pg_insert(model)
+                .values([{"user_id": user_id, column.key: v} for v in added])
+                .on_conflict_do_nothing()
+            )
+        return True
+
+    @handle_db_errors
+    async def set_skills(self, user_id: int, names: list[str]) -> bool:
+        """Заменяет навыки пользователя, записывая только разницу.
+
+        Returns:
+            bool: Изменился ли набор навыков.
+        """
+        return await self._replace_set(UserSkill.name, user_id, names)
+
+    @handle_db_errors
+    async def get_tag_names(self, user_id: int) -> set[str]:
+        """Возвращает имена тегов пользователя."""
+        result = await self.session.execute(
+            select(Tag.name)
+            .join(UserTag, UserTag.tag_id == Tag.id)
+            .where(UserTag.user_id == user_id)
+        )
+        return set(result.scalars().all())
+
+    @handle_db_errors
+    async def set_tags(self, user_id: int, tag_ids: list[int]) -> bool:
+        """Заменяет теги пользователя, записывая только разницу.
+
+        Returns:
+            bool: Изменился ли набор тегов.
+        """
+        return await self._replace_set(UserTag.tag_id, user_id, tag_ids)
+
+    @handle_db_errors
+    async def set_socials(self, user_id: int, socials: list[dict]) -> None:
+        """Заменяет ссылки на соцсети пользователя."""
+        await self.session.execute(
+            delete(UserSocial).where(UserSocial.user_id == user_id)
+        )
+        if socials:
+            await self.session.execute(
+                insert(UserSocial).values(
+                    [{"user_id": user_id, **social} for social in socials]
+                )
+            )
+
+    @handle_db_errors
+    async def update_education(self, edu_id: UUID, user_id: int, **update_data) -> None:
+        """Изменяет запись об образовании пользователя.
+
+        Raises:
+            NotFoundException: Если записи нет или она принадлежит другому
+                пользователю.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == edu_id, self.model.user_id == user_id)
+            .values(**update_data)
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            raise NotFoundException
+
+    @handle_db_errors
+    async def delete_education(self, edu_id: UUID, user_id: int) -> None:
+        """Удаляет запись об образовании пользователя.
+
+        Raises:
+            NotFoundException: Если записи нет или она принадлежит другому
+                пользователю.
+        """
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == edu_id, self.model.user_id == user_id)
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            raise NotFoundException
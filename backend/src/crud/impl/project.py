@@ -0,0 +1,190 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import delete, exists, func, select, tuple_, update
+from sqlalchemy.orm import selectinload
+from src.core.exceptions import ForbiddenException
+from src.core.wrapper import handle_db_errors
+from src.crud.impl.base import BaseDAO
+from src.models import Position, PositionTag, Project, ProjectStatus, User
+
+EXCERPT_LENGTH = 280
+
+
+def card_columns() -> tuple:
+    """Колонки карточки проекта для лент и поиска (без полного описания)."""
+    return (
+        Project.id,
+        Project.title,
+        func.left(Project.description, EXCERPT_LENGTH).label("excerpt"),
+        Project.tags,
+        Project.created_at,
+    )
+
+
+def has_open_position_with_tags(tag_ids: list[int]):
+    """Условие: у проекта есть открытая позиция со всеми тегами tag_ids.
+
+    Позиции с нужным набором тегов находятся пересечением постинг-листов
+    position_tags (GROUP BY позиции с HAVING по числу тегов).
+    """
+    matching_positions = (
+        select(PositionTag.position_id)
+        .where(PositionTag.tag_id.in_(tag_ids))
+        .group_by(PositionTag.position_id)
+        .having(func.count() == len(set(tag_ids)))
+    )
+    return exists().where(
+        Position.project_id == Project.id,
+        Position.is_open.is_(True),
+        Position.id.in_(matching_positions),
+    )
+
+
+class ProjectDAO(BaseDAO):
+    """DAO для работы с проектами.
+
+    Предоставляет ленту проектов с keyset-пагинацией: каждая страница
+    продолжает выборку от ключа (created_at, id) последней записи
+    предыдущей страницы, поэтому стоимость запроса O(limit) и не
+    зависит от глубины листания.
+
+    Используется в:
+    - ProjectService для ленты открытых проектов и проектов владельца
+    """
+
+    model = Project
+
+    @handle_db_errors
+    async def get_feed(
+        self,
+        *,
+        limit: int,
+        after: tuple[datetime, UUID] | None = None,
+        status: ProjectStatus | None = ProjectStatus.OPEN,
+        owner_id: int | None = None,
+        role_tag_ids: list[int] | None = None,
+    ):
+        """Возвращает страницу карточек проектов в порядке от новых к старым.
+
+        Выбирает limit + 1 строк, чтобы вызывающий код мог определить
+        наличие следующей страницы без отдельного COUNT.
+
+        Args:
+            limit (int): Размер страницы.
+            after (tuple[datetime, UUID] | None): Ключ (created_at, id)
+                последней записи предыдущей страницы.
+            status (ProjectStatus | None): Фильтр по статусу проекта.
+            owner_id (int | None): Фильтр по владельцу проекта.
+            role_tag_ids (list[int] | None): ID тегов, которые должны быть
+                все у одной открытой позиции проекта.
+
+        Returns:
+            List[Row]: Строки с полями id, title, excerpt, tags, created_at.
+        """
+        stmt = select(*card_columns())
+        if status is not None:
+            stmt = stmt.where(self.model.status == status)
+        if owner_id is not None:
+            stmt = stmt.where(self.model.owner_id == owner_id)
+        if role_tag_ids:
+            stmt = stmt.where(has_open_position_with_tags(role_tag_ids))
+        if after is not None:
+            stmt = stmt.where(tuple_(self.model.created_at, self.model.id) < after)
+
+        stmt = stmt.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(
+            limit + 1
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    @handle_db_errors
+    async def get_detail(self, project_id: UUID):
+        """Возвращает проект с позициями и владельцем.
+
+        Позиции загружаются одним дополнительным запросом (selectin),
+        владелец — через JOIN.
+
+        Args:
+            project_id (UUID): Идентификатор проекта.
+
+        Returns:
+            tuple[Project, User] | None: Проект и его владелец или None.
+        """
+        query = (
+            select(self.model, User)
+            .join(User, User.id == self.model.owner_id)
+            .where(self.model.id == project_id)
+            .options(selectinload(self.model.positions))
+        )
+        result = await self.session.execute(query)
+        return result.one_or_none()
+
+    @handle_db_errors
+    async def get_for_profile(self, owner_id: int, limit: int):
+        """Возвращает опубликованные проекты пользователя для его профиля.
+
+        Args:
+            owner_id (int): ID владельца.
+            limit (int): Максимальное число проектов.
+
+        Returns:
+            List[Row]: Строки с полями id, title, description, tags.
+        """
+        stmt = (
+            select(
+                self.model.id,
+                self.model.title,
+                self.model.description,
+                self.model.tags,
+            )
+            .where(
+                self.model.owner_id == owner_id,
+                self.model.status != ProjectStatus.DRAFT,
+            )
+            .order_by(self.model.created_at.desc(), self.model.id.desc())
+            .limit(limit)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    @handle_db_errors
+    async def update_owned(self, project_id: UUID, owner_id: int, **update_data):
+        """Обновляет проект, если он принадлежит owner_id.
+
+        Raises:
+            NotFoundException: Если проекта нет.
+            ForbiddenException: Если проект принадлежит другому пользователю.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == project_id, self.model.owner_id == owner_id)
+            .values(**update_data)
+            .returning(self.model)
+        )
+        result = await self.session.execute(stmt)
+        project = result.scalar_one_or_none()
+        if project is None:
+            await self._raise_not_owned(project_id)
+        return project
+
+    @handle_db_errors
+    async def delete_owned(self, project_id: UUID, owner_id: int) -> None:
+        """Удаляет проект, если он принадлежит owner_id.
+
+        Raises:
+            NotFoundException: Если проекта нет.
+            ForbiddenException: Если проект принадлежит другому пользователю.
+        """
+        stmt = (
+            delete(self.model)
+            .where(self.model.id == project_id, self.model.owner_id == owner_id)
+            .returning(self.model.id)
+        )
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
+            await self._raise_not_owned(project_id)
+
+    async def _raise_not_owned(self, project_id: UUID):
+        await self.check_exist_or_404(model_id=project_id)
+        raise ForbiddenException
@@ -0,0 +1,106 @@
+import re
+from uuid import UUID
+
+from sqlalchemy import Float, cast, func, literal, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from src.core.wrapper import handle_db_errors
+from src.crud.impl.base import BaseDAO
+from src.crud.impl.project import card_columns, has_open_position_with_tags
+from src.models import Project, ProjectStatus
+from src.models.project import SEARCH_CONFIG
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+
+# Вес нечёткого совпадения относительно полнотекстового ранга.
+TRGM_WEIGHT = 0.5
+
+
+class ProjectSearchDAO(BaseDAO):
+    """DAO полнотекстового поиска по проектам.
+
+    Ищет по сгенерированной колонке search_vector (GIN) и по триграммам
+    названия (GIN, pg_trgm), поэтому не сканирует title/description
+    последовательно. Результаты упорядочены по рангу и листаются
+    keyset-курсором по ключу (rank, id).
+
+    Используется в:
+    - ProjectService для параметра q ленты проектов
+    """
+
+    model = Project
+
+    @staticmethod
+    def build_tsquery(q: str) -> str | None:
+        """Строит запрос для to_tsquery из пользовательской строки.
+
+        Слова объединяются через AND, последнее слово ищется по
+        префиксу, чтобы поиск работал по мере ввода.
+
+        Args:
+            q (str): Строка поиска от клиента.
+
+        Returns:
+            str | None: Запрос вида "python & backe:*" или None, если
+                в строке нет ни одного слова.
+        """
+        words = _WORD_RE.findall(q.lower())
+        if not words:
+            return None
+        return " & ".join(words[:-1] + [f"{words[-1]}:*"])
+
+    @handle_db_errors
+    async def search(
+        self,
+        q: str,
+        *,
+        limit: int,
+        after: tuple[float, UUID] | None = None,
+        status: ProjectStatus = ProjectStatus.OPEN,
+        role_tag_ids: list[int] | None = None,
+    ):
+        """Возвращает страницу карточек проектов, отсортированных по рангу.
+
+        Args:
+            q (str): Строка поиска.
+            limit (int): Размер страницы.
+            after (tuple[float, UUID] | None): Ключ (rank, id) последней
+                записи предыдущей страницы.
+            status (ProjectStatus): Фильтр по статусу проекта.
+            role_tag_ids (list[int] | None): ID тегов, которые должны быть
+                все у одной открытой позиции проекта.
+
+        Returns:
+            List[Row]: Строки карточек с дополнительным полем rank
+                (limit + 1 строк для определения следующей страницы).
+        """
+        tsquery_text = self.build_tsquery(q)
+        if tsquery_text is None:
+            return []
+
+        tsquery = func.to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), tsquery_text)
+        needle = literal(q.strip())
+        rank = cast(
+            func.ts_rank_cd(self.model.search_vector, tsquery)
+            + TRGM_WEIGHT * func.word_similarity(needle, self.model.title),
+            Float,
+        ).label("rank")
+
+        stmt = (
+            select(*card_columns(), rank)
+            .where(
+                self.model.status == status,
+                or_(
+                    self.model.search_vector.op("@@")(tsquery),
+                    # word_similarity >= pg_trgm.word_similarity_threshold
+                    needle.op("<%")(self.model.title),
+                ),
+            )
+            .order_by(rank.desc(), self.model.id.desc())
+            .limit(limit + 1)
+        )
+        if role_tag_ids:
+            stmt = stmt.where(has_open_position_with_tags(role_tag_ids))
+        if after is not None:
+            stmt = stmt.where(tuple_(rank, self.model.id) < after)
+        result = await self.session.execute(stmt)
+        return result.all()
@@ -0,0 +1,125 @@
+from uuid import UUID
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from src.core.wrapper import handle_db_errors
+from src.crud.impl.base import BaseDAO
+from src.models import PositionTag, ProjectTag, Tag
+from src.utils.tags import normalize_tags
+
+
+class TagDAO(BaseDAO):
+    """DAO для словаря тегов и постинг-листов проектов и позиций.
+
+    Теги хранятся один раз в словаре с целочисленными ID, а связи
+    проект↔тег и позиция↔тег — в таблицах с ключом (tag_id, ...),
+    поэтому фильтр по нескольким тегам — это пересечение индексных
+    диапазонов, а не сканирование массивов.
+
+    Используется в:
+    - ProjectService для фильтрации ленты по тегам
+    - ProjectService при записи тегов проектов и позиций
+    """
+
+    model = Tag
+
+    @handle_db_errors
+    async def get_ids(self, names: list[str]) -> dict[str, int]:
+        """Возвращает ID существующих тегов по именам.
+
+        Args:
+            names (list[str]): Имена тегов в любом регистре.
+
+        Returns:
+            dict[str, int]: Нормализованное имя -> ID. Неизвестные теги
+                в результат не попадают.
+        """
+        names = normalize_tags(names)
+        if not names:
+            return {}
+        result = await self.session.execute(
+            select(self.model.name, self.model.id).where(self.model.name.in_(names))
+        )
+        return dict(result.all())
+
+    @handle_db_errors
+    async def ensure(self, names: list[str]) -> dict[str, int]:
+        """Возвращает ID тегов, создавая отсутствующие в словаре.
+
+        Сначала ищет существующие теги и вставляет только недостающие,
+        поэтому для известных тегов запись в словарь не выполняется
+        и значения последовательности не расходуются.
+
+        Args:
+            names (list[str]): Имена тегов в любом регистре.
+
+        Returns:
+            dict[str, int]: Нормализованное имя -> ID для всех тегов.
+        """
+        names = normalize_tags(names)
+        ids = await self.get_ids(names)
+        missing = [name for name in names if name not in ids]
+        if not missing:
+            return ids
+        await self.session.execute(
+            insert(self.model)
+            .values([{"name": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[self.model.name])
+        )
+        # Строки, вставленные параллельной транзакцией, RETURNING не вернёт.
+        result = await self.session.execute(
+            select(self.model.name, self.model.id).where(self.model.name.in_(missing))
+        )
+        ids.update(result.all())
+        return ids
+
+    @handle_db_errors
+    async def set_project_tags(self, project_id: UUID, tag_ids: list[int]) -> None:
+        """Заменяет постинг-записи тегов проекта."""
+        await self.session.execute(
+            delete(ProjectTag).where(ProjectTag.project_id == project_id)
+        )
+        if tag_ids:
+            await self.session.execute(
+                insert(ProjectTag).values(
+                    [{"tag_id": t, "project_id": project_id} for t in tag_ids]
+                )
+            )
+
+    @handle_db_errors
+    async def set_position_tags(self, position_id: UUID, tag_ids: list[int]) -> None:
+        """Заменяет постинг-записи тегов позиции."""
+        await self.session.execute(
+            delete(PositionTag).where(PositionTag.position_id == position_id)
+        )
+        if tag_ids:
+            await self.session.execute(
+                insert(PositionTag).values(
+                    [{"tag_id": t, "position_id": position_id} for t in tag_ids]
+                )
+            )
+
+    @handle_db_errors
+    async def add_project_postings(self, project_id: UUID, tag_ids: list[int]) -> None:
+        """Добавляет постинг-записи тегов нового проекта одним INSERT."""
+        if tag_ids:
+            await self.session.execute(
+                insert(ProjectTag).values(
+                    [{"tag_id": t, "project_id": project_id} for t in tag_ids]
+                )
+            )
+
+    @handle_db_errors
+    async def add_position_postings(self, postings: dict[UUID, list[int]]) -> None:
+        """Добавляет постинг-записи тегов нескольких позиций одним INSERT.
+
+        Args:
+            postings (dict[UUID, list[int]]): ID позиции -> ID её тегов.
+        """
+        rows = [
+            {"tag_id": t, "position_id": position_id}
+            for position_id, tag_ids in postings.items()
+            for t in tag_ids
+        ]
+        if rows:
+            await self.session.execute(insert(PositionTag).values(rows))
@@ -1,5 +1,6 @@
 from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import selectinload
 from src.core.wrapper import handle_db_errors
 from src.crud.impl.base import BaseDAO
 from src.models import User
@@ -20,29 +21,41 @@ class UserDAO(BaseDAO):
 
     @handle_db_errors
     async def get_or_create(self, email: str) -> int:
-        """Возвращает ID пользователя, создаёт при отсутствии."""
-        # norm_email = email.strip().lower()
+        """Возвращает ID пользователя, создаёт при отсутствии.
+
+        Выполняется одним атомарным INSERT ... ON CONFLICT (email)
+        DO UPDATE ... RETURNING id: при гонке параллельных запросов
+        на один email оба получают один и тот же ID, и не нужен откат
+        сессии с повторным SELECT.
+        """
+        stmt = pg_insert(self.model).values(email=email)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.email],
+            # Фиктивное обновление нужно, чтобы RETURNING вернул
+            # существующую строку (DO NOTHING её не возвращает).
+            set_={"email": stmt.excluded.email},
+        ).returning(self.model.id)
+        result = await self.session.execute(stmt)
+        return result.scalar_one()
 
-        # 1. Проверяем, есть ли пользователь
-        result = await self.session.execute(
-            select(self.model.id).where(self.model.email == email)
-        )
-        user_id = result.scalar_one_or_none()
-        if user_id:
-            return user_id
-
-        # 2. Пытаемся создать нового
-        user = self.model(email=email)
-        self.session.add(user)
-
-        try:
-            await self.session.flush()
-        except IntegrityError:
-            await self.session.rollback()
-            result = await self.session.execute(
-                select(self.model.id).where(self.model.email == email)
+    @handle_db_errors
+    async def get_profile(self, user_id: int) -> User | None:
+        """Возвращает пользователя со всеми разделами профиля.
+
+        Навыки, теги, соцсети и образование подгружаются selectin-ом —
+        по одному запросу на раздел, поэтому число запросов не зависит
+        от количества записей в разделах.
+        """
+        stmt = (
+            select(self.model)
+            .where(self.model.id == user_id)
+            .execution_options(populate_existing=True)
+            .options(
+                selectinload(self.model.skills),
+                selectinload(self.model.tags),
+                selectinload(self.model.socials),
+                selectinload(self.model.educations),
             )
-            user_id = result.scalar_one()
-            return user_id
-
-        return user.id
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
@@ -1,5 +1,11 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.crud.impl import (
+    NotificationDAO,
+    PositionDAO,
+    ProfileDAO,
+    ProjectDAO,
+    ProjectSearchDAO,
+    TagDAO,
     UserDAO,
 )
 
@@ -30,6 +36,21 @@ class Store:
         """
         self._session = session
         self._user_dao: UserDAO | None = None
+        self._project_dao: ProjectDAO | None = None
+        self._project_search_dao: ProjectSearchDAO | None = None
+        self._position_dao: PositionDAO | None = None
+        self._notification_dao: NotificationDAO | None = None
+        self._tag_dao: TagDAO | None = None
+        self._profile_dao: ProfileDAO | None = None
+
+    @property
+    def session(self) -> AsyncSession:
+        """Возвращает асинхронную сессию базы данных.
+
+        Returns:
+            AsyncSession: Асинхронная сессия SQLAlchemy.
+        """
+        return self._session
 
     @property
     def user(self) -> UserDAO:
@@ -41,3 +62,69 @@ class Store:
         if self._user_dao is None:
             self._user_dao = UserDAO(session=self._session)
         return self._user_dao
+
+    @property
+    def project(self) -> ProjectDAO:
+        """Возвращает интерфейс для работы с проектами.
+
+        Returns:
+            ProjectDAO: Интерфейс для работы с проектами.
+        """
+        if self._project_dao is None:
+            self._project_dao = ProjectDAO(session=self._session)
+        return self._project_dao
+
+    @property
+    def project_search(self) -> ProjectSearchDAO:
+        """Возвращает интерфейс полнотекстового поиска по проектам.
+
+        Returns:
+            ProjectSearchDAO: Интерфейс поиска по проектам.
+        """
+        if self._project_search_dao is None:
+            self._project_search_dao = ProjectSearchDAO(session=self._session)
+        return self._project_search_dao
+
+    @property
+    def tag(self) -> TagDAO:
+        """Возвращает интерфейс для работы со словарём тегов.
+
+        Returns:
+            TagDAO: Интерфейс для работы с тегами.
+        """
+        if self._tag_dao is None:
+            self._tag_dao = TagDAO(session=self._session)
+        return self._tag_dao
+
+    @property
+    def position(self) -> PositionDAO:
+        """Возвращает интерфейс для работы с позициями проектов.
+
+        Returns:
+            PositionDAO: Интерфейс для работы с позициями.
+        """
+        if self._position_dao is None:
+            self._position_dao = PositionDAO(session=self._session)
+        return self._position_dao
+
+    @property
+    def notification(self) -> NotificationDAO:
+        """Возвращает интерфейс для работы с уведомлениями.
+
+        Returns:
+            NotificationDAO: Интерфейс для работы с уведомлениями.
+        """
+        if self._notification_dao is None:
+            self._notification_dao = NotificationDAO(session=self._session)
+        return self._notification_dao
+
+    @property
+    def profile(self) -> ProfileDAO:
+        """Возвращает интерфейс для работы с разделами профиля.
+
+        Returns:
+            ProfileDAO: Интерфейс для работы с профилем пользователя.
+        """
+        if self._profile_dao is None:
+            self._profile_dao = ProfileDAO(session=self._session)
+        return self._profile_dao
@@ -1,11 +1,38 @@
 from src.models.base import Base, BaseWithTimestamps
-from src.models.enums import UserGender, UserRole
+from src.models.enums import (
+    EducationDegree,
+    NotificationType,
+    PositionLevel,
+    ProjectStatus,
+    SocialPlatform,
+    UserGender,
+    UserRole,
+)
+from src.models.notification import Notification
+from src.models.profile import Education, UserSkill, UserSocial, UserTag
+from src.models.project import Position, Project
+from src.models.tag import PositionTag, ProjectTag, Tag
 from src.models.user import User
 
 __all__ = [
     "BaseWithTimestamps",
     "Base",
     "User",
+    "Project",
+    "Position",
+    "Tag",
+    "ProjectTag",
+    "PositionTag",
+    "UserSkill",
+    "UserTag",
+    "UserSocial",
+    "Education",
+    "Notification",
+    "NotificationType",
+    "ProjectStatus",
+    "PositionLevel",
+    "SocialPlatform",
+    "EducationDegree",
     "UserGender",
     "UserRole",
 ]
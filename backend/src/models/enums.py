@@ -40,3 +40,39 @@ class UserTimezone(enum.Enum):
     UTC_12_P = "UTC_12_P"
     UTC_13_P = "UTC_13_P"
     UTC_14_P = "UTC_14_P"
+
+
+class ProjectStatus(enum.Enum):
+    OPEN = "open"
+    CLOSED = "closed"
+    DRAFT = "draft"
+
+
+class PositionLevel(enum.Enum):
+    JUNIOR = "junior"
+    MIDDLE = "middle"
+    SENIOR = "senior"
+
+
+class NotificationType(enum.Enum):
+    APP_APPROVED = "app_approved"
+    APP_REJECTED = "app_rejected"
+    APP_RECEIVED = "app_received"
+    MEMBER_ADDED = "member_added"
+    PROJECT_STATUS = "project_status"
+    SYSTEM = "system"
+
+
+class SocialPlatform(enum.Enum):
+    TELEGRAM = "telegram"
+    VK = "vk"
+    GITHUB = "github"
+    WHATSAPP = "whatsapp"
+    OTHER = "other"
+
+
+class EducationDegree(enum.Enum):
+    BACHELOR = "Бакалавриат"
+    MASTER = "Магистратура"
+    SPECIALIST = "Специалитет"
+    PHD = "Аспирантура"
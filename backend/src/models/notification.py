@@ -0,0 +1,40 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import Boolean, Enum, ForeignKey, Index, String, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import BaseWithTimestamps
+from src.models.enums import NotificationType
+
+
+class Notification(BaseWithTimestamps):
+    __tablename__ = "notifications"
+    __table_args__ = (
+        # Лента уведомлений пользователя: keyset по (created_at, id).
+        Index("ix_notifications_user_created_at_id", "user_id", "created_at", "id"),
+        # Только непрочитанные: компактный частичный индекс для
+        # only_unread и пересчёта счётчика при промахе кэша.
+        Index(
+            "ix_notifications_user_unread",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_read"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    type: Mapped[NotificationType] = mapped_column(
+        Enum(NotificationType), nullable=False
+    )
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    text: Mapped[str | None] = mapped_column(Text)
+    link_text: Mapped[str | None] = mapped_column(String(100))
+    link_url: Mapped[str | None] = mapped_column(String)
+    project_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("projects.id", ondelete="SET NULL")
+    )
+    application_id: Mapped[UUID | None]
+    is_read: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
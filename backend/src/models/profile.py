@@ -0,0 +1,64 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import Enum, ForeignKey, Index, SmallInteger, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base, BaseWithTimestamps
+from src.models.enums import EducationDegree, SocialPlatform
+
+
+class UserSkill(Base):
+    __tablename__ = "user_skills"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    name: Mapped[str] = mapped_column(String(48), primary_key=True)
+
+
+class UserTag(Base):
+    """Теги пользователя из общего словаря tags.
+
+    Ключ начинается с user_id — профиль читает теги одного
+    пользователя; индекс по tag_id нужен для поиска людей по тегу.
+    """
+
+    __tablename__ = "user_tags"
+    __table_args__ = (Index("ix_user_tags_tag_id", "tag_id"),)
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class UserSocial(Base):
+    __tablename__ = "user_socials"
+    __table_args__ = (Index("ix_user_socials_user_id", "user_id"),)
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    platform: Mapped[SocialPlatform] = mapped_column(
+        Enum(SocialPlatform), nullable=False
+    )
+    username: Mapped[str] = mapped_column(String(64), nullable=False)
+    url: Mapped[str | None] = mapped_column(String)
+
+
+class Education(BaseWithTimestamps):
+    __tablename__ = "educations"
+    __table_args__ = (Index("ix_educations_user_id", "user_id"),)
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    university: Mapped[str] = mapped_column(String, nullable=False)
+    specialty: Mapped[str] = mapped_column(String, nullable=False)
+    degree: Mapped[EducationDegree] = mapped_column(
+        Enum(EducationDegree), nullable=False
+    )
+    graduation_year: Mapped[int] = mapped_column(SmallInteger, nullable=False)
@@ -0,0 +1,100 @@
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    Boolean,
+    Computed,
+    Enum,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from src.models.base import BaseWithTimestamps
+from src.models.enums import PositionLevel, ProjectStatus
+
+# Конфигурация "russian" стеммит кириллицу и отдаёт латиницу english_stem.
+SEARCH_CONFIG = "russian"
+
+
+class Project(BaseWithTimestamps):
+    __tablename__ = "projects"
+    __table_args__ = (
+        # Ключ keyset-пагинации ленты: WHERE status = ? AND (created_at, id) < (?, ?)
+        # ORDER BY created_at DESC, id DESC читается обратным проходом по индексу.
+        Index(
+            "ix_projects_status_created_at_id",
+            "status",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_projects_owner_created_at_id",
+            "owner_id",
+            "created_at",
+            "id",
+        ),
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+        # Нечёткий поиск по началу слова в названии (требует расширения pg_trgm).
+        Index(
+            "ix_projects_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    owner_id: Mapped[int] = mapped_column(
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    description: Mapped[str | None] = mapped_column(Text)
+    tags: Mapped[list[str]] = mapped_column(
+        ARRAY(String), nullable=False, server_default="{}"
+    )
+    status: Mapped[ProjectStatus] = mapped_column(
+        Enum(ProjectStatus), nullable=False, default=ProjectStatus.OPEN
+    )
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
+    positions: Mapped[list["Position"]] = relationship(
+        back_populates="project",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Position.created_at",
+    )
+
+
+class Position(BaseWithTimestamps):
+    __tablename__ = "positions"
+    __table_args__ = (
+        Index(
+            "ix_positions_project_is_open_created_at",
+            "project_id",
+            "is_open",
+            "created_at",
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid4)
+    project_id: Mapped[UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), nullable=False
+    )
+    role: Mapped[str] = mapped_column(String(100), nullable=False)
+    level: Mapped[PositionLevel] = mapped_column(Enum(PositionLevel), nullable=False)
+    tags: Mapped[list[str]] = mapped_column(
+        ARRAY(String), nullable=False, server_default="{}"
+    )
+    is_open: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+
+    project: Mapped[Project] = relationship(back_populates="positions")
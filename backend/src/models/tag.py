@@ -0,0 +1,51 @@
+from uuid import UUID
+
+from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+from src.models.base import Base
+
+
+class Tag(Base):
+    """Словарь тегов.
+
+    Имя хранится в нормализованном виде (casefold, без лишних пробелов),
+    поэтому "Python" и "python " — один и тот же тег.
+    """
+
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    name: Mapped[str] = mapped_column(String, unique=True, nullable=False)
+
+
+class ProjectTag(Base):
+    """Постинг-листы тегов проектов.
+
+    Первичный ключ начинается с tag_id: проекты с тегом читаются одним
+    диапазоном индекса, а пересечение нескольких тегов — это
+    пересечение таких диапазонов.
+    """
+
+    __tablename__ = "project_tags"
+    __table_args__ = (Index("ix_project_tags_project_id", "project_id"),)
+
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
+    project_id: Mapped[UUID] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class PositionTag(Base):
+    """Постинг-листы тегов позиций проекта (role_tags в ленте)."""
+
+    __tablename__ = "position_tags"
+    __table_args__ = (Index("ix_position_tags_position_id", "position_id"),)
+
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
+    position_id: Mapped[UUID] = mapped_column(
+        ForeignKey("positions.id", ondelete="CASCADE"), primary_key=True
+    )
@@ -1,7 +1,9 @@
-from sqlalchemy import Boolean, Enum, Integer, String
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Boolean, Enum, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models.base import BaseWithTimestamps
 from src.models.enums import UserGender, UserRole, UserTimezone
+from src.models.profile import Education, UserSkill, UserSocial
+from src.models.tag import Tag
 
 
 class User(BaseWithTimestamps):
@@ -19,3 +21,32 @@ class User(BaseWithTimestamps):
     notifications: Mapped[bool] = mapped_column(Boolean, default=True)
     timezone: Mapped[UserTimezone | None]
     avatar: Mapped[str | None]
+
+    first_name: Mapped[str | None] = mapped_column(String(64))
+    last_name: Mapped[str | None] = mapped_column(String(64))
+    middle_name: Mapped[str | None] = mapped_column(String(64))
+    position: Mapped[str | None] = mapped_column(String(100))
+    about: Mapped[str | None] = mapped_column(Text)
+    looking_for_projects: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default="false"
+    )
+    contact_email: Mapped[str | None] = mapped_column(String)
+
+    skills: Mapped[list[UserSkill]] = relationship(
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by=UserSkill.name,
+    )
+    tags: Mapped[list[Tag]] = relationship(
+        secondary="user_tags", order_by=Tag.name, viewonly=True
+    )
+    socials: Mapped[list[UserSocial]] = relationship(
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by=UserSocial.platform,
+    )
+    educations: Mapped[list[Education]] = relationship(
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by=Education.graduation_year.desc(),
+    )
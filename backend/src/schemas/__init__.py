@@ -1,8 +1,15 @@
-from src.schemas.auth import AuthResponse, EmptyModel, LoginRequest, VerifyCodeRequest
+from src.schemas.auth import (
+    AuthResponse,
+    EmptyModel,
+    LoginRequest,
+    RefreshRequest,
+    VerifyCodeRequest,
+)
 
 __all__ = [
     "LoginRequest",
     "VerifyCodeRequest",
     "AuthResponse",
+    "RefreshRequest",
     "EmptyModel",
 ]
@@ -3,6 +3,7 @@ from pydantic import BaseModel, EmailStr, field_validator
 
 class AuthResponse(BaseModel):
     token: str
+    refresh_token: str
 
 
 class LoginRequest(BaseModel):
@@ -18,5 +19,9 @@ class VerifyCodeRequest(LoginRequest):
     code: str
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class EmptyModel(BaseModel):
     pass
@@ -16,7 +16,7 @@ class NotificationType(str, Enum):
 
 class Notification(BaseModel):
     id: UUID
-    user_id: UUID
+    user_id: int
     type: NotificationType
     title: str
     text: str | None = None
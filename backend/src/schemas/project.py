@@ -18,7 +18,7 @@ class Level(str, Enum):
 
 
 class ProjectMember(BaseModel):
-    user_id: UUID
+    user_id: int
     full_name: str
     avatar_url: HttpUrl | None = None
     roles: list[str]
@@ -45,7 +45,7 @@ class ProjectCard(BaseModel):
 
 class Project(BaseModel):
     id: UUID
-    owner_id: UUID
+    owner_id: int
     title: str
     description: str | None = None
     tags: list[str]
@@ -52,7 +52,7 @@ class Project(BaseModel):
 
 
 class UserProfileResponse(BaseModel):
-    id: UUID
+    id: int
     first_name: str
     last_name: str
     middle_name: Optional[str] = None
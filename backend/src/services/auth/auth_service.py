@@ -1,15 +1,22 @@
 import random
 from datetime import timedelta
+from uuid import uuid4
 
 from fastapi import Depends
 from src.config import settings
 from src.core.auth import TokenService
+from src.core.auth.refresh_sessions import RefreshSessionStore, get_refresh_sessions
+from src.core.auth.token_verifier import access_token_verifier
 from src.core.dependencies import get_store
-from src.core.exceptions import InvalidCodeException
+from src.core.exceptions import InvalidCodeException, InvalidTokenException
+from src.core.logger import get_logger
 from src.crud import Store
 from src.schemas import AuthResponse
-from src.tasks import send_code_task
+from src.tasks import enqueue, send_codes_task
 from src.utils.confirm_code_service import ConfirmCodeService
+from src.utils.mail_outbox import MailOutbox
+
+logger = get_logger()
 
 
 class AuthService:
@@ -30,6 +37,8 @@ class AuthService:
         self,
         store: Store = Depends(get_store),
         sms_service: ConfirmCodeService = Depends(),
+        mail_outbox: MailOutbox = Depends(),
+        sessions: RefreshSessionStore = Depends(get_refresh_sessions),
     ):
         """Инициализация сервиса пользователей.
 
@@ -38,25 +47,53 @@ class AuthService:
         """
         self._store = store
         self._sms_service = sms_service
+        self._mail_outbox = mail_outbox
+        self._sessions = sessions
 
     async def send_confirm_code(self, email: str):
         code = self.generate_code()
         await self._sms_service.save(email=email, code=code)
-        send_code_task.delay(email=email, code=str(code))
+        if await self._mail_outbox.push({"email": email, "code": str(code)}):
+            await enqueue(send_codes_task)
 
     async def verify_code(self, email: str, code: str) -> AuthResponse:
-        is_success_code = await self._sms_service.verify(
+        is_success_code = await self._sms_service.consume(
             email=email, submitted_code=code
         )
 
         if not is_success_code:
             raise InvalidCodeException
 
-        await self._sms_service.delete(email=email)
-
         user_id = await self._store.user.get_or_create(email=email)
 
-        return self.create_tokens({"sub": str(user_id), "type": "CLIENT"})
+        return await self.create_tokens(user_id)
+
+    async def refresh(self, refresh_token: str) -> AuthResponse:
+        """Обменивает refresh-токен на новую пару токенов той же сессии.
+
+        Raises:
+            InvalidTokenException: Токен не refresh, сессия отозвана или
+                истекла, либо токен уже был использован (тогда сессия
+                отзывается целиком).
+        """
+        payload = TokenService.get_token_payload(refresh_token, is_refresh=True)
+        if payload.get("type") != "REFRESH":
+            raise InvalidTokenException
+
+        sid = payload["sid"]
+        result, jti = await self._sessions.rotate(sid, payload["jti"])
+        if result == RefreshSessionStore.REUSED:
+            logger.warning("refresh token reuse", user_id=payload["sub"], sid=sid)
+        if result != RefreshSessionStore.ROTATED:
+            raise InvalidTokenException
+
+        return self._issue_tokens(int(payload["sub"]), sid, jti)
+
+    async def logout(self, access_payload: dict) -> None:
+        """Отзывает текущий access-токен и сессию его refresh-токенов."""
+        await access_token_verifier.revoke(access_payload)
+        if sid := access_payload.get("sid"):
+            await self._sessions.revoke(sid)
 
     @staticmethod
     def generate_code(length: int = 5) -> int:
@@ -65,15 +102,33 @@ class AuthService:
         max_val = 10**length - 1
         return random.randint(min_val, max_val)
 
-    @staticmethod
-    def create_tokens(data: dict) -> AuthResponse:
-        """Создание access и refresh токенов"""
-        access_token_expires = timedelta(days=settings.ACCESS_TOKEN_EXPIRE_DAYS)
+    async def create_tokens(self, user_id: int) -> AuthResponse:
+        """Открывает новую сессию и выдаёт access и refresh токены"""
+        sid, jti = await self._sessions.create(user_id)
+        return self._issue_tokens(user_id, sid, jti)
 
+    @staticmethod
+    def _issue_tokens(user_id: int, sid: str, refresh_jti: str) -> AuthResponse:
+        """Создание короткоживущего access и refresh токенов сессии"""
         access_token = TokenService.create_token(
-            data=data,
-            expires_delta=access_token_expires,
+            data={
+                "sub": str(user_id),
+                "type": "CLIENT",
+                "sid": sid,
+                "jti": uuid4().hex,
+            },
+            expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
             secret_key=settings.ACCESS_SECRET_KEY,
         )
+        refresh_token = TokenService.create_token(
+            data={
+                "sub": str(user_id),
+                "type": "REFRESH",
+                "sid": sid,
+                "jti": refresh_jti,
+            },
+            expires_delta=timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS),
+            secret_key=settings.REFRESH_SECRET_KEY,
+        )
 
-        return AuthResponse(token=access_token)
+        return AuthResponse(token=access_token, refresh_token=refresh_token)
@@ -0,0 +1,11 @@
+from src.services.notification.notification_service import (
+    NotificationService,
+    get_notification_count_service,
+    get_notification_read_service,
+)
+
+__all__ = [
+    "NotificationService",
+    "get_notification_count_service",
+    "get_notification_read_service",
+]
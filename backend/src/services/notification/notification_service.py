@@ -0,0 +1,153 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Depends
+from src.core.dependencies import get_primary_read_store, get_read_store, get_store
+from src.core.pubsub import PubSubHub, get_hub
+from src.crud import Store
+from src.models import NotificationType
+from src.schemas.notifications import NotificationsPage
+from src.tasks import enqueue, flush_notifications_task
+from src.tasks.notifications import FLUSH_DELAY_SECONDS
+from src.utils.notification_outbox import NotificationOutbox
+from src.utils.notifications import notification_channel, to_notification_schema
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.unread_counter_service import UnreadCounterService
+
+
+class NotificationService:
+    """Сервис уведомлений пользователя.
+
+    Хранит уведомления в Postgres и поддерживает счётчик непрочитанных
+    в Redis, чтобы частый опрос unread-count не обращался к БД.
+
+    Используется в:
+    - Эндпоинтах уведомлений
+    - Других сервисах для отправки уведомлений
+    """
+
+    def __init__(
+        self,
+        store: Store = Depends(get_store),
+        counter: UnreadCounterService = Depends(),
+        hub: PubSubHub = Depends(get_hub),
+        outbox: NotificationOutbox = Depends(),
+    ):
+        """Инициализация сервиса уведомлений.
+
+        Args:
+            store: Хранилище данных, используемое для операций с уведомлениями.
+            counter: Счётчик непрочитанных уведомлений.
+            hub: Pub/sub для доставки уведомлений открытым соединениям.
+            outbox: Буфер событий для пакетной рассылки.
+        """
+        self._store = store
+        self._counter = counter
+        self._hub = hub
+        self._outbox = outbox
+
+    async def notify(
+        self, user_id: int, type: NotificationType, title: str, **fields
+    ) -> None:
+        """Создаёт уведомление, увеличивает счётчик непрочитанных и
+        публикует его в канал пользователя для потоковой доставки."""
+        notification = await self._store.notification.add(
+            user_id=user_id, type=type, title=title, **fields
+        )
+        await self._store.session.commit()
+        await self._counter.incr(user_id)
+        if self._hub is not None:
+            await self._hub.publish(
+                notification_channel(user_id),
+                to_notification_schema(notification).model_dump_json(),
+            )
+
+    async def notify_many(
+        self,
+        user_ids: list[int],
+        type: NotificationType,
+        title: str,
+        **fields,
+    ) -> None:
+        """Ставит уведомление для нескольких получателей в очередь.
+
+        Используется для событий, расходящихся по всей команде проекта:
+        запрос только кладёт событие в буфер Redis, а запись в БД,
+        дедупликацию, счётчики и публикацию выполняет пачками
+        flush_notifications_task.
+        """
+        if not user_ids:
+            return
+        event = {"user_ids": list(user_ids), "type": type.value, "title": title}
+        event.update(fields)
+        if await self._outbox.push(event):
+            await enqueue(flush_notifications_task, countdown=FLUSH_DELAY_SECONDS)
+
+    async def list(
+        self, user_id: int, *, only_unread: bool, limit: int, cursor: str | None
+    ) -> NotificationsPage:
+        """Возвращает страницу уведомлений пользователя."""
+        after = decode_cursor(cursor, datetime, UUID) if cursor else None
+        items = await self._store.notification.get_page(
+            user_id, limit=limit, after=after, only_unread=only_unread
+        )
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+        return NotificationsPage(
+            items=[to_notification_schema(n) for n in items],
+            next_cursor=next_cursor,
+        )
+
+    async def mark_read(self, user_id: int, notification_id: UUID) -> None:
+        """Отмечает уведомление прочитанным."""
+        if await self._store.notification.mark_read(user_id, notification_id):
+            await self._store.session.commit()
+            await self._counter.decr(user_id)
+
+    async def mark_all_read(self, user_id: int) -> None:
+        """Отмечает все уведомления пользователя прочитанными."""
+        await self._store.notification.mark_all_read(user_id)
+        await self._store.session.commit()
+        await self._counter.reset(user_id)
+
+    async def unread_count(self, user_id: int) -> int:
+        """Возвращает число непрочитанных уведомлений.
+
+        Значение берётся из Redis; COUNT по частичному индексу
+        выполняется только если счётчик ещё не посчитан или истёк.
+        Пересчёт кэшируется, только если за время COUNT не пришло
+        ни одного изменения счётчика.
+        """
+        count, version = await self._counter.get(user_id)
+        if count is None:
+            count = await self._store.notification.count_unread(user_id)
+            await self._counter.store(user_id, count, version)
+        return count
+
+
+def get_notification_read_service(
+    store: Store = Depends(get_read_store),
+    counter: UnreadCounterService = Depends(),
+    hub: PubSubHub = Depends(get_hub),
+    outbox: NotificationOutbox = Depends(),
+) -> NotificationService:
+    """NotificationService для GET-эндпоинтов, читающий с реплики."""
+    return NotificationService(store=store, counter=counter, hub=hub, outbox=outbox)
+
+
+def get_notification_count_service(
+    store: Store = Depends(get_primary_read_store),
+    counter: UnreadCounterService = Depends(),
+    hub: PubSubHub = Depends(get_hub),
+    outbox: NotificationOutbox = Depends(),
+) -> NotificationService:
+    """NotificationService для unread-count, пересчитывающий по primary.
+
+    Пересчёт кэшируется на час, поэтому отставание реплики
+    не должно попасть в значение счётчика.
+    """
+    return NotificationService(store=store, counter=counter, hub=hub, outbox=outbox)
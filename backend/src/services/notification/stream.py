@@ -0,0 +1,37 @@
+import asyncio
+from typing import AsyncIterator
+
+from fastapi import Request
+from src.config import settings
+from src.core.pubsub import PubSubHub
+from src.utils.notifications import notification_channel
+
+
+async def notification_events(
+    hub: PubSubHub, request: Request, user_id: int
+) -> AsyncIterator[str]:
+    """Поток Server-Sent Events с уведомлениями пользователя.
+
+    События:
+    - notification — новое уведомление (JSON схемы Notification);
+    - resync — клиент не успевал читать и часть событий отброшена,
+      нужно перечитать /notifications и /notifications/unread-count.
+
+    Раз в REALTIME_HEARTBEAT_SECONDS отправляется комментарий-пинг,
+    чтобы прокси не закрывали соединение и разрыв обнаруживался быстро.
+    """
+    async with hub.subscribe(notification_channel(user_id)) as subscription:
+        yield "retry: 5000\n\n"
+        while not await request.is_disconnected():
+            if subscription.overflowed:
+                subscription.overflowed = False
+                yield "event: resync\ndata: {}\n\n"
+            try:
+                message = await asyncio.wait_for(
+                    subscription.queue.get(),
+                    timeout=settings.REALTIME_HEARTBEAT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            yield f"event: notification\ndata: {message}\n\n"
@@ -0,0 +1,11 @@
+from src.services.project.project_service import (
+    ProjectService,
+    get_project_cache_service,
+    get_project_read_service,
+)
+
+__all__ = [
+    "ProjectService",
+    "get_project_cache_service",
+    "get_project_read_service",
+]
@@ -0,0 +1,333 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import func
+from src.core.dependencies import (
+    get_primary_read_store,
+    get_read_store,
+    get_store,
+)
+from src.core.exceptions import NotFoundException
+from src.core.response_cache import PROJECT_FEED_TAG, project_tag, response_cache
+from src.crud import Store
+from src.models import NotificationType, PositionLevel, Project, ProjectStatus, User
+from src.schemas.project import (
+    Level,
+    ProjectCard,
+    ProjectCreate,
+    ProjectMember,
+    ProjectPosition,
+    ProjectsPage,
+    ProjectUpdate,
+)
+from src.schemas.project import Project as ProjectSchema
+from src.schemas.project import ProjectStatus as ProjectStatusSchema
+from src.services.notification import NotificationService
+from src.utils.pagination import decode_cursor, encode_cursor
+from src.utils.profile_snapshots import ProfileSnapshotService
+from src.utils.tags import normalize_tags
+
+_STATUS_TITLES = {
+    ProjectStatusSchema.open: "открыт",
+    ProjectStatusSchema.closed: "закрыт",
+    ProjectStatusSchema.draft: "снят с публикации",
+}
+
+
+class ProjectService:
+    """Сервис для работы с проектами.
+
+    Собирает страницы ленты проектов поверх ProjectDAO и отвечает
+    за кодирование keyset-курсоров, которые видит клиент.
+
+    Используется в:
+    - Эндпоинтах проектов
+    """
+
+    def __init__(
+        self,
+        store: Store = Depends(get_store),
+        snapshots: ProfileSnapshotService = Depends(),
+        notifications: NotificationService | None = Depends(NotificationService),
+    ):
+        """Инициализация сервиса проектов.
+
+        Args:
+            store: Хранилище данных, используемое для операций с проектами.
+            snapshots: Снимки профилей; в профиль владельца входят его
+                проекты, поэтому запись проекта сбрасывает снимок.
+            notifications: Уведомления команды о смене статуса; не нужны
+                сервисам, которые только читают.
+        """
+        self._store = store
+        self._snapshots = snapshots
+        self._notifications = notifications
+
+    async def create(self, owner: User, payload: ProjectCreate) -> ProjectSchema:
+        """Создаёт проект с позициями и тегами.
+
+        Число запросов к БД постоянно и не зависит от количества позиций
+        и тегов: словарь тегов, проект, все позиции и все постинг-записи
+        пишутся пакетно.
+        """
+        project_tags = normalize_tags(payload.tags)
+        positions_tags = [normalize_tags(p.tags) for p in payload.positions]
+        tag_ids = await self._store.tag.ensure(
+            project_tags + [t for tags in positions_tags for t in tags]
+        )
+
+        project = await self._store.project.add(
+            owner_id=owner.id,
+            title=payload.title,
+            description=payload.description,
+            tags=project_tags,
+        )
+        positions = await self._store.position.add_many(
+            [
+                {
+                    "project_id": project.id,
+                    "role": p.role,
+                    "level": PositionLevel(p.level.value),
+                    "tags": tags,
+                }
+                for p, tags in zip(payload.positions, positions_tags)
+            ]
+        )
+        await self._store.tag.add_project_postings(
+            project.id, [tag_ids[t] for t in project_tags]
+        )
+        await self._store.tag.add_position_postings(
+            {
+                position.id: [tag_ids[t] for t in tags]
+                for position, tags in zip(positions, positions_tags)
+            }
+        )
+
+        await self._store.session.commit()
+        await response_cache.invalidate(PROJECT_FEED_TAG)
+        await self._snapshots.bump(owner.id)
+        return self.to_schema(project, positions, team=[self.owner_member(owner)])
+
+    async def get(self, project_id: UUID) -> ProjectSchema:
+        """Возвращает публичную карточку проекта.
+
+        Raises:
+            NotFoundException: Если проекта нет или он черновик.
+        """
+        row = await self._store.project.get_detail(project_id)
+        if row is None or row.Project.status == ProjectStatus.DRAFT:
+            raise NotFoundException
+        project, owner = row
+        return self.to_schema(
+            project, project.positions, team=[self.owner_member(owner)]
+        )
+
+    async def update(
+        self, project_id: UUID, owner: User, payload: ProjectUpdate
+    ) -> ProjectSchema:
+        """Обновляет проект владельца."""
+        data = {
+            k: v
+            for k, v in payload.model_dump(exclude_unset=True).items()
+            if v is not None or k == "description"
+        }
+        if "status" in data:
+            data["status"] = ProjectStatus(data["status"].value)
+        if "tags" in data:
+            data["tags"] = normalize_tags(data["tags"])
+        # updated_at обновляется явно, чтобы UPDATE с пустым payload тоже
+        # проверял владельца и не был пустым.
+        await self._store.project.update_owned(
+            project_id, owner.id, updated_at=func.now(), **data
+        )
+
+        if "tags" in data:
+            tag_ids = await self._store.tag.ensure(data["tags"])
+            await self._store.tag.set_project_tags(
+                project_id, [tag_ids[t] for t in data["tags"]]
+            )
+        return await self._after_write(project_id, owner)
+
+    async def set_status(
+        self, project_id: UUID, owner: User, status: ProjectStatusSchema
+    ) -> ProjectSchema:
+        """Меняет статус проекта владельца и оповещает его команду."""
+        await self._store.project.update_owned(
+            project_id, owner.id, status=ProjectStatus(status.value)
+        )
+        project = await self._after_write(project_id, owner)
+        await self._notifications.notify_many(
+            [member.user_id for member in project.team],
+            NotificationType.PROJECT_STATUS,
+            title=f"Проект «{project.title}» {_STATUS_TITLES[project.status]}",
+            project_id=project.id,
+        )
+        return project
+
+    async def delete(self, project_id: UUID, owner: User) -> None:
+        """Удаляет проект владельца."""
+        await self._store.project.delete_owned(project_id, owner.id)
+        await self._store.session.commit()
+        await response_cache.invalidate(project_tag(project_id), PROJECT_FEED_TAG)
+        await self._snapshots.bump(owner.id)
+
+    async def _after_write(self, project_id: UUID, owner: User) -> ProjectSchema:
+        """Фиксирует изменения, сбрасывает кэш ответов и снимок профиля
+        владельца и читает проект заново."""
+        await self._store.session.commit()
+        await response_cache.invalidate(project_tag(project_id), PROJECT_FEED_TAG)
+        await self._snapshots.bump(owner.id)
+        project, _ = await self._store.project.get_detail(project_id)
+        return self.to_schema(
+            project, project.positions, team=[self.owner_member(owner)]
+        )
+
+    async def list_open(
+        self,
+        *,
+        q: str | None,
+        role_tags: str | None,
+        limit: int,
+        cursor: str | None,
+    ) -> ProjectsPage:
+        """Возвращает страницу открытых проектов.
+
+        При непустом q выдача идёт через полнотекстовый поиск и
+        сортируется по рангу, иначе — лента от новых к старым.
+        """
+        tag_ids = None
+        if tags := self.parse_tags(role_tags):
+            known = await self._store.tag.get_ids(tags)
+            if len(known) < len(tags):
+                # Неизвестный тег не может быть ни у одной позиции.
+                return ProjectsPage(items=[])
+            tag_ids = list(known.values())
+
+        if q and q.strip():
+            return await self._search_page(
+                q=q, limit=limit, cursor=cursor, role_tag_ids=tag_ids
+            )
+        return await self._feed_page(
+            limit=limit,
+            cursor=cursor,
+            status=ProjectStatus.OPEN,
+            role_tag_ids=tag_ids,
+        )
+
+    async def list_owned(
+        self,
+        *,
+        owner_id: int,
+        status: ProjectStatusSchema | None,
+        limit: int,
+        cursor: str | None,
+    ) -> ProjectsPage:
+        """Возвращает страницу проектов пользователя."""
+        return await self._feed_page(
+            limit=limit,
+            cursor=cursor,
+            status=ProjectStatus(status.value) if status else None,
+            owner_id=owner_id,
+        )
+
+    async def _feed_page(
+        self, *, limit: int, cursor: str | None, **filters
+    ) -> ProjectsPage:
+        after = decode_cursor(cursor, datetime, UUID) if cursor else None
+        rows = await self._store.project.get_feed(limit=limit, after=after, **filters)
+        return self._build_page(rows, limit, key=lambda r: (r.created_at, r.id))
+
+    async def _search_page(
+        self,
+        *,
+        q: str,
+        limit: int,
+        cursor: str | None,
+        role_tag_ids: list[int] | None,
+    ) -> ProjectsPage:
+        after = decode_cursor(cursor, float, UUID) if cursor else None
+        rows = await self._store.project_search.search(
+            q, limit=limit, after=after, role_tag_ids=role_tag_ids
+        )
+        return self._build_page(rows, limit, key=lambda r: (r.rank, r.id))
+
+    @staticmethod
+    def _build_page(rows, limit: int, key) -> ProjectsPage:
+        """Отрезает лишнюю (limit + 1)-ю строку и кодирует курсор по её предшественнице."""
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(*key(rows[-1]))
+
+        return ProjectsPage(
+            items=[
+                ProjectCard.model_validate(row, from_attributes=True) for row in rows
+            ],
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def owner_member(owner: User) -> ProjectMember:
+        return ProjectMember(
+            user_id=owner.id,
+            full_name=owner.name or "",
+            roles=[],
+            tags=[],
+            is_owner=True,
+        )
+
+    @staticmethod
+    def to_schema(
+        project: Project, positions, team: list[ProjectMember]
+    ) -> ProjectSchema:
+        return ProjectSchema(
+            id=project.id,
+            owner_id=project.owner_id,
+            title=project.title,
+            description=project.description,
+            tags=project.tags,
+            status=ProjectStatusSchema(project.status.value),
+            created_at=project.created_at,
+            updated_at=project.updated_at,
+            team=team,
+            positions=[
+                ProjectPosition(
+                    id=p.id,
+                    role=p.role,
+                    level=Level(p.level.value),
+                    tags=p.tags,
+                    is_open=p.is_open,
+                    created_at=p.created_at,
+                )
+                for p in positions
+            ],
+        )
+
+    @staticmethod
+    def parse_tags(raw: str | None) -> list[str]:
+        """Разбирает список тегов из строки запроса вида "python,backend"."""
+        if not raw:
+            return []
+        return normalize_tags(raw.split(","))
+
+
+def get_project_read_service(
+    store: Store = Depends(get_read_store),
+    snapshots: ProfileSnapshotService = Depends(),
+) -> ProjectService:
+    """ProjectService для GET-эндпоинтов, читающий с реплики."""
+    return ProjectService(store=store, snapshots=snapshots, notifications=None)
+
+
+def get_project_cache_service(
+    store: Store = Depends(get_primary_read_store),
+    snapshots: ProfileSnapshotService = Depends(),
+) -> ProjectService:
+    """ProjectService для перезагрузки кэша сразу после записи.
+
+    Читает с primary и используется, только пока тег ответа недавно
+    инвалидирован: строка с отстающей реплики пережила бы запись
+    в кэше на весь его TTL. Остальные промахи кэша идут на реплику.
+    """
+    return ProjectService(store=store, snapshots=snapshots, notifications=None)
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from src.core.db.database import get_async_db
 from src.crud import Store
 from src.services.auth import AuthService
+from src.services.project import ProjectService
 from src.services.user import UserService
 
 
@@ -31,6 +32,7 @@ class ServiceImpl:
         """
         self._user_service: UserService | None = None
         self._auth_service: AuthService | None = None
+        self._project_service: ProjectService | None = None
         self._store: Store | None = None
         self._session = session
 
@@ -63,6 +65,17 @@ class ServiceImpl:
             self._auth_service = AuthService(store=self.store)
         return self._auth_service
 
+    @property
+    def project(self):
+        """Возвращает сервис проектов.
+
+        Returns:
+            ProjectService: Сервис проектов.
+        """
+        if self._project_service is None:
+            self._project_service = ProjectService(store=self.store)
+        return self._project_service
+
     @property
     def session(self):
         """Возвращает асинхронную сессию базы данных.
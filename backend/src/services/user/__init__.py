@@ -1,5 +1,6 @@
-from src.services.user.user_service import UserService
+from src.services.user.user_service import UserService, get_user_read_service
 
 __all__ = [
     "UserService",
+    "get_user_read_service",
 ]
@@ -1,4 +1,33 @@
+from uuid import UUID
+
+from fastapi import Depends, UploadFile
+from src.core.auth.principal_cache import principal_cache
+from src.core.dependencies import get_primary_read_store, get_store
+from src.core.exceptions import NotFoundException
 from src.crud import Store
+from src.models import EducationDegree, User
+from src.models import SocialPlatform as SocialPlatformModel
+from src.schemas.user import (
+    ContactInfo,
+    ContactsUpdate,
+    Degree,
+    Education,
+    EducationCreate,
+    EducationUpdate,
+    ProfileCoreUpdate,
+    Project,
+    Skill,
+    SkillsReplace,
+    SocialLink,
+    SocialPlatform,
+    TagsReplace,
+    UserProfileResponse,
+)
+from src.utils.avatars import avatar_store
+from src.utils.profile_snapshots import ProfileSnapshotService
+from src.utils.tags import normalize_tags
+
+PROFILE_PROJECTS_LIMIT = 50
 
 
 class UserService:
@@ -14,10 +43,245 @@ class UserService:
     - ReferralService для создания реферальных связей
     """
 
-    def __init__(self, store: Store):
+    def __init__(
+        self,
+        store: Store = Depends(get_store),
+        snapshots: ProfileSnapshotService = Depends(),
+    ):
         """Инициализация сервиса пользователей.
 
         Args:
             store: Хранилище данных, используемое для операций с пользователями.
+            snapshots: Кэш готовых JSON-снимков профилей.
         """
         self._store = store
+        self._snapshots = snapshots
+
+    async def get_profile_json(self, user_id: int, public: bool = False) -> str:
+        """Возвращает профиль пользователя как готовый JSON.
+
+        При актуальном снимке в Redis не обращается к БД и не создаёт
+        Pydantic-модель; при промахе собирает профиль и сохраняет снимок.
+
+        Args:
+            public (bool): Профиль для других пользователей — без
+                контактных данных.
+        """
+        version, body = await self._snapshots.get(user_id, public)
+        if body is None:
+            profile = await self.get_profile(user_id)
+            if public:
+                profile = profile.model_copy(update={"contact_info": ContactInfo()})
+            body = profile.model_dump_json()
+            await self._snapshots.put(user_id, version, body, public)
+        return body
+
+    async def get_profile(self, user_id: int) -> UserProfileResponse:
+        """Собирает профиль пользователя.
+
+        Всегда выполняет одно и то же число запросов: пользователь,
+        по одному selectin-запросу на навыки, теги, соцсети и
+        образование, и один запрос проектов.
+
+        Raises:
+            NotFoundException: Если пользователя нет.
+        """
+        user = await self._store.user.get_profile(user_id)
+        if user is None:
+            raise NotFoundException
+        projects = await self._store.project.get_for_profile(
+            user_id, limit=PROFILE_PROJECTS_LIMIT
+        )
+        return self.to_profile_schema(user, projects)
+
+    async def update_core(
+        self, user_id: int, payload: ProfileCoreUpdate
+    ) -> UserProfileResponse:
+        """Изменяет основные поля профиля (переданные не None)."""
+        update_data = payload.model_dump(exclude_none=True)
+        if update_data:
+            await self._store.user.update(user_id, return_model=False, **update_data)
+        return await self._after_write(user_id, user_changed=True)
+
+    async def put_avatar(self, user_id: int, file: UploadFile) -> UserProfileResponse:
+        """Загружает аватар и готовит его уменьшенные версии.
+
+        Размер проверяется при чтении файла по частям, а декодирование
+        и ресайз выполняются в пуле процессов. Одинаковые изображения
+        хранятся и обрабатываются один раз (см. AvatarStore).
+
+        Raises:
+            PayloadTooLargeException: Файл больше AVATAR_MAX_BYTES.
+            InvalidImageException: Файл не является изображением.
+        """
+        avatar_url = await avatar_store.save(file)
+        await self._store.user.update(user_id, return_model=False, avatar=avatar_url)
+        return await self._after_write(user_id, user_changed=True)
+
+    async def put_contacts(
+        self, user_id: int, payload: ContactsUpdate
+    ) -> UserProfileResponse:
+        """Заменяет контактные данные и ссылки на соцсети."""
+        await self._store.user.update(
+            user_id,
+            return_model=False,
+            phone=payload.phone,
+            contact_email=payload.email,
+        )
+        await self._store.profile.set_socials(
+            user_id,
+            [
+                {
+                    "platform": SocialPlatformModel(s.platform.value),
+                    "username": s.username,
+                    "url": str(s.url) if s.url else None,
+                }
+                for s in payload.socials
+            ],
+        )
+        return await self._after_write(user_id, user_changed=True)
+
+    async def put_skills(
+        self, user_id: int, payload: SkillsReplace
+    ) -> UserProfileResponse:
+        """Заменяет навыки пользователя."""
+        changed = await self._store.profile.set_skills(
+            user_id, [s.name for s in payload.skills]
+        )
+        if not changed:
+            return await self._unchanged(user_id)
+        return await self._after_write(user_id)
+
+    async def put_tags(self, user_id: int, payload: TagsReplace) -> UserProfileResponse:
+        """Заменяет теги пользователя.
+
+        Сначала сравнивает имена с текущими тегами: автосохранение без
+        изменений не пишет ни в словарь тегов, ни в user_tags.
+        """
+        names = normalize_tags(payload.tags)
+        if set(names) == await self._store.profile.get_tag_names(user_id):
+            return await self._unchanged(user_id)
+        tag_ids = await self._store.tag.ensure(names)
+        changed = await self._store.profile.set_tags(user_id, list(tag_ids.values()))
+        if not changed:
+            return await self._unchanged(user_id)
+        return await self._after_write(user_id)
+
+    async def add_education(
+        self, user_id: int, payload: EducationCreate
+    ) -> UserProfileResponse:
+        """Добавляет запись об образовании."""
+        await self._store.profile.add(
+            return_model=False,
+            user_id=user_id,
+            university=payload.university,
+            specialty=payload.specialty,
+            degree=EducationDegree(payload.degree.value),
+            graduation_year=payload.graduation_year,
+        )
+        return await self._after_write(user_id)
+
+    async def update_education(
+        self, user_id: int, edu_id: UUID, payload: EducationUpdate
+    ) -> UserProfileResponse:
+        """Изменяет запись об образовании пользователя."""
+        update_data = payload.model_dump(exclude_none=True)
+        if "degree" in update_data:
+            update_data["degree"] = EducationDegree(payload.degree.value)
+        if update_data:
+            await self._store.profile.update_education(edu_id, user_id, **update_data)
+        return await self._after_write(user_id)
+
+    async def delete_education(self, user_id: int, edu_id: UUID) -> UserProfileResponse:
+        """Удаляет запись об образовании пользователя."""
+        await self._store.profile.delete_education(edu_id, user_id)
+        return await self._after_write(user_id)
+
+    async def _after_write(
+        self, user_id: int, user_changed: bool = False
+    ) -> UserProfileResponse:
+        """Фиксирует изменения, обновляет версию и снимок профиля.
+
+        Args:
+            user_changed (bool): Изменилась строка users — запись в кэше
+                аутентификации сбрасывается. Это делается только после
+                commit, иначе параллельный запрос успел бы закэшировать
+                старую строку.
+        """
+        await self._store.session.commit()
+        if user_changed:
+            await principal_cache.invalidate(user_id)
+        version = await self._snapshots.bump(user_id)
+        profile = await self.get_profile(user_id)
+        await self._snapshots.put(user_id, version, profile.model_dump_json())
+        return profile
+
+    async def _unchanged(self, user_id: int) -> UserProfileResponse:
+        """Возвращает профиль без смены версии, если данные не изменились.
+
+        Частые автосохранения с тем же содержимым не сбрасывают снимок
+        и обслуживаются из него.
+        """
+        await self._store.session.commit()
+        return UserProfileResponse.model_validate_json(
+            await self.get_profile_json(user_id)
+        )
+
+    @staticmethod
+    def to_profile_schema(user: User, projects) -> UserProfileResponse:
+        return UserProfileResponse(
+            id=user.id,
+            first_name=user.first_name or "",
+            last_name=user.last_name or "",
+            middle_name=user.middle_name,
+            avatar_url=user.avatar,
+            position=user.position,
+            about=user.about,
+            looking_for_projects=user.looking_for_projects,
+            tags=[tag.name for tag in user.tags],
+            skills=[Skill(name=skill.name) for skill in user.skills],
+            contact_info=ContactInfo(
+                phone=user.phone,
+                email=user.contact_email,
+                socials=[
+                    SocialLink(
+                        platform=SocialPlatform(social.platform.value),
+                        username=social.username,
+                        url=social.url,
+                    )
+                    for social in user.socials
+                ],
+            ),
+            education=[
+                Education(
+                    id=edu.id,
+                    university=edu.university,
+                    specialty=edu.specialty,
+                    degree=Degree(edu.degree.value),
+                    graduation_year=edu.graduation_year,
+                )
+                for edu in user.educations
+            ],
+            projects=[
+                Project(
+                    id=p.id,
+                    title=p.title,
+                    description=p.description,
+                    tags=p.tags,
+                )
+                for p in projects
+            ],
+        )
+
+
+def get_user_read_service(
+    store: Store = Depends(get_primary_read_store),
+    snapshots: ProfileSnapshotService = Depends(),
+) -> UserService:
+    """UserService для GET-эндпоинтов профиля.
+
+    Читает с primary: собранный профиль сохраняется как снимок новой
+    версии, и строка с отстающей реплики прожила бы в нём сутки.
+    При попадании в снимок сессия к БД не обращается.
+    """
+    return UserService(store=store, snapshots=snapshots)
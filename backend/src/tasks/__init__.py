@@ -1,3 +1,10 @@
-from src.tasks.verify_code import send_code_task
+from src.tasks.dispatch import enqueue, shutdown_dispatcher
+from src.tasks.notifications import flush_notifications_task
+from src.tasks.verify_code import send_codes_task
 
-__all__ = ["send_code_task"]
+__all__ = [
+    "enqueue",
+    "shutdown_dispatcher",
+    "send_codes_task",
+    "flush_notifications_task",
+]
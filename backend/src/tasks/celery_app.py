@@ -4,7 +4,15 @@ from src.config import settings
 celery_app = Celery(
     "tasks",
     broker=f"redis://:{settings.REDIS_PASSWORD}@{settings.REDIS_HOST}:{settings.REDIS_PORT}/0",
-    backend=f"redis://:{settings.REDIS_PASSWORD}@{settings.REDIS_HOST}:{settings.REDIS_PORT}/0",
+)
+
+# Результаты задач нигде не читаются, поэтому бэкенд результатов не
+# нужен. Письма с кодами входа идут в отдельную очередь со своим
+# воркером, чтобы не ждать за массовыми задачами уведомлений.
+celery_app.conf.update(
+    task_ignore_result=True,
+    task_routes={"src.tasks.verify_code.send_codes_task": {"queue": "mail_codes"}},
+    worker_prefetch_multiplier=1,
 )
 
 celery_app.autodiscover_tasks(["src.tasks"])
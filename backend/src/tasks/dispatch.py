@@ -0,0 +1,67 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from celery import Task
+from src.config import settings
+from src.core.logger import get_logger
+
+logger = get_logger()
+
+# Публикация в брокер у Celery синхронная (сетевой round-trip к Redis),
+# поэтому из обработчиков она выполняется в отдельном пуле потоков.
+# Свой пул, а не пул loop'а по умолчанию: медленный брокер не должен
+# занимать потоки, нужные остальному коду.
+_executor = ThreadPoolExecutor(
+    max_workers=settings.CELERY_DISPATCH_THREADS,
+    thread_name_prefix="celery-dispatch",
+)
+
+# Публикации, поставленные в пул и ещё не завершённые.
+_pending: set[asyncio.Future] = set()
+
+
+async def enqueue(
+    task: Task,
+    args: tuple = (),
+    kwargs: dict[str, Any] | None = None,
+    **options: Any,
+) -> None:
+    """Ставит задачу Celery в очередь, не дожидаясь брокера.
+
+    Публикация уходит в пул потоков, а вызывающий сразу продолжает
+    работу, поэтому задержка брокера не попадает в ответ. Ошибка
+    публикации только логируется. Если в пуле уже
+    CELERY_DISPATCH_MAX_PENDING незавершённых публикаций, вызов ждёт
+    свою публикацию: очередь пула не растёт без ограничений, а
+    event loop при этом не блокируется.
+
+    Args:
+        task (Task): Задача Celery.
+        args (tuple): Позиционные аргументы задачи.
+        kwargs (dict | None): Именованные аргументы задачи.
+        **options: Параметры apply_async (countdown, queue, priority...).
+    """
+    loop = asyncio.get_running_loop()
+    publish = functools.partial(task.apply_async, args=args, kwargs=kwargs, **options)
+    if len(_pending) >= settings.CELERY_DISPATCH_MAX_PENDING:
+        await loop.run_in_executor(_executor, publish)
+        return
+
+    future = loop.run_in_executor(_executor, publish)
+    _pending.add(future)
+    future.add_done_callback(functools.partial(_published, task.name))
+
+
+def _published(task_name: str, future: asyncio.Future) -> None:
+    _pending.discard(future)
+    if not future.cancelled() and future.exception() is not None:
+        logger.error(
+            "celery publish failed", task=task_name, error=str(future.exception())
+        )
+
+
+def shutdown_dispatcher() -> None:
+    """Дожидается публикации уже поставленных задач при остановке."""
+    _executor.shutdown(wait=True)
@@ -0,0 +1,125 @@
+import asyncio
+import hashlib
+from collections import Counter
+from uuid import UUID
+
+import redis.asyncio as redis
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+from src.config import settings
+from src.core.db.database import create_session_maker
+from src.core.db.redis_cache import RedisCache
+from src.core.db.serializers import get_serializer
+from src.core.logger import get_logger
+from src.crud import Store
+from src.models import NotificationType
+from src.tasks.celery_app import celery_app
+from src.utils.notification_outbox import NotificationOutbox
+from src.utils.notifications import notification_channel, to_notification_schema
+from src.utils.unread_counter_service import UnreadCounterService
+
+logger = get_logger()
+
+BATCH_SIZE = 500
+DEDUP_WINDOW_SECONDS = 30
+FLUSH_DELAY_SECONDS = 1
+
+
+def _dedup_key(user_id: int, event: dict) -> str:
+    raw = "|".join(
+        str(event.get(f))
+        for f in ("type", "title", "text", "project_id", "application_id")
+    )
+    return hashlib.blake2b(f"{user_id}|{raw}".encode(), digest_size=16).hexdigest()
+
+
+def _to_row(user_id: int, event: dict) -> dict:
+    return {
+        "user_id": user_id,
+        "type": NotificationType(event["type"]),
+        "title": event["title"],
+        "text": event.get("text"),
+        "link_text": event.get("link_text"),
+        "link_url": event.get("link_url"),
+        "project_id": UUID(event["project_id"]) if event.get("project_id") else None,
+        "application_id": (
+            UUID(event["application_id"]) if event.get("application_id") else None
+        ),
+    }
+
+
+async def flush_notifications() -> bool:
+    """Забирает пачку событий из буфера и записывает уведомления.
+
+    Все уведомления пачки пишутся одним многострочным INSERT в одной
+    транзакции. Если запись не удалась, пачка возвращается в начало
+    буфера, а задача перезапускается с задержкой. Счётчики
+    непрочитанных и публикации в pub/sub отправляются одним Redis
+    pipeline.
+
+    Returns:
+        bool: True, если в буфере, вероятно, остались события.
+    """
+    client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True,
+    )
+    engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        cache = RedisCache(client, serializer=get_serializer(settings.CACHE_SERIALIZER))
+        outbox = NotificationOutbox(cache)
+        events = await outbox.pop_batch(BATCH_SIZE)
+        if not events:
+            return False
+
+        # Одинаковые события внутри пачки схлопываются сразу, а между
+        # пачками — по ключам в Redis с окном DEDUP_WINDOW_SECONDS.
+        candidates = {}
+        for event in events:
+            for user_id in event["user_ids"]:
+                candidates.setdefault(_dedup_key(user_id, event), (user_id, event))
+        is_new = await outbox.claim_duplicates(list(candidates), DEDUP_WINDOW_SECONDS)
+        claimed = [key for key, new in zip(candidates, is_new) if new]
+        rows = [_to_row(*candidates[key]) for key in claimed]
+
+        if rows:
+            try:
+                async with create_session_maker(engine)() as session:
+                    notifications = await Store(session=session).notification.add_many(
+                        rows
+                    )
+                    await session.commit()
+            except Exception:
+                # До commit ничего не записано: пачка возвращается в буфер,
+                # а ключи дедупликации освобождаются для повторной попытки.
+                logger.exception("notification batch insert failed", total=len(rows))
+                await outbox.release_duplicates(claimed)
+                await outbox.requeue(events)
+                raise
+
+            counter = UnreadCounterService(cache)
+            async with cache.pipeline() as pipe:
+                counter.queue_incr_many(pipe, Counter(n.user_id for n in notifications))
+                for n in notifications:
+                    pipe.publish(
+                        notification_channel(n.user_id),
+                        to_notification_schema(n).model_dump_json(),
+                    )
+                await pipe.execute()
+
+        return len(events) == BATCH_SIZE
+    finally:
+        await engine.dispose()
+        await client.aclose()
+
+
+@celery_app.task(bind=True, max_retries=5, default_retry_delay=10, ignore_result=True)
+def flush_notifications_task(self):
+    try:
+        more = asyncio.run(flush_notifications())
+    except Exception as exc:
+        raise self.retry(exc=exc)
+    if more:
+        flush_notifications_task.apply_async(countdown=0)
@@ -1,9 +1,93 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+import redis.asyncio as redis
+from src.config import settings
+from src.core.db.redis_cache import RedisCache
+from src.core.logger import get_logger
+from src.core.mail import (
+    MailDeferredError,
+    MailRejectedError,
+    build_code_message,
+    get_mail_sender,
+)
 from src.tasks.celery_app import celery_app
+from src.utils.mail_outbox import MailOutbox
+
+logger = get_logger()
+
+BATCH_SIZE = 100
+
+
+@asynccontextmanager
+async def _outbox():
+    client = redis.Redis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        password=settings.REDIS_PASSWORD,
+        decode_responses=True,
+    )
+    try:
+        yield MailOutbox(RedisCache(client))
+    finally:
+        await client.aclose()
+
+
+async def _pop_batch() -> list[dict]:
+    async with _outbox() as outbox:
+        return await outbox.pop_batch(BATCH_SIZE)
+
+
+async def _requeue(messages: list[dict]) -> None:
+    async with _outbox() as outbox:
+        await outbox.push(*messages)
+
+
+def send_codes() -> bool:
+    """Отправить пачку писем с кодами из MailOutbox.
+
+    Все письма пачки уходят через одно соединение с почтовым сервером.
+    Письма, окончательно отклонённые сервером, отбрасываются.
+    Временно не принятые письма, а при ошибке соединения и все
+    оставшиеся, возвращаются в очередь, и задача перезапускается
+    с задержкой.
+
+    Returns:
+        bool: True, если в очереди, вероятно, остались письма.
+    """
+    messages = asyncio.run(_pop_batch())
+    if not messages:
+        return False
+
+    deferred = []
+    done = 0
+    try:
+        with get_mail_sender() as sender:
+            for message in messages:
+                try:
+                    sender.send(build_code_message(message["email"], message["code"]))
+                except MailRejectedError as exc:
+                    logger.warning(
+                        "code email rejected", email=message["email"], error=str(exc)
+                    )
+                except MailDeferredError:
+                    deferred.append(message)
+                done += 1
+    except Exception:
+        logger.exception("code email delivery failed", sent=done, total=len(messages))
+        asyncio.run(_requeue(deferred + messages[done:]))
+        raise
+    if deferred:
+        asyncio.run(_requeue(deferred))
+        raise MailDeferredError(f"{len(deferred)} code emails deferred")
+    return len(messages) == BATCH_SIZE
 
 
-@celery_app.task(bind=True, max_retries=3, default_retry_delay=20)
-def send_code_task(self, email: str, code: str):
+@celery_app.task(bind=True, max_retries=3, default_retry_delay=20, ignore_result=True)
+def send_codes_task(self):
     try:
-        print(email, code)
+        more = send_codes()
     except Exception as exc:
         raise self.retry(exc=exc)
+    if more:
+        send_codes_task.apply_async(countdown=0)
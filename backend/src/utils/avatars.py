@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import io
+import multiprocessing
+import os
+import tempfile
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+
+from fastapi import UploadFile
+from PIL import Image, ImageOps
+from src.config import settings
+from src.core.db import redis_cache as redis_cache_module
+from src.core.exceptions import InvalidImageException, PayloadTooLargeException
+from src.core.storage import ObjectStorage, object_storage, private_object_storage
+
+AVATAR_FORMAT = "webp"
+AVATAR_CONTENT_TYPE = "image/webp"
+# Размер, на который указывает avatar_url профиля.
+AVATAR_DEFAULT_SIZE = 256
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_upload(file: UploadFile) -> AsyncIterator[bytes]:
+    """Читает загруженный файл кусками по UPLOAD_CHUNK_SIZE."""
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        yield chunk
+
+
+async def iter_path(path: str) -> AsyncIterator[bytes]:
+    """Читает файл на диске кусками по UPLOAD_CHUNK_SIZE."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+
+def render_avatar(
+    path: str, sizes: list[int], max_pixels: int
+) -> tuple[str, dict[int, bytes]]:
+    """Готовит квадратные WebP-версии аватара для каждого размера.
+
+    Выполняется в отдельном процессе: декодирование и ресайз изображения
+    занимают CPU на десятки миллисекунд. Процесс получает путь к файлу,
+    а не его содержимое, поэтому байты не пересылаются между процессами.
+
+    Хэш считается по пикселям нормализованного изображения наибольшего
+    размера, поэтому те же пиксели в другом контейнере без потерь
+    (PNG, BMP) или с другими метаданными получают тот же ключ.
+
+    Returns:
+        tuple[str, dict[int, bytes]]: Хэш изображения и
+            размер стороны -> содержимое файла.
+
+    Raises:
+        ValueError: Файл не является изображением или слишком велик.
+    """
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    try:
+        with Image.open(path) as image:
+            image = ImageOps.exif_transpose(image)
+            image = image.convert("RGBA" if image.has_transparency_data else "RGB")
+            side = min(image.size)
+            image = ImageOps.fit(image, (side, side), method=Image.Resampling.LANCZOS)
+            digest = None
+            result = {}
+            for size in sorted(sizes, reverse=True):
+                image.thumbnail((size, size), Image.Resampling.LANCZOS)
+                if digest is None:
+                    digest = hashlib.blake2b(
+                        f"{image.mode}:{image.size}".encode() + image.tobytes(),
+                        digest_size=16,
+                    ).hexdigest()
+                out = io.BytesIO()
+                image.save(out, format=AVATAR_FORMAT, quality=85, method=4)
+                result[size] = out.getvalue()
+            return digest, result
+    except (OSError, Image.DecompressionBombError) as exc:
+        raise ValueError(str(exc)) from exc
+
+
+class AvatarProcessor:
+    """Пул процессов для обработки аватаров.
+
+    Пул создаётся при первой загрузке, чтобы процессы не поднимались
+    в воркерах, которые аватары не обрабатывают. Процессы запускаются
+    через spawn: fork из процесса с event loop и потоками копирует
+    захваченные ими блокировки и может зависнуть.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+
+    async def render(self, path: str) -> tuple[str, dict[int, bytes]]:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            render_avatar,
+            path,
+            settings.AVATAR_SIZES,
+            settings.AVATAR_MAX_PIXELS,
+        )
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+avatar_processor = AvatarProcessor(max_workers=settings.AVATAR_PROCESS_WORKERS)
+
+
+class AvatarStore:
+    """Контентно-адресуемое хранилище аватаров.
+
+    Версии аватара лежат по ключу avatars/{хэш}/{размер}.webp, где хэш
+    считается по нормализованному изображению, поэтому одинаковые
+    картинки разных пользователей хранятся один раз, а URL никогда не
+    меняет содержимое и может кэшироваться навсегда.
+
+    Дополнительно в Redis запоминается хэш исходных байт файла ->
+    хэш изображения: повторная загрузка того же файла не декодируется
+    и не пишется в хранилище. Потеря этой записи приводит лишь к
+    повторной обработке.
+
+    Исходный файл сохраняется в отдельное хранилище originals, которое
+    не раздаётся наружу: в нём остаются EXIF и геотеги, а в публичные
+    версии метаданные не попадают.
+    """
+
+    RAW_PREFIX = "avatar_raw"
+    RAW_TTL = 30 * 86_400
+
+    def __init__(self, storage: ObjectStorage, originals: ObjectStorage):
+        self.storage = storage
+        self.originals = originals
+
+    @staticmethod
+    def _key(digest: str, size: int | str) -> str:
+        if size == "original":
+            return f"avatars/{digest}/original"
+        return f"avatars/{digest}/{size}.{AVATAR_FORMAT}"
+
+    async def save(self, file: UploadFile) -> str:
+        """Сохраняет аватар и возвращает его неизменяемый URL.
+
+        Загрузка читается один раз: по ходу чтения считается хэш исходных
+        байт и пишется копия во временный файл, с которым дальше работают
+        пул процессов и хранилище originals. Целиком в памяти файл
+        не держится.
+
+        Raises:
+            PayloadTooLargeException: Файл больше AVATAR_MAX_BYTES.
+            InvalidImageException: Файл не является изображением.
+        """
+        path, raw_digest = await self._spool(file)
+        try:
+            return await self._save(path, raw_digest, file.content_type)
+        finally:
+            await asyncio.to_thread(os.unlink, path)
+
+    @staticmethod
+    async def _spool(file: UploadFile) -> tuple[str, str]:
+        """Копирует загрузку во временный файл и хэширует её за один проход.
+
+        Returns:
+            tuple[str, str]: Путь к временному файлу и хэш исходных байт.
+        """
+        raw = hashlib.blake2b(digest_size=16)
+        tmp = await asyncio.to_thread(
+            tempfile.NamedTemporaryFile, prefix="avatar-", delete=False
+        )
+        size = 0
+        try:
+            async for chunk in iter_upload(file):
+                size += len(chunk)
+                if size > settings.AVATAR_MAX_BYTES:
+                    raise PayloadTooLargeException
+                raw.update(chunk)
+                await asyncio.to_thread(tmp.write, chunk)
+            await asyncio.to_thread(tmp.close)
+        except BaseException:
+            tmp.close()
+            await asyncio.to_thread(os.unlink, tmp.name)
+            raise
+        return tmp.name, raw.hexdigest()
+
+    async def _save(self, path: str, raw_digest: str, content_type: str | None) -> str:
+        raw_key = f"{self.RAW_PREFIX}:{raw_digest}"
+        cache = redis_cache_module.redis_cache
+        digest = await cache.get(raw_key) if cache is not None else None
+        if digest is not None and await self.storage.exists(
+            self._key(digest, AVATAR_DEFAULT_SIZE)
+        ):
+            return self.storage.url(self._key(digest, AVATAR_DEFAULT_SIZE))
+
+        try:
+            digest, renditions = await avatar_processor.render(path)
+        except ValueError:
+            raise InvalidImageException
+
+        default_key = self._key(digest, AVATAR_DEFAULT_SIZE)
+        if not await self.storage.exists(default_key):
+            await self.originals.put_stream(
+                self._key(digest, "original"),
+                iter_path(path),
+                content_type=content_type or "application/octet-stream",
+                max_bytes=settings.AVATAR_MAX_BYTES,
+            )
+            # Версия по умолчанию пишется последней: её наличие означает,
+            # что остальные файлы уже записаны.
+            await asyncio.gather(
+                *(
+                    self.storage.put(self._key(digest, s), body, AVATAR_CONTENT_TYPE)
+                    for s, body in renditions.items()
+                    if s != AVATAR_DEFAULT_SIZE
+                )
+            )
+            await self.storage.put(
+                default_key, renditions[AVATAR_DEFAULT_SIZE], AVATAR_CONTENT_TYPE
+            )
+        if cache is not None:
+            await cache.set(raw_key, digest, ex=self.RAW_TTL)
+        return self.storage.url(default_key)
+
+
+avatar_store = AvatarStore(object_storage, originals=private_object_storage)
@@ -1,28 +1,115 @@
 from fastapi import Depends
+from src.config import settings
 from src.core.db.redis_cache import RedisCache, get_cache
+from src.core.exceptions import TooManyAttemptsException
+
+# Новый код не выдаётся, пока адрес заблокирован после исчерпания попыток.
+# Счётчик неудач лежит в отдельном ключе и новым кодом не сбрасывается.
+_SAVE = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'code', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+# Проверка и погашение кода за один атомарный вызов: из нескольких
+# одновременных запросов с верным кодом успешен ровно один.
+# Неудачи считаются по адресу в окне ARGV[3] секунд, сколько бы кодов
+# за это время ни было выдано.
+# Результат: 1 — код верный и удалён, 0 — неверный код или кода нет,
+# -1 — адрес заблокирован.
+_CONSUME = """
+if redis.call('EXISTS', KEYS[2]) == 1 then
+    return -1
+end
+local code = redis.call('HGET', KEYS[1], 'code')
+if not code then
+    return 0
+end
+if code == ARGV[1] then
+    redis.call('DEL', KEYS[1], KEYS[3])
+    return 1
+end
+local failures = redis.call('INCR', KEYS[3])
+if failures == 1 then
+    redis.call('EXPIRE', KEYS[3], ARGV[3])
+end
+if failures >= tonumber(ARGV[2]) then
+    redis.call('DEL', KEYS[1], KEYS[3])
+    redis.call('SET', KEYS[2], 1, 'EX', ARGV[3])
+    return -1
+end
+return 0
+"""
 
 
 class ConfirmCodeService:
     PREFIX = "confirm_code"
+    LOCK_PREFIX = "confirm_code_lock"
+    FAILURES_PREFIX = "confirm_code_failures"
 
     def __init__(self, cache: RedisCache = Depends(get_cache)):
         self.cache = cache
+        self._save = cache.register_script(_SAVE)
+        self._consume = cache.register_script(_CONSUME)
 
     def _key(self, email: str) -> str:
         return f"{self.PREFIX}:{email}"
 
+    def _lock_key(self, email: str) -> str:
+        return f"{self.LOCK_PREFIX}:{email}"
+
+    def _failures_key(self, email: str) -> str:
+        return f"{self.FAILURES_PREFIX}:{email}"
+
     async def save(self, email: str, code: int, ttl: int = 600) -> None:
-        print(f"Saved: {email}: {code}")
-        """Сохранить код в Redis с TTL (по умолчанию 10 минут)"""
-        await self.cache.set(self._key(email), str(code), ex=ttl)
+        """Сохранить код в Redis с TTL (по умолчанию 10 минут).
+
+        Счётчик неудачных попыток при этом не сбрасывается.
+
+        Raises:
+            TooManyAttemptsException: Адрес заблокирован после
+                исчерпания попыток ввода кода.
+        """
+        saved = await self._save(
+            keys=[self._key(email), self._lock_key(email)], args=[str(code), ttl]
+        )
+        if not saved:
+            raise TooManyAttemptsException
+
+    async def consume(self, email: str, submitted_code: str) -> bool:
+        """Проверить код и сразу погасить его при совпадении.
+
+        Каждая неудачная попытка увеличивает счётчик адреса, общий
+        для всех выданных кодов; после CONFIRM_CODE_MAX_ATTEMPTS неудач
+        за CONFIRM_CODE_LOCKOUT_SECONDS код удаляется, а адрес
+        блокируется на то же время.
+
+        Returns:
+            bool: True, если код верный (повторно его использовать нельзя).
 
-    async def verify(self, email: str, submitted_code: str) -> bool:
-        """Проверить код"""
-        stored_code = await self.cache.get(self._key(email))
-        if stored_code is None:
-            return False
-        return stored_code == submitted_code
+        Raises:
+            TooManyAttemptsException: Адрес заблокирован.
+        """
+        result = await self._consume(
+            keys=[
+                self._key(email),
+                self._lock_key(email),
+                self._failures_key(email),
+            ],
+            args=[
+                submitted_code,
+                settings.CONFIRM_CODE_MAX_ATTEMPTS,
+                settings.CONFIRM_CODE_LOCKOUT_SECONDS,
+            ],
+        )
+        if result == -1:
+            raise TooManyAttemptsException
+        return result == 1
 
     async def delete(self, email: str) -> None:
         """Удалить код"""
-        await self.cache.redis.delete(self._key(email))
+        await self.cache.delete(self._key(email))
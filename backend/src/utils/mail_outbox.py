@@ -0,0 +1,41 @@
+import json
+
+from fastapi import Depends
+from src.core.db.redis_cache import RedisCache, get_cache
+
+
+class MailOutbox:
+    """Очередь писем с кодами подтверждения в Redis.
+
+    Запрос кладёт письмо в список и, если отправка ещё не
+    запланирована, планирует её. Задача забирает письма пачками и
+    отправляет их через одно SMTP-соединение.
+    """
+
+    QUEUE_KEY = "mail_outbox:codes"
+    FLUSH_FLAG_KEY = "mail_outbox:flush_scheduled"
+    FLAG_TTL = 30
+
+    def __init__(self, cache: RedisCache = Depends(get_cache)):
+        self.cache = cache
+
+    async def push(self, *messages: dict) -> bool:
+        """Добавить письма в очередь.
+
+        Returns:
+            bool: True, если вызывающему нужно запланировать отправку
+                (флаг был свободен и теперь захвачен им).
+        """
+        async with self.cache.pipeline() as pipe:
+            pipe.rpush(self.QUEUE_KEY, *(json.dumps(m) for m in messages))
+            pipe.set(self.FLUSH_FLAG_KEY, "1", nx=True, ex=self.FLAG_TTL)
+            _, claimed = await pipe.execute()
+        return bool(claimed)
+
+    async def pop_batch(self, size: int) -> list[dict]:
+        """Забрать до size писем и снять флаг запланированной отправки"""
+        async with self.cache.pipeline(transaction=True) as pipe:
+            pipe.lpop(self.QUEUE_KEY, size)
+            pipe.delete(self.FLUSH_FLAG_KEY)
+            raw, _ = await pipe.execute()
+        return [json.loads(item) for item in raw or []]
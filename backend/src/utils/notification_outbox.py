@@ -0,0 +1,76 @@
+import json
+
+from fastapi import Depends
+from src.core.db.redis_cache import RedisCache, get_cache
+
+
+class NotificationOutbox:
+    """Буфер событий уведомлений в Redis для пакетной записи.
+
+    Запрос только кладёт событие в список (один RPUSH) и, если сброс
+    ещё не запланирован, планирует его. Celery-задача забирает события
+    пачками и пишет все уведомления одним многострочным INSERT.
+    """
+
+    QUEUE_KEY = "notif_outbox:queue"
+    FLUSH_FLAG_KEY = "notif_outbox:flush_scheduled"
+    DEDUP_PREFIX = "notif_outbox:dedup"
+
+    def __init__(self, cache: RedisCache = Depends(get_cache)):
+        self.cache = cache
+
+    async def push(self, event: dict) -> bool:
+        """Добавить событие в буфер.
+
+        Returns:
+            bool: True, если вызывающему нужно запланировать сброс
+                (флаг был свободен и теперь захвачен им).
+        """
+        async with self.cache.pipeline() as pipe:
+            pipe.rpush(self.QUEUE_KEY, json.dumps(event, default=str))
+            pipe.set(self.FLUSH_FLAG_KEY, "1", nx=True, ex=60)
+            _, claimed = await pipe.execute()
+        return bool(claimed)
+
+    async def pop_batch(self, size: int) -> list[dict]:
+        """Забрать до size событий и снять флаг запланированного сброса"""
+        async with self.cache.pipeline(transaction=True) as pipe:
+            pipe.lpop(self.QUEUE_KEY, size)
+            pipe.delete(self.FLUSH_FLAG_KEY)
+            raw, _ = await pipe.execute()
+        return [json.loads(item) for item in raw or []]
+
+    async def requeue(self, events: list[dict]) -> None:
+        """Вернуть события в начало буфера, сохранив их порядок.
+
+        Используется, когда пачку не удалось записать в БД.
+        """
+        if not events:
+            return
+        async with self.cache.pipeline() as pipe:
+            pipe.lpush(
+                self.QUEUE_KEY, *(json.dumps(e, default=str) for e in reversed(events))
+            )
+            await pipe.execute()
+
+    async def claim_duplicates(self, keys: list[str], window: int) -> list[bool]:
+        """Отметить ключи событий на window секунд.
+
+        Returns:
+            list[bool]: Для каждого ключа True, если он новый (событие
+                нужно записать), и False, если такое же событие уже было
+                в пределах окна.
+        """
+        async with self.cache.pipeline() as pipe:
+            for key in keys:
+                pipe.set(f"{self.DEDUP_PREFIX}:{key}", "1", nx=True, ex=window)
+            return [bool(r) for r in await pipe.execute()]
+
+    async def release_duplicates(self, keys: list[str]) -> None:
+        """Снять отметки ключей, захваченных claim_duplicates.
+
+        Нужна, если записать события не удалось: иначе при повторной
+        попытке они были бы отброшены как дубликаты.
+        """
+        if keys:
+            await self.cache.delete(*(f"{self.DEDUP_PREFIX}:{key}" for key in keys))
@@ -0,0 +1,24 @@
+from src.models import Notification
+from src.schemas.notifications import Notification as NotificationSchema
+
+
+def notification_channel(user_id: int) -> str:
+    """Канал Redis pub/sub с уведомлениями пользователя."""
+    return f"notifications:{user_id}"
+
+
+def to_notification_schema(notification: Notification) -> NotificationSchema:
+    """Преобразует модель уведомления в схему ответа API."""
+    return NotificationSchema(
+        id=notification.id,
+        user_id=notification.user_id,
+        type=notification.type.value,
+        title=notification.title,
+        text=notification.text,
+        link_text=notification.link_text,
+        link_url=notification.link_url,
+        project_id=notification.project_id,
+        application_id=notification.application_id,
+        is_read=notification.is_read,
+        created_at=notification.created_at,
+    )
@@ -0,0 +1,68 @@
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from src.core.exceptions import InvalidCursorException
+
+CursorValue = datetime | UUID | int | float | str
+
+
+def _dump(value: CursorValue) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _load(value: Any, type_: type) -> Any:
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    return type_(value)
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """Кодирует ключ последней записи страницы в непрозрачный курсор.
+
+    Курсор — это base64url от JSON-массива значений ключа сортировки,
+    по которому следующая страница продолжает выборку через
+    сравнение кортежей вместо OFFSET.
+
+    Args:
+        *values: Значения ключа сортировки последней записи.
+
+    Returns:
+        str: Курсор для передачи клиенту.
+    """
+    raw = json.dumps([_dump(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type | Callable[[Any], Any]) -> tuple:
+    """Декодирует курсор, полученный от клиента.
+
+    Args:
+        cursor (str): Курсор из параметров запроса.
+        *types: Ожидаемые типы значений ключа (datetime, UUID, int, ...).
+
+    Returns:
+        tuple: Значения ключа сортировки в порядке types.
+
+    Raises:
+        InvalidCursorException: Если курсор повреждён или не соответствует
+            ожидаемой структуре.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise InvalidCursorException
+        return tuple(_load(v, t) for v, t in zip(values, types))
+    except InvalidCursorException:
+        raise
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCursorException
@@ -0,0 +1,65 @@
+from fastapi import Depends
+from src.config import settings
+from src.core.db.redis_cache import RedisCache, get_cache
+
+
+class ProfileSnapshotService:
+    """Готовые JSON-снимки профилей пользователей в Redis.
+
+    У каждого профиля есть номер версии, который увеличивается при
+    каждом изменении профиля. Снимок хранится как "версия\\nJSON" и
+    действителен, только пока его версия совпадает с текущей, поэтому
+    чтение — один MGET без Pydantic-валидации, а гонка чтения с
+    записью в худшем случае даёт лишний промах.
+
+    Публичный вид профиля (без контактов) хранится отдельным снимком
+    с той же версией.
+    """
+
+    PREFIX = "profile"
+    PUBLIC_PREFIX = "profile_public"
+    VERSION_PREFIX = "profile_ver"
+
+    def __init__(self, cache: RedisCache = Depends(get_cache)):
+        self.cache = cache
+
+    def _key(self, user_id: int, public: bool = False) -> str:
+        return f"{self.PUBLIC_PREFIX if public else self.PREFIX}:{user_id}"
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self.VERSION_PREFIX}:{user_id}"
+
+    async def get(self, user_id: int, public: bool = False) -> tuple[int, str | None]:
+        """Вернуть текущую версию профиля и снимок, если он актуален"""
+        version, snapshot = await self.cache.mget(
+            [self._version_key(user_id), self._key(user_id, public)]
+        )
+        version = int(version or 0)
+        if snapshot is not None:
+            snapshot_version, _, body = snapshot.partition("\n")
+            if int(snapshot_version) == version:
+                return version, body
+        return version, None
+
+    async def put(
+        self, user_id: int, version: int, body: str, public: bool = False
+    ) -> None:
+        """Сохранить снимок профиля, собранный для версии version"""
+        await self.cache.set(
+            self._key(user_id, public),
+            f"{version}\n{body}",
+            ex=settings.PROFILE_SNAPSHOT_TTL,
+        )
+
+    async def bump(self, user_id: int) -> int:
+        """Увеличить версию профиля после изменения и удалить снимки.
+
+        Returns:
+            int: Новая версия профиля.
+        """
+        async with self.cache.pipeline() as pipe:
+            pipe.incr(self._version_key(user_id))
+            pipe.expire(self._version_key(user_id), settings.PROFILE_VERSION_TTL)
+            pipe.delete(self._key(user_id), self._key(user_id, public=True))
+            version, _, _ = await pipe.execute()
+        return version
@@ -0,0 +1,8 @@
+def normalize_tag(tag: str) -> str:
+    """Приводит тег к каноничному виду словаря тегов."""
+    return " ".join(tag.split()).casefold()
+
+
+def normalize_tags(tags: list[str]) -> list[str]:
+    """Нормализует и дедуплицирует теги с сохранением порядка."""
+    return list(dict.fromkeys(t for t in map(normalize_tag, tags) if t))
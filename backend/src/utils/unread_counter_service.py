@@ -0,0 +1,102 @@
+from fastapi import Depends
+from src.core.db.redis_cache import RedisCache, get_cache
+
+# KEYS[1] — значение счётчика, KEYS[2] — версия. Каждое изменение
+# безусловно увеличивает версию: так пересчёт, идущий параллельно,
+# узнаёт, что его COUNT устарел. Само значение меняется, только если
+# оно уже посчитано — иначе его заново посчитает следующее чтение.
+_APPLY_DELTA = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+local value = redis.call('GET', KEYS[1])
+if not value then
+    return nil
+end
+local result = tonumber(value) + tonumber(ARGV[1])
+if result < 0 then
+    result = 0
+end
+redis.call('SET', KEYS[1], result, 'KEEPTTL')
+return result
+"""
+
+# Записывает пересчитанное значение, только если с момента чтения версии
+# не было ни одного изменения. ARGV[2] — версия до COUNT ('' если её не было).
+_STORE_IF_VERSION = """
+local version = redis.call('GET', KEYS[2]) or ''
+if version ~= ARGV[2] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+return 1
+"""
+
+# Сбрасывает значение и увеличивает версию: после "прочитать все"
+# следующее чтение пересчитает счётчик по частичному индексу.
+_INVALIDATE = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[1])
+return redis.call('DEL', KEYS[1])
+"""
+
+
+class UnreadCounterService:
+    """Счётчик непрочитанных уведомлений пользователя в Redis.
+
+    Увеличивается при создании уведомления, уменьшается при прочтении и
+    сбрасывается при "прочитать все", поэтому /notifications/unread-count
+    не выполняет COUNT(*) в Postgres. Пропавшее значение пересчитывается
+    из primary и записывается, только если за время COUNT версия счётчика
+    не изменилась; иначе число отдаётся без кэширования. Значение живёт
+    TTL секунд с момента пересчёта — это ограничивает время жизни
+    расхождения, если уведомление закоммичено до чтения версии, а его
+    инкремент пришёл уже после записи пересчёта.
+    """
+
+    PREFIX = "notif_unread"
+    TTL = 3600
+
+    def __init__(self, cache: RedisCache = Depends(get_cache)):
+        self.cache = cache
+        self._apply_delta = cache.register_script(_APPLY_DELTA)
+        self._store_if_version = cache.register_script(_STORE_IF_VERSION)
+        self._invalidate = cache.register_script(_INVALIDATE)
+
+    def _keys(self, user_id: int) -> list[str]:
+        key = f"{self.PREFIX}:{user_id}"
+        return [key, f"{key}:v"]
+
+    async def get(self, user_id: int) -> tuple[int | None, str]:
+        """Вернуть значение счётчика (None, если не посчитан) и его версию"""
+        value, version = await self.cache.mget(self._keys(user_id))
+        return (int(value) if value is not None else None), version or ""
+
+    async def store(self, user_id: int, value: int, version: str) -> bool:
+        """Записать пересчитанное значение, если версия не изменилась"""
+        return bool(
+            await self._store_if_version(
+                keys=self._keys(user_id), args=[value, version, self.TTL]
+            )
+        )
+
+    async def incr(self, user_id: int, amount: int = 1) -> None:
+        """Учесть новые уведомления"""
+        await self._apply_delta(keys=self._keys(user_id), args=[amount, self.TTL])
+
+    def queue_incr_many(self, pipe, counts: dict[int, int]) -> None:
+        """Добавить в pipeline увеличение счётчиков нескольких пользователей"""
+        # Pipeline сам выполнит SCRIPT LOAD перед EVALSHA, если скрипта
+        # ещё нет в Redis.
+        pipe.scripts.add(self._apply_delta)
+        for user_id, amount in counts.items():
+            pipe.evalsha(
+                self._apply_delta.sha, 2, *self._keys(user_id), amount, self.TTL
+            )
+
+    async def decr(self, user_id: int, amount: int = 1) -> None:
+        """Учесть прочитанные уведомления, не опуская счётчик ниже нуля"""
+        await self._apply_delta(keys=self._keys(user_id), args=[-amount, self.TTL])
+
+    async def reset(self, user_id: int) -> None:
+        """Сбросить счётчик после отметки всех уведомлений прочитанными"""
+        await self._invalidate(keys=self._keys(user_id), args=[self.TTL])
@@ -0,0 +1,34 @@
+import os
+
+import fakeredis
+import pytest
+
+# Settings читаются при импорте src: тестам нужны только значения-заглушки.
+for name, value in {
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_DB": "test",
+    "POSTGRES_PORT": "5432",
+    "POSTGRES_USER": "test",
+    "POSTGRES_PASSWORD": "test",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "test",
+    "ACCESS_SECRET_KEY": "test-access",
+    "REFRESH_SECRET_KEY": "test-refresh",
+    "ALGORITHM": "HS256",
+}.items():
+    os.environ.setdefault(name, value)
+
+from src.core.db.redis_cache import RedisCache  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def cache():
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    yield RedisCache(client)
+    await client.aclose()
@@ -0,0 +1,96 @@
+import io
+import tempfile
+
+import pytest
+from fastapi import UploadFile
+from PIL import Image
+from src.core.db import redis_cache as redis_cache_module
+from src.core.exceptions import PayloadTooLargeException
+from src.core.storage import LocalObjectStorage
+from src.utils import avatars
+from src.utils.avatars import AVATAR_DEFAULT_SIZE, AvatarProcessor, AvatarStore
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture(scope="module")
+def processor():
+    processor = AvatarProcessor(max_workers=1)
+    yield processor
+    processor.shutdown()
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, processor):
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(spool))
+    monkeypatch.setattr(avatars, "avatar_processor", processor)
+    monkeypatch.setattr(redis_cache_module, "redis_cache", None)
+    return AvatarStore(
+        LocalObjectStorage(tmp_path / "media", "http://media"),
+        originals=LocalObjectStorage(tmp_path / "private", ""),
+    )
+
+
+def image_bytes(format: str) -> bytes:
+    image = Image.new("RGB", (300, 200))
+    for x in range(300):
+        image.putpixel((x, x % 200), (x % 256, 80, 160))
+    out = io.BytesIO()
+    image.save(out, format=format)
+    return out.getvalue()
+
+
+def upload(data: bytes, filename: str) -> UploadFile:
+    return UploadFile(io.BytesIO(data), filename=filename)
+
+
+def stored_files(root) -> list[str]:
+    return sorted(str(p.relative_to(root)) for p in root.rglob("*") if p.is_file())
+
+
+async def test_identical_uploads_share_digest_and_key(store, tmp_path):
+    data = image_bytes("PNG")
+
+    first = await store.save(upload(data, "me.png"))
+    second = await store.save(upload(data, "copy.png"))
+
+    assert first == second
+    digest = first.split("/")[-2]
+    assert first == f"http://media/avatars/{digest}/{AVATAR_DEFAULT_SIZE}.webp"
+    assert stored_files(tmp_path / "media") == [
+        f"avatars/{digest}/{size}.webp" for size in (256, 512, 64)
+    ]
+    assert stored_files(tmp_path / "private") == [f"avatars/{digest}/original"]
+    # Временные копии загрузок удаляются.
+    assert stored_files(tmp_path / "spool") == []
+
+
+async def test_same_pixels_in_another_container_share_key(store):
+    png = await store.save(upload(image_bytes("PNG"), "a.png"))
+    bmp = await store.save(upload(image_bytes("BMP"), "a.bmp"))
+
+    assert png == bmp
+
+
+async def test_cached_raw_digest_skips_rendering(store, cache, monkeypatch):
+    monkeypatch.setattr(redis_cache_module, "redis_cache", cache)
+    data = image_bytes("PNG")
+    first = await store.save(upload(data, "me.png"))
+
+    async def render(path):
+        raise AssertionError("known upload must not be decoded again")
+
+    monkeypatch.setattr(avatars.avatar_processor, "render", render)
+
+    assert await store.save(upload(data, "me.png")) == first
+
+
+async def test_oversized_upload_leaves_no_spool_file(store, tmp_path, monkeypatch):
+    monkeypatch.setattr(avatars.settings, "AVATAR_MAX_BYTES", 1024)
+
+    with pytest.raises(PayloadTooLargeException):
+        await store.save(upload(image_bytes("BMP"), "big.bmp"))
+
+    assert stored_files(tmp_path / "spool") == []
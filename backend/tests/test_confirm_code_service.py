@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+from src.config import settings
+from src.core.exceptions import TooManyAttemptsException
+from src.utils.confirm_code_service import ConfirmCodeService
+
+pytestmark = pytest.mark.anyio
+
+EMAIL = "user@example.com"
+
+
+async def test_concurrent_consume_succeeds_once(cache):
+    service = ConfirmCodeService(cache)
+    await service.save(EMAIL, 123456)
+
+    results = await asyncio.gather(
+        *(service.consume(EMAIL, "123456") for _ in range(20))
+    )
+
+    assert results.count(True) == 1
+
+
+async def test_failures_accumulate_across_new_codes(cache):
+    service = ConfirmCodeService(cache)
+    max_attempts = settings.CONFIRM_CODE_MAX_ATTEMPTS
+
+    for _ in range(max_attempts - 1):
+        # Запрос нового кода перед каждой попыткой не обнуляет счётчик.
+        await service.save(EMAIL, 123456)
+        assert await service.consume(EMAIL, "000000") is False
+
+    await service.save(EMAIL, 123456)
+    with pytest.raises(TooManyAttemptsException):
+        await service.consume(EMAIL, "000000")
+    with pytest.raises(TooManyAttemptsException):
+        await service.save(EMAIL, 654321)
+
+
+async def test_success_resets_failures(cache):
+    service = ConfirmCodeService(cache)
+    await service.save(EMAIL, 123456)
+    assert await service.consume(EMAIL, "000000") is False
+    assert await service.consume(EMAIL, "123456") is True
+
+    assert await cache.get(service._failures_key(EMAIL)) is None
@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from src.config import settings
+from src.tasks import dispatch
+
+pytestmark = pytest.mark.anyio
+
+PUBLISH_SECONDS = 0.3
+
+
+class SlowTask:
+    """Задача Celery, чей apply_async ждёт медленный брокер."""
+
+    name = "tests.slow"
+
+    def __init__(self):
+        self.published = []
+
+    def apply_async(self, args=(), kwargs=None, **options):
+        time.sleep(PUBLISH_SECONDS)
+        self.published.append(threading.current_thread().name)
+
+
+async def ticker(ticks: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        ticks.append(time.perf_counter())
+        await asyncio.sleep(0.01)
+
+
+async def drain() -> None:
+    await asyncio.gather(*dispatch._pending)
+
+
+async def test_enqueue_returns_while_publish_is_in_flight():
+    task = SlowTask()
+    ticks, stop = [], asyncio.Event()
+    tick_task = asyncio.create_task(ticker(ticks, stop))
+
+    start = time.perf_counter()
+    await dispatch.enqueue(task, countdown=1)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < PUBLISH_SECONDS / 10
+    assert task.published == []
+
+    await drain()
+    stop.set()
+    await tick_task
+
+    assert task.published[0].startswith("celery-dispatch")
+    # Пока брокер отвечал, event loop продолжал обслуживать другие корутины.
+    assert len(ticks) >= PUBLISH_SECONDS / 0.01 / 2
+
+
+async def test_saturated_dispatcher_waits_without_blocking_loop(monkeypatch):
+    monkeypatch.setattr(settings, "CELERY_DISPATCH_MAX_PENDING", 1)
+    task = SlowTask()
+    ticks, stop = [], asyncio.Event()
+    tick_task = asyncio.create_task(ticker(ticks, stop))
+
+    await dispatch.enqueue(task)
+    start = time.perf_counter()
+    await dispatch.enqueue(task)
+    elapsed = time.perf_counter() - start
+    ticks_while_waiting = len(ticks)
+
+    # Второй вызов ждёт собственную публикацию, но loop не блокируется.
+    assert elapsed >= PUBLISH_SECONDS * 0.9
+    assert len(task.published) >= 1
+    assert ticks_while_waiting >= PUBLISH_SECONDS / 0.01 / 2
+
+    await drain()
+    stop.set()
+    await tick_task
+    assert len(task.published) == 2
+
+
+async def test_publish_error_is_logged_not_raised(monkeypatch):
+    errors = []
+    monkeypatch.setattr(
+        dispatch.logger, "error", lambda event, **kw: errors.append((event, kw))
+    )
+
+    class BrokenTask:
+        name = "tests.broken"
+
+        def apply_async(self, **options):
+            raise ConnectionError("broker down")
+
+    await dispatch.enqueue(BrokenTask())
+    await asyncio.gather(*dispatch._pending, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert errors == [
+        ("celery publish failed", {"task": "tests.broken", "error": "broker down"})
+    ]
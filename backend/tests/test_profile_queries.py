@@ -0,0 +1,148 @@
+import pytest
+from sqlalchemy import JSON, Text, event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+from src.crud import Store
+from src.crud.impl.user import UserDAO
+from src.models import (
+    Base,
+    Education,
+    EducationDegree,
+    Project,
+    ProjectStatus,
+    SocialPlatform,
+    Tag,
+    User,
+    UserSkill,
+    UserSocial,
+    UserTag,
+)
+from src.services.user import UserService
+
+pytestmark = pytest.mark.anyio
+
+# Таблицы профиля не используют типы, специфичные для PostgreSQL,
+# поэтому агрегат можно проверить на SQLite в памяти.
+PROFILE_TABLES = [
+    Base.metadata.tables[name]
+    for name in (
+        "users",
+        "tags",
+        "user_skills",
+        "user_tags",
+        "user_socials",
+        "educations",
+    )
+]
+
+
+@pytest.fixture
+def sqlite_projects(monkeypatch):
+    """Таблица projects в виде, который понимает SQLite.
+
+    Массив тегов хранится как JSON, а tsvector — обычный nullable-текст
+    без вычисляемого выражения: для запроса профиля поиск не нужен.
+    """
+    tags, search_vector = Project.__table__.c.tags, Project.__table__.c.search_vector
+    monkeypatch.setattr(tags, "type", JSON())
+    monkeypatch.setattr(tags, "server_default", None)
+    monkeypatch.setattr(search_vector, "type", Text())
+    monkeypatch.setattr(search_vector, "computed", None)
+    monkeypatch.setattr(search_vector, "server_default", None)
+    monkeypatch.setattr(search_vector, "nullable", True)
+    return Project.__table__
+
+
+@pytest.fixture
+async def session(sqlite_projects):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            Base.metadata.create_all, tables=PROFILE_TABLES + [sqlite_projects]
+        )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        yield session
+    await engine.dispose()
+
+
+async def add_user(session: AsyncSession, email: str, items: int) -> int:
+    user = User(email=email)
+    session.add(user)
+    await session.flush()
+    tags = [Tag(name=f"{email}-tag-{i}") for i in range(items)]
+    session.add_all(tags)
+    await session.flush()
+    session.add_all(
+        [UserSkill(user_id=user.id, name=f"skill-{i}") for i in range(items)]
+        + [UserTag(user_id=user.id, tag_id=tag.id) for tag in tags]
+        + [
+            UserSocial(
+                user_id=user.id, platform=SocialPlatform.GITHUB, username=f"u{i}"
+            )
+            for i in range(items)
+        ]
+        + [
+            Education(
+                user_id=user.id,
+                university="МГУ",
+                specialty="ВМК",
+                degree=EducationDegree.BACHELOR,
+                graduation_year=2020 + i,
+            )
+            for i in range(items)
+        ]
+    )
+    await session.commit()
+    return user.id
+
+
+def count_statements(session: AsyncSession) -> list[str]:
+    statements = []
+
+    @event.listens_for(session.bind.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    return statements
+
+
+@pytest.mark.parametrize("items", [1, 25])
+async def test_profile_aggregate_query_count(session, items):
+    user_id = await add_user(session, "user@example.com", items)
+    statements = count_statements(session)
+
+    user = await UserDAO(session).get_profile(user_id)
+
+    # Пользователь и по одному selectin-запросу на навыки, теги,
+    # соцсети и образование, сколько бы записей ни было в разделах.
+    assert len(statements) == 5
+    assert len(user.skills) == len(user.tags) == items
+    assert len(user.socials) == len(user.educations) == items
+
+
+@pytest.mark.parametrize("projects", [0, 1, 30])
+async def test_full_profile_query_count(session, projects):
+    user_id = await add_user(session, "owner@example.com", 3)
+    session.add_all(
+        [
+            Project(
+                owner_id=user_id,
+                title=f"Проект {i}",
+                tags=["python"],
+                status=ProjectStatus.OPEN,
+            )
+            for i in range(projects)
+        ]
+    )
+    await session.commit()
+    statements = count_statements(session)
+
+    profile = await UserService(
+        store=Store(session=session), snapshots=None
+    ).get_profile(user_id)
+
+    # Пять запросов агрегата пользователя и один запрос проектов,
+    # сколько бы проектов у него ни было.
+    assert len(statements) == 6
+    assert len(profile.projects) == projects
+    assert all(p.tags == ["python"] for p in profile.projects)
@@ -0,0 +1,108 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import fakeredis
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.core.db.redis_cache import RedisCache
+from src.models import Base, Notification, NotificationType, User
+from src.schemas.project import Project, ProjectStatus
+from src.services.notification import NotificationService, notification_service
+from src.services.project import ProjectService
+from src.tasks import notifications as flush_module
+from src.utils.notification_outbox import NotificationOutbox
+from src.utils.unread_counter_service import UnreadCounterService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'flush.db'}")
+    tables = [Base.metadata.tables[name] for name in ("users", "notifications")]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    async with AsyncSession(engine) as session:
+        session.add(User(id=7, email="owner@example.com"))
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+async def redis_server():
+    server = fakeredis.FakeServer()
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    yield server, RedisCache(client)
+    await client.aclose()
+
+
+def project_service(cache: RedisCache) -> ProjectService:
+    async def update_owned(*args, **kwargs):
+        pass
+
+    store = SimpleNamespace(project=SimpleNamespace(update_owned=update_owned))
+    notifications = NotificationService(
+        store=None,
+        counter=UnreadCounterService(cache),
+        hub=None,
+        outbox=NotificationOutbox(cache),
+    )
+    return ProjectService(store=store, snapshots=None, notifications=notifications)
+
+
+async def test_status_change_enqueues_and_flush_persists(
+    engine, redis_server, monkeypatch
+):
+    server, cache = redis_server
+    project_id = uuid4()
+    now = datetime.now(timezone.utc)
+    owner = SimpleNamespace(id=7, name="Владелец")
+    service = project_service(cache)
+
+    async def after_write(pid, user):
+        return Project(
+            id=pid,
+            owner_id=user.id,
+            title="TeamUp",
+            tags=[],
+            status=ProjectStatus.closed,
+            created_at=now,
+            updated_at=now,
+            team=[ProjectService.owner_member(user)],
+            positions=[],
+        )
+
+    enqueued = []
+
+    async def enqueue(task, **options):
+        enqueued.append((task.name, options))
+
+    monkeypatch.setattr(service, "_after_write", after_write)
+    monkeypatch.setattr(notification_service, "enqueue", enqueue)
+
+    await service.set_status(project_id, owner, ProjectStatus.closed)
+
+    # Запрос только кладёт событие в буфер и планирует один сброс.
+    assert enqueued == [
+        ("src.tasks.notifications.flush_notifications_task", {"countdown": 1})
+    ]
+    assert await cache.redis.llen(NotificationOutbox.QUEUE_KEY) == 1
+
+    monkeypatch.setattr(
+        flush_module.redis,
+        "Redis",
+        lambda **kwargs: fakeredis.FakeAsyncRedis(server=server, decode_responses=True),
+    )
+    monkeypatch.setattr(flush_module, "create_async_engine", lambda *a, **kw: engine)
+
+    assert await flush_module.flush_notifications() is False
+
+    async with AsyncSession(engine) as session:
+        rows = (await session.scalars(select(Notification))).all()
+    assert [(n.user_id, n.type, n.title, n.project_id) for n in rows] == [
+        (7, NotificationType.PROJECT_STATUS, "Проект «TeamUp» закрыт", project_id)
+    ]
+    assert await cache.redis.llen(NotificationOutbox.QUEUE_KEY) == 0
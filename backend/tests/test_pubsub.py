@@ -0,0 +1,52 @@
+import anyio
+import fakeredis
+import pytest
+from src.core.pubsub import PubSubHub
+from src.utils.notifications import notification_channel
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def server():
+    server = fakeredis.FakeServer()
+    clients = []
+
+    def connect():
+        client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+        clients.append(client)
+        return client
+
+    yield connect
+    for client in clients:
+        await client.aclose()
+
+
+async def test_notification_reaches_subscribers_on_two_workers(server):
+    channel = notification_channel(1)
+    first, second = PubSubHub(server()), PubSubHub(server())
+    try:
+        async with first.subscribe(channel) as a, second.subscribe(channel) as b:
+            # Публикует третий процесс, например Celery-воркер.
+            await server().publish(channel, '{"title": "Привет"}')
+            with anyio.fail_after(5):
+                assert await a.queue.get() == '{"title": "Привет"}'
+                assert await b.queue.get() == '{"title": "Привет"}'
+    finally:
+        await first.close()
+        await second.close()
+
+
+async def test_one_connection_fans_out_to_local_subscribers(server):
+    channel = notification_channel(1)
+    hub = PubSubHub(server())
+    try:
+        async with hub.subscribe(channel) as a, hub.subscribe(channel) as b:
+            assert hub.connections == 2
+            await hub.publish(channel, "ping")
+            with anyio.fail_after(5):
+                assert await a.queue.get() == "ping"
+                assert await b.queue.get() == "ping"
+        assert hub.connections == 0
+    finally:
+        await hub.close()
@@ -0,0 +1,124 @@
+import asyncio
+import time
+
+import fakeredis
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from src.core import rate_limit
+from src.core.db import redis_cache as redis_cache_module
+from src.core.db.redis_cache import RedisCache
+from src.core.exceptions import RateLimitException
+from src.core.rate_limit import RateLimiter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def use_cache(monkeypatch):
+    def use(cache):
+        monkeypatch.setattr(redis_cache_module, "redis_cache", cache)
+
+    return use
+
+
+@pytest.fixture
+async def down_cache():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    client = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    yield RedisCache(client)
+    await client.aclose()
+
+
+async def test_allow_then_deny_with_retry_after(cache, use_cache):
+    use_cache(cache)
+    limiter = RateLimiter("test", limit=2, period=60)
+
+    await limiter.hit("1.2.3.4")
+    await limiter.hit("1.2.3.4")
+    with pytest.raises(RateLimitException) as exc:
+        await limiter.hit("1.2.3.4")
+
+    # Один токен пополняется за period / limit = 30 секунд.
+    assert exc.value.status_code == 429
+    assert 29 <= int(exc.value.headers["Retry-After"]) <= 30
+    # Другие клиенты корзину не делят.
+    await limiter.hit("5.6.7.8")
+
+
+async def test_bucket_refills_over_time(cache, use_cache):
+    use_cache(cache)
+    limiter = RateLimiter("test", limit=10, period=1)
+
+    for _ in range(10):
+        await limiter.hit("1.2.3.4")
+    with pytest.raises(RateLimitException):
+        await limiter.hit("1.2.3.4")
+
+    await asyncio.sleep(0.25)
+    await limiter.hit("1.2.3.4")
+    await limiter.hit("1.2.3.4")
+
+
+async def test_falls_back_to_local_bucket_when_redis_is_down(down_cache, use_cache):
+    use_cache(down_cache)
+    limiter = RateLimiter("test", limit=2, period=60)
+
+    await limiter.hit("1.2.3.4")
+    await limiter.hit("1.2.3.4")
+    with pytest.raises(RateLimitException) as exc:
+        await limiter.hit("1.2.3.4")
+
+    assert 29 <= int(exc.value.headers["Retry-After"]) <= 30
+
+
+def test_local_bucket_refills(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter("test", limit=2, period=60)
+
+    assert limiter._hit_local("k") == 0
+    assert limiter._hit_local("k") == 0
+    assert limiter._hit_local("k") == 30_000
+
+    now[0] += 30
+    assert limiter._hit_local("k") == 0
+    assert limiter._hit_local("k") > 0
+
+
+def test_dependency_answers_429_with_retry_after(use_cache):
+    use_cache(None)
+    limiter = RateLimiter("test", limit=1, period=60)
+    app = FastAPI()
+
+    @app.post("/write", dependencies=[Depends(limiter)])
+    async def write():
+        return {}
+
+    client = TestClient(app)
+    assert client.post("/write").status_code == 200
+    denied = client.post("/write")
+    assert denied.status_code == 429
+    assert denied.headers["Retry-After"] == "60"
+
+
+@pytest.mark.parametrize("backend", ["redis", "local"])
+async def test_per_request_overhead(cache, use_cache, backend):
+    """Микробенчмарк: стоимость проверки лимита на один запрос.
+
+    Redis здесь — fakeredis в процессе, поэтому число показывает
+    накладные расходы клиента и скрипта без сетевого round-trip.
+    """
+    use_cache(cache if backend == "redis" else None)
+    limiter = RateLimiter("bench", limit=10**9, period=60)
+    runs = 2_000
+    await limiter.hit("warmup")
+
+    start = time.perf_counter()
+    for i in range(runs):
+        await limiter.hit(f"10.0.{i % 256}.{i // 256}")
+    per_hit_us = (time.perf_counter() - start) / runs * 1e6
+
+    print(f"rate limiter ({backend}): {per_hit_us:.1f} us per request")
+    assert per_hit_us < (5_000 if backend == "redis" else 100)
@@ -0,0 +1,63 @@
+import pytest
+from pydantic import BaseModel
+from src.core.db import redis_cache as redis_cache_module
+from src.core.response_cache import ResponseCache
+from starlette.requests import Request
+
+pytestmark = pytest.mark.anyio
+
+
+class Page(BaseModel):
+    source: str
+
+
+def request(path: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": b"",
+            "headers": [],
+        }
+    )
+
+
+@pytest.fixture
+def response_cache(cache, monkeypatch):
+    monkeypatch.setattr(redis_cache_module, "redis_cache", cache)
+    return ResponseCache(local_maxsize=0, local_ttl=0, stale_ttl=60, fresh_ttl=5)
+
+
+async def serve(response_cache: ResponseCache, sources: list[bool]):
+    async def loader(fresh: bool) -> Page:
+        sources.append(fresh)
+        return Page(source="primary" if fresh else "replica")
+
+    response = await response_cache.serve(
+        request("/projects"), tags=["projects:feed"], ttl=30, loader=loader
+    )
+    return response.body
+
+
+async def test_miss_reads_replica_until_invalidated(response_cache):
+    sources = []
+
+    assert await serve(response_cache, sources) == b'{"source":"replica"}'
+
+    await response_cache.invalidate("projects:feed")
+    assert await serve(response_cache, sources) == b'{"source":"primary"}'
+    # Перезагруженный ответ отдаётся из кэша, без новых чтений.
+    assert await serve(response_cache, sources) == b'{"source":"primary"}'
+    assert sources == [False, True]
+
+
+async def test_fresh_window_expires(response_cache, cache):
+    sources = []
+    await response_cache.invalidate("projects:feed")
+    # Окно read-your-writes истекло: реплика уже догнала primary.
+    await cache.delete(response_cache._fresh_key("projects:feed"))
+
+    await serve(response_cache, sources)
+
+    assert sources == [False]
@@ -0,0 +1,91 @@
+import smtplib
+
+import pytest
+from src.core.mail import MailDeferredError, MemorySender, SmtpSender
+from src.tasks import verify_code
+
+
+class FlakySmtp:
+    """Подменяет smtplib.SMTP: отказы задаются по адресу получателя."""
+
+    def __init__(self, refused: dict[str, int]):
+        self.refused = refused
+        self.sent = []
+
+    def send_message(self, message):
+        code = self.refused.get(message["To"])
+        if code is not None:
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (code, b"no")})
+        self.sent.append(message["To"])
+
+
+@pytest.fixture
+def outbox(monkeypatch):
+    state = {"queue": [], "requeued": []}
+
+    async def pop_batch():
+        batch, state["queue"] = state["queue"], []
+        return batch
+
+    async def requeue(messages):
+        state["requeued"].extend(messages)
+
+    monkeypatch.setattr(verify_code, "_pop_batch", pop_batch)
+    monkeypatch.setattr(verify_code, "_requeue", requeue)
+    return state
+
+
+def smtp_sender(monkeypatch, smtp: FlakySmtp) -> SmtpSender:
+    sender = SmtpSender("localhost", 25, "", "", use_tls=False, timeout=1)
+    monkeypatch.setattr(sender, "open", lambda: setattr(sender, "_smtp", smtp))
+    monkeypatch.setattr(sender, "close", lambda: None)
+    monkeypatch.setattr(verify_code, "get_mail_sender", lambda: sender)
+    return sender
+
+
+def messages(*emails):
+    return [{"email": email, "code": "123456"} for email in emails]
+
+
+def test_rejected_recipient_is_dropped(monkeypatch, outbox):
+    smtp = FlakySmtp(refused={"bad@example.com": 550})
+    smtp_sender(monkeypatch, smtp)
+    outbox["queue"] = messages("a@example.com", "bad@example.com", "b@example.com")
+
+    verify_code.send_codes()
+
+    assert smtp.sent == ["a@example.com", "b@example.com"]
+    assert outbox["requeued"] == []
+
+
+def test_deferred_recipient_is_requeued_alone(monkeypatch, outbox):
+    smtp = FlakySmtp(refused={"busy@example.com": 450})
+    smtp_sender(monkeypatch, smtp)
+    outbox["queue"] = messages("a@example.com", "busy@example.com", "b@example.com")
+
+    with pytest.raises(MailDeferredError):
+        verify_code.send_codes()
+
+    assert smtp.sent == ["a@example.com", "b@example.com"]
+    assert outbox["requeued"] == messages("busy@example.com")
+
+
+def test_server_failure_requeues_rest_of_batch(monkeypatch, outbox):
+    sender = MemorySender()
+    calls = 0
+
+    def send(message):
+        nonlocal calls
+        calls += 1
+        if calls == 2:
+            raise smtplib.SMTPConnectError(421, b"down")
+        sender.outbox.append(message)
+
+    monkeypatch.setattr(sender, "send", send)
+    monkeypatch.setattr(verify_code, "get_mail_sender", lambda: sender)
+    outbox["queue"] = messages("a@example.com", "b@example.com", "c@example.com")
+
+    with pytest.raises(smtplib.SMTPConnectError):
+        verify_code.send_codes()
+
+    assert outbox["requeued"] == messages("b@example.com", "c@example.com")
@@ -0,0 +1,105 @@
+import asyncio
+import time
+
+import pytest
+from src.core.db.single_flight import SingleFlight
+
+pytestmark = pytest.mark.anyio
+
+KEY = "resp:/api/v1/projects/1"
+
+
+async def publish_later(cache, value, delay=0.1):
+    await asyncio.sleep(delay)
+    await cache.set_value(KEY, {"value": value, "fresh_until": time.time() + 60})
+
+
+async def test_full_miss_does_not_join_stale_refresh(cache, monkeypatch):
+    """Полный промах, совпавший с обновлением устаревшей записи, ждёт
+    значение, а не получает маркер «блокировка занята»."""
+    flight = SingleFlight(lock_ttl=5, poll_interval=0.01)
+    stale = {"value": "stale", "fresh_until": time.time() - 1}
+    await cache.set_value(KEY, stale)
+    # Запись обновляет другой воркер.
+    await cache.set(f"lock:{KEY}", "other", ex=5)
+
+    # Первый вызов видит устаревшую запись, второй — уже пустой ключ.
+    reads = iter([stale, None])
+    original_get_value = cache.get_value
+
+    async def get_value(key):
+        value = next(reads, None)
+        return value if value is not None else await original_get_value(key)
+
+    monkeypatch.setattr(cache, "get_value", get_value)
+    await cache.delete(KEY)
+
+    async def loader():
+        raise AssertionError("loader must not run while the lock is held")
+
+    refresh, miss, _ = await asyncio.gather(
+        flight.get_or_load(cache, KEY, loader, ttl=60, stale_ttl=60),
+        flight.get_or_load(cache, KEY, loader, ttl=60, stale_ttl=60),
+        publish_later(cache, "fresh"),
+    )
+
+    assert refresh == "stale"
+    assert miss == "fresh"
+
+
+async def test_waiter_loads_when_lock_released_without_value(cache):
+    flight = SingleFlight(lock_ttl=5, poll_interval=0.01)
+    await cache.set(f"lock:{KEY}", "other", ex=5)
+
+    async def release_lock():
+        await asyncio.sleep(0.05)
+        await cache.delete(f"lock:{KEY}")
+
+    async def loader():
+        return "loaded"
+
+    value, _ = await asyncio.gather(
+        flight.get_or_load(cache, KEY, loader, ttl=60), release_lock()
+    )
+
+    assert value == "loaded"
+    assert (await cache.get_value(KEY))["value"] == "loaded"
+
+
+async def test_concurrent_misses_load_once(cache):
+    flight = SingleFlight(lock_ttl=5, poll_interval=0.01)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "value"
+
+    values = await asyncio.gather(
+        *(flight.get_or_load(cache, KEY, loader, ttl=60) for _ in range(10))
+    )
+
+    assert values == ["value"] * 10
+    assert calls == 1
+
+
+async def test_release_script_is_registered_once(cache, monkeypatch):
+    flight = SingleFlight(lock_ttl=5, poll_interval=0.01)
+    registered = []
+    original_register = cache.register_script
+
+    def register_script(script):
+        registered.append(script)
+        return original_register(script)
+
+    monkeypatch.setattr(cache, "register_script", register_script)
+
+    async def loader():
+        return "value"
+
+    for i in range(3):
+        assert await flight.get_or_load(cache, f"{KEY}/{i}", loader, ttl=60) == "value"
+        assert not await cache.exists(f"lock:{KEY}/{i}")
+
+    assert len(registered) == 1
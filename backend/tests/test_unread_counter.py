@@ -0,0 +1,80 @@
+import anyio
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.crud import Store
+from src.models import Base, NotificationType, User
+from src.services.notification import NotificationService
+from src.utils.unread_counter_service import UnreadCounterService
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'notifications.db'}",
+        connect_args={"timeout": 10},
+    )
+    tables = [Base.metadata.tables[name] for name in ("users", "notifications")]
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=tables)
+    async with AsyncSession(engine) as session:
+        session.add(User(id=1, email="reader@example.com"))
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+def service(session: AsyncSession, cache) -> NotificationService:
+    return NotificationService(
+        store=Store(session=session),
+        counter=UnreadCounterService(cache),
+        hub=None,
+        outbox=None,
+    )
+
+
+async def notify(engine, cache) -> None:
+    async with AsyncSession(engine) as session:
+        await service(session, cache).notify(1, NotificationType.SYSTEM, "Привет")
+
+
+async def test_notify_during_cold_count_is_not_lost(engine, cache, monkeypatch):
+    counted, notified = anyio.Event(), anyio.Event()
+
+    async with AsyncSession(engine) as session:
+        reader = service(session, cache)
+        count_unread = reader._store.notification.count_unread
+
+        async def count_then_wait(user_id):
+            value = await count_unread(user_id)
+            counted.set()
+            await notified.wait()
+            return value
+
+        monkeypatch.setattr(reader._store.notification, "count_unread", count_then_wait)
+
+        async def writer():
+            await counted.wait()
+            await notify(engine, cache)
+            notified.set()
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(writer)
+            # COUNT увидел 0, но уведомление появилось до записи в Redis.
+            assert await reader.unread_count(1) == 0
+
+    async with AsyncSession(engine) as session:
+        assert await service(session, cache).unread_count(1) == 1
+
+
+async def test_counter_follows_writes_once_warm(engine, cache):
+    async with AsyncSession(engine) as session:
+        reader = service(session, cache)
+        assert await reader.unread_count(1) == 0
+
+        await notify(engine, cache)
+        await notify(engine, cache)
+
+        assert await reader.unread_count(1) == 2
+        assert await UnreadCounterService(cache).get(1) == (2, "2")
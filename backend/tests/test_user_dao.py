@@ -0,0 +1,40 @@
+import anyio
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from src.crud.impl.user import UserDAO
+from src.models import Base, User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    # Файл, а не память: у каждой сессии своё соединение, как у воркеров API.
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'users.db'}",
+        connect_args={"timeout": 10},
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__])
+    yield engine
+    await engine.dispose()
+
+
+async def test_concurrent_get_or_create_returns_one_id(engine):
+    ids = []
+
+    async def login():
+        async with AsyncSession(engine) as session:
+            ids.append(await UserDAO(session).get_or_create("race@example.com"))
+            await session.commit()
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(8):
+            tg.start_soon(login)
+
+    async with AsyncSession(engine) as session:
+        rows = await session.scalar(select(func.count()).select_from(User))
+
+    assert len(set(ids)) == 1
+    assert rows == 1